@@ -12,6 +12,7 @@ Required by:
     build_mask_contBeam_never
     update_equivalent_and_close_info
     add_include_exclude_info
+    build_contBeam_coverage
 """
 
 import copy
@@ -28,6 +29,13 @@ Required by:
     add_include_exclude_info
 """
 
+import func_misc as misc
+"""
+Required by:
+    build_contBeam_membership
+    build_contBeam_coverage
+"""
+
 
 
 
@@ -624,4 +632,53 @@ def build_mask_contBeam_never(contBeam):
     Requires:
         numpy as np    
     """
-    return np.array([i["banned"] for i in contBeam], dtype=bool)
\ No newline at end of file
+    return np.array([i["banned"] for i in contBeam], dtype=bool)
+
+
+
+
+
+def build_contBeam_membership(contBeam, key):
+    """
+    Sürekli hat - aks parçası üyelik matrisini seyrek (COO) biçimde bir kez oluşturur.
+    k. eleman, member_row[k]. sürekli hattın member_span[k]. aks parçasını içerdiğini
+    gösterir.
+
+    Args:
+        contBeam : build_contBeam fonksiyonu ile oluşturulan sürekli kiriş hatları
+        key (str): Üyeliği alınacak eleman türü ("beam" veya "colSpan")
+
+    Returns:
+        tuple: (member_row, member_span) int64 diziler
+
+    Requires:
+        func_misc as misc
+    """
+    indptr, member_span = misc.csr_from_lists([cb[key] for cb in contBeam])
+    return misc.csr_row_ids(indptr), member_span
+
+
+
+
+
+def build_contBeam_coverage(contBeamTopo, member_row, member_span, n_spans):
+    """
+    Sistemde bulunan sürekli hatların kapsadığı aks parçalarını üyelik matrisi ile sürekli
+    hat topolojisinin çarpımı (seyrek matris - vektör çarpımı) olarak bulur. contBeamTopo
+    tek bir aday için 1B veya popülasyon için (P, n_contBeam) boyutlu olabilir.
+
+    Args:
+        contBeamTopo (np.ndarray) : Sürekli hatların topolojisi (1=var)
+        member_row (np.ndarray)   : build_contBeam_membership ile bulunan sürekli hat indeksleri
+        member_span (np.ndarray)  : build_contBeam_membership ile bulunan aks parçası indeksleri
+        n_spans (int)             : Aks parçası sayısı
+
+    Returns:
+        np.ndarray of bool : Sistemde bulunan bir sürekli hattın parçası olan aks parçaları
+
+    Requires:
+        numpy as np
+        func_misc as misc
+    """
+    active = np.asarray(contBeamTopo)[..., member_row] == 1
+    return misc.csr_segment_sum(active, member_span, n_spans) > 0
\ No newline at end of file
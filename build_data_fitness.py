@@ -4,8 +4,38 @@ Required by:
     build_fitness_span_in_area
     build_fitness_node_in_area
     build_fitness_standalone_beams
+    build_fitness_standalone_beams_covered
     build_fitness_crossing_beams
+    build_fitness_crossing_beams_csr
     build_data_fitness
+    build_data_fitness_problem
+    build_data_fitness_batch
+"""
+
+import func_kernels as funcKernels
+"""
+Required by:
+    build_data_fitness_problem
+    build_data_fitness_batch
+"""
+
+import func_misc as misc
+"""
+Required by:
+    build_fitness_crossing_beams_csr
+"""
+
+import build_data_contBeam as buildContBeam
+"""
+Required by:
+    build_data_fitness_problem
+    build_data_fitness_batch
+"""
+
+import func_bits as funcBits
+"""
+Required by:
+    build_data_fitness_problem
 """
 
 
@@ -122,6 +152,30 @@ def build_fitness_standalone_beams(beamTopo, contBeamTopo, contBeam, spanLen):
 
 
 
+def build_fitness_standalone_beams_covered(beamTopo, beam_covered, spanLen):
+    """
+    ONDEMAND : build_fitness_standalone_beams'in sürekli hatların kapsadığı kirişler
+    (buildContBeam.build_contBeam_coverage) önceden bulunmuş hali. Diziler tek bir aday
+    için 1B veya popülasyon için (P, n_spans) boyutlu olabilir.
+
+    Args:
+        beamTopo (np.ndarray)     : Sistemde bulunan kirişların topolojisi
+        beam_covered (np.ndarray) : Sistemde bulunan bir sürekli hattın parçası olan kirişler
+        spanLen (np.ndarray)      : Her bir aks parçasının uzunluğunu içeren dizi
+
+    Returns:
+        Sistemde bulunan ve yine sistemde bulunan bir sürekli hattın parçası olmayan
+        bağımsız kirişlerin toplam uzunluğu
+
+    Requires:
+        numpy as np
+    """
+    return np.sum(np.where((beamTopo == 1) & ~beam_covered, spanLen, 0), axis=-1)
+
+
+
+
+
 def build_fitness_crossing_beams(
     colTopo, colSpanTopo, beamTopo, spans, nodSpan, spanAx, spanLen):
     """
@@ -172,6 +226,46 @@ def build_fitness_crossing_beams(
 
 
 
+def build_fitness_crossing_beams_csr(col_constrained, beamTopo, nod_span, nod_row, nod_pair, pair_nod, spanLen):
+    """
+    ONDEMAND : build_fitness_crossing_beams'in CSR düğüm - aks parçası bağlantısı üzerinde
+    segment toplamlarıyla hesaplanan hali. Düğüm döngüsü yerine tüm düğümler için aktif
+    kiriş sayıları, kiriş bulunan farklı aks sayıları ve aktif kiriş uzunluğu toplamları
+    birkaç vektör işlemiyle bulunur. Diziler tek bir aday için 1B veya popülasyon için
+    (P, n) boyutlu olabilir.
+
+    Args:
+        col_constrained (np.ndarray) : Üzerinde noktasal kolon veya çizgisel kolon ucu bulunan
+                                       düğümler (funcKernels.build_kernel_col_constrained)
+        beamTopo (np.ndarray)        : Sistemde bulunan kirişların topolojisi
+        nod_span (np.ndarray)        : CSR düğüm - aks parçası bağlantısının aks parçası indeksleri
+        nod_row, nod_pair, pair_nod (np.ndarray) : build_problem_nod_ax_incidence
+        spanLen (np.ndarray)         : Her bir aks parçasının uzunluğunu içeren dizi
+
+    Returns:
+        Kolon bulunmayan düğümlere saplanan kirişlerin toplam uzunluğu
+
+    Requires:
+        numpy as np
+        func_misc as misc
+    """
+    n_nodes = col_constrained.shape[-1]
+    active  = beamTopo[..., nod_span] == 1
+
+    n_active = misc.csr_segment_sum(active, nod_row, n_nodes)
+    length   = misc.csr_segment_sum(active * spanLen[nod_span], nod_row, n_nodes)
+
+    # Düğümde kiriş bulunan (düğüm, aks) çiftleri ve düğüm başına farklı aks sayısı
+    pair_active = misc.csr_segment_sum(active, nod_pair, len(pair_nod)) > 0
+    n_axes      = misc.csr_segment_sum(pair_active, pair_nod, n_nodes)
+
+    crossing = ~col_constrained & (n_active >= 2) & (n_axes >= 2)
+    return np.sum(np.where(crossing, length, 0), axis=-1)
+
+
+
+
+
 def build_data_fitness(cand, geoData, contBeam,
         fitness_span_in_area, fitness_node_in_area):
     """
@@ -205,4 +299,109 @@ def build_data_fitness(cand, geoData, contBeam,
     standalone_beams = build_fitness_standalone_beams(beamTopo, contBeamTopo, contBeam, spanLen)
     crossing_beams   = build_fitness_crossing_beams(colTopo, colSpanTopo, beamTopo, spans, nodSpan, spanAx, spanLen)
     
-    return span_in_area, node_in_area, standalone_beams, crossing_beams
\ No newline at end of file
+    return span_in_area, node_in_area, standalone_beams, crossing_beams
+
+
+
+
+
+def build_data_fitness_problem(cand, problem):
+    """
+    Çözüm adayının fitness değerlerini build_data_problem ile oluşturulan problem paketini
+    kullanarak hesaplar. build_data_fitness ile aynı değerleri döndürür. Kolonsuz düğümlere
+    saplanan kirişler CSR düğüm - aks parçası bağlantısı üzerinde segment toplamlarıyla,
+    Numba kuruluysa derlenmiş çekirdekle (func_kernels) hesaplanır. Bağımsız kirişler
+    seyrek sürekli hat - kiriş üyelik matrisi ile bulunur.
+    Büyük planlarda alan ihlali toplamları paketli topoloji üzerinde popcount ile alınır.
+
+    Args:
+        cand (list)    : Çözümün tasarım vektörü (manual_design_vector.md dosyasına bakınız)
+        problem (dict) : build_data_problem ile oluşturulan problem paketi
+
+    Returns:
+        Çözüm adayının fitness değerleri
+
+    Requires:
+        numpy as np
+        func_kernels as funcKernels
+        func_bits as funcBits
+        build_data_contBeam as buildContBeam
+    """
+    colTopo      = cand[0]
+    colSpanTopo  = cand[5]
+    beamTopo     = cand[8]
+    contBeamTopo = cand[11]
+
+    spans   = problem["spans"]
+    spanLen = problem["spanLen"]
+
+    if problem["fit_span_bits"] is not None:
+        span_in_area = funcBits.bits_weighted_sum(funcBits.pack_topology(colSpanTopo), problem["fit_span_bits"]) + \
+                       funcBits.bits_weighted_sum(funcBits.pack_topology(beamTopo), problem["fit_span_bits"])
+    else:
+        span_in_area = np.sum((colSpanTopo + beamTopo) * problem["fit_span"])
+
+    if problem["fit_node_bits"] is not None:
+        node_in_area = funcBits.bits_weighted_sum(funcBits.pack_topology(colTopo), problem["fit_node_bits"])
+    else:
+        node_in_area = np.sum(colTopo * problem["fit_node"])
+
+    beam_covered     = buildContBeam.build_contBeam_coverage(
+        contBeamTopo, problem["cb_beam_row"], problem["cb_beam_span"], len(beamTopo))
+    standalone_beams = build_fitness_standalone_beams_covered(beamTopo, beam_covered, spanLen)
+
+    col_constrained = funcKernels.build_kernel_col_constrained(colTopo, colSpanTopo, spans)
+    if funcKernels.USE_KERNELS:
+        crossing_beams = funcKernels.kernel_crossing_beams(
+            col_constrained, beamTopo, problem["nod_ptr"], problem["nod_span"], problem["spanAx"], spanLen)
+    else:
+        crossing_beams = build_fitness_crossing_beams_csr(
+            col_constrained, beamTopo, problem["nod_span"], problem["nod_row"], problem["nod_pair"],
+            problem["pair_nod"], spanLen)
+
+    return span_in_area, node_in_area, standalone_beams, crossing_beams
+
+
+
+
+
+def build_data_fitness_batch(cands, problem):
+    """
+    Bir popülasyonun fitness değerlerini tek seferde hesaplar. Adayların topolojileri satır
+    başına bir aday olacak şekilde matrislere dizilir; alan ihlali toplamları (P, n) @ ağırlık
+    çarpımlarıyla, bağımsız ve saplanan kirişler seyrek üyelik / bağlantı matrisleri
+    üzerinde satır bazında segment toplamlarıyla bulunur. build_data_fitness_problem ile
+    aynı değerleri döndürür.
+
+    Args:
+        cands (list)   : Tasarım vektörleri (manual_design_vector.md dosyasına bakınız)
+        problem (dict) : build_data_problem ile oluşturulan problem paketi
+
+    Returns:
+        np.ndarray: (P, 4) fitness değerleri (span_in_area, node_in_area, standalone_beams,
+                    crossing_beams)
+
+    Requires:
+        numpy as np
+        func_kernels as funcKernels
+        build_data_contBeam as buildContBeam
+    """
+    colTopo, colSpanTopo, beamTopo, contBeamTopo = (np.stack([cand[seg] for cand in cands])
+                                                    for seg in (0, 5, 8, 11))
+
+    spans   = problem["spans"]
+    spanLen = problem["spanLen"]
+
+    span_in_area = colSpanTopo @ problem["fit_span"] + beamTopo @ problem["fit_span"]
+    node_in_area = colTopo @ problem["fit_node"]
+
+    beam_covered     = buildContBeam.build_contBeam_coverage(
+        contBeamTopo, problem["cb_beam_row"], problem["cb_beam_span"], beamTopo.shape[1])
+    standalone_beams = build_fitness_standalone_beams_covered(beamTopo, beam_covered, spanLen)
+
+    col_constrained = funcKernels.build_kernel_col_constrained_batch(colTopo, colSpanTopo, spans)
+    crossing_beams  = build_fitness_crossing_beams_csr(
+        col_constrained, beamTopo, problem["nod_span"], problem["nod_row"], problem["nod_pair"],
+        problem["pair_nod"], spanLen)
+
+    return np.column_stack([span_in_area, node_in_area, standalone_beams, crossing_beams])
\ No newline at end of file
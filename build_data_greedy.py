@@ -0,0 +1,236 @@
+import numpy as np
+"""
+Required by:
+    build_greedy_contBeam
+    build_greedy_colTopo
+    build_data_greedy
+"""
+
+import func_optimization as funcOpti
+"""
+Required by:
+    build_data_greedy
+"""
+
+import build_data_penalty as buildPenalty
+"""
+Required by:
+    build_greedy_contBeam
+"""
+
+import build_data_repair as buildRepMask
+"""
+Required by:
+    build_data_greedy
+"""
+
+import build_data_od_repair as buildODRepair
+"""
+Required by:
+    build_data_greedy
+"""
+
+
+
+
+
+def build_greedy_contBeam(contBeam, beamTopo, spanDistMin, spanDistMax, beamDistMin, beamDistMax):
+    """
+    Sürekli kiriş hatlarını tek geçişte (greedy) seçer. Önce yasaklı olmayan dış (çevre)
+    hatlar sisteme eklenir; daha sonra iç hatlar, kirişler arası mesafe cezasını en çok
+    azaltan hat her adımda eklenecek şekilde, ceza azalmayana kadar sisteme eklenir.
+    Eklenen bir hattın "exclude" listesindeki hatlar bir daha değerlendirilmez.
+
+    Args:
+        contBeam (list)          : Sürekli hat bilgisi (build_contBeam'den gelir)
+        beamTopo (np.ndarray)    : Başlangıç kiriş topolojisi (mask_beam_always gibi)
+        spanDistMin (np.ndarray) : Kiriş çiftlerinin arasındaki minimum mesafeyi içeren 2B dizi
+        spanDistMax (np.ndarray) : Kiriş çiftlerinin arasındaki maksimum mesafeyi içeren 2B dizi
+        beamDistMin (float)      : Kirişler arası minimum mesafe sınırı
+        beamDistMax (float)      : Kirişler arası maksimum mesafe sınırı
+
+    Returns:
+        tuple: (contBeamTopo, beamTopo, colSpanTopo)
+            - contBeamTopo : Seçilen hatlar 1, diğerleri 0
+            - beamTopo     : Seçilen hatların kirişleri eklenmiş kiriş topolojisi
+            - colSpanTopo  : Seçilen hatların çizgisel kolonlarını içeren topoloji
+
+    Requires:
+        numpy as np
+        build_data_penalty as buildPenalty
+    """
+    n_spans      = len(beamTopo)
+    contBeamTopo = np.zeros(len(contBeam), dtype=int)
+    beamTopo     = beamTopo.astype(int).copy()
+    colSpanTopo  = np.zeros(n_spans, dtype=int)
+    excluded     = np.array([c["banned"] for c in contBeam], dtype=bool)
+
+    def add_contBeam(idx):
+        contBeamTopo[idx] = 1
+        beamTopo[contBeam[idx]["beam"]] = 1
+        colSpanTopo[contBeam[idx]["colSpan"]] = 1
+        excluded[idx] = True
+        excluded[contBeam[idx]["exclude"]] = True
+
+    # 1. Yasaklı olmayan dış hatlar
+    for idx, cont in enumerate(contBeam):
+        if cont["outer"] and not excluded[idx]: add_contBeam(idx)
+
+    # 2. İç hatlar: kirişler arası mesafe cezasını en çok azaltan hat eklenir
+    beam_dist = lambda topo: buildPenalty.build_penalty_beam_dist(
+        topo, spanDistMin, spanDistMax, beamDistMin, beamDistMax)
+    current = beam_dist(beamTopo)
+
+    while True:
+        best_idx, best_pen, best_fit = -1, current, np.inf
+
+        for idx in np.where(~excluded)[0]:
+            trial = beamTopo.copy()
+            trial[contBeam[idx]["beam"]] = 1
+            pen = beam_dist(trial)
+            fit = contBeam[idx]["fitness"]
+            # eşit cezada uygunluğu (fitness) daha iyi olan hat tercih edilir
+            if pen < best_pen or (best_idx != -1 and pen == best_pen and fit < best_fit):
+                best_idx, best_pen, best_fit = idx, pen, fit
+
+        if best_idx == -1: break
+        add_contBeam(best_idx)
+        current = best_pen
+
+    # çizgisel kolon bulunan aks parçalarında kiriş bulunmaz
+    beamTopo[colSpanTopo == 1] = 0
+
+    return contBeamTopo, beamTopo, colSpanTopo
+
+
+
+
+
+def build_greedy_colTopo(colTopo, colSpanTopo, beamTopo, axNod, axSpan, nodeDist, spans,
+                         mask_col_never, beamLenLim, colDist):
+    """
+    Kiriş hatları boyunca noktasal kolonları tek geçişte (greedy) yerleştirir. Her aks
+    üzerindeki kesintisiz kiriş dizileri sırayla yürünür; son mesnetten (noktasal kolon
+    veya çizgisel kolon ucu) olan mesafe bir sonraki düğümde izin verilen en büyük değeri
+    aşacaksa ve mevcut düğümde izin verilen en küçük değer sağlanıyorsa mevcut düğüme kolon
+    konur. Kiriş dizisinin uçlarındaki ve başka kirişe bağlanmayan düğümlere de kolon konur.
+
+    Args:
+        colTopo (np.ndarray)        : Başlangıç noktasal kolon topolojisi
+        colSpanTopo (np.ndarray)    : Çizgisel kolon topolojisi
+        beamTopo (np.ndarray)       : Kiriş topolojisi
+        axNod (list)                : Her bir aksın üzerindeki düğümlerin indeksleri
+        axSpan (list)               : Her bir aksın üzerindeki aks parçalarının indeksleri
+        nodeDist (np.ndarray)       : Düğüm çiftleri arasındaki mesafeleri içeren 2B dizi
+        spans (np.ndarray)          : Aks parçalarının uç düğümlerini içeren dizi
+        mask_col_never (np.ndarray) : Noktasal kolona izin verilmeyen düğümler için maske
+        beamLenLim (dict)           : Kiriş uzunluğu sınırları {min, max}
+        colDist (dict)              : Kolonlar arası mesafe sınırları {min, max}
+
+    Returns:
+        np.ndarray: Noktasal kolon topolojisi
+
+    Requires:
+        numpy as np
+    """
+    colTopo = colTopo.astype(int).copy()
+    allowed = ~mask_col_never
+
+    upper = min(beamLenLim["max"], colDist["max"])
+    lower = max(beamLenLim["min"], colDist["min"])
+
+    # Çizgisel kolon uçları da mesnet sayılır
+    supported = colTopo == 1
+    supported[spans[colSpanTopo == 1].ravel()] = True
+
+    # Her düğüme bağlı aktif kiriş sayısı
+    degree = np.bincount(spans[beamTopo == 1].ravel(), minlength=len(colTopo))
+
+    def place(node):
+        if allowed[node] and not supported[node]:
+            colTopo[node]   = 1
+            supported[node] = True
+
+    for nodes, ax_spans in zip(axNod, axSpan):
+        last = -1 # aks üzerindeki son mesnet düğümü
+
+        for j, span in enumerate(ax_spans):
+            n1, n2 = nodes[j], nodes[j+1]
+
+            # kiriş dizisi kesildi
+            if beamTopo[span] != 1:
+                last = -1
+                continue
+
+            # kiriş dizisinin başlangıcı
+            if last == -1:
+                if degree[n1] == 1: place(n1)
+                last = n1
+
+            if supported[n2]:
+                last = n2
+                continue
+
+            # dizinin sonu veya bir sonraki düğümde üst sınırın aşılması
+            is_end    = j + 1 == len(ax_spans) or beamTopo[ax_spans[j+1]] != 1
+            next_dist = np.inf if is_end else nodeDist[last, nodes[j+2]]
+
+            if (is_end and degree[n2] == 1) or (next_dist > upper and nodeDist[last, n2] >= lower):
+                place(n2)
+                if supported[n2]: last = n2
+
+    return colTopo
+
+
+
+
+
+def build_data_greedy(geoData, xls, contBeam, repairMask):
+    """
+    Tek geçişte, deterministik olarak, uygulanabilir bir tasarım vektörü oluşturur.
+    Oluşturulan çözüm başlangıç popülasyonuna eklenebilir veya mimarlar için hızlı bir
+    "ön izleme" çözümü olarak kullanılabilir. Kesit, yön ve kaçıklıklar için
+    gen_default_sol ile üretilen varsayılan değerler kullanılır.
+
+    Args:
+        geoData (dict)    : Yapının geometrik verileri (build_data_geo'dan gelir)
+        xls (dict)        : read_XLS.read_XLS ile okunan ayarlar (xls) dosyası
+        contBeam (list)   : Sürekli hat bilgisi (build_contBeam'den gelir)
+        repairMask (dict) : build_data_repair ile oluşturulan onarım maskeleri
+
+    Returns:
+        list: Onarım maskeleri uygulanmış kompakt tasarım vektörü
+              (funcOpti.decode_solution ile ayrık biçime çevrilebilir)
+
+    Requires:
+        numpy as np
+        func_optimization as funcOpti
+        build_data_repair as buildRepMask
+        build_data_od_repair as buildODRepair
+    """
+    # 1. Sürekli kiriş hatları, kirişler ve çizgisel kolonlar
+    beamTopo = repairMask["mask_beam_always"] & ~repairMask["mask_beam_never"]
+    contBeamTopo, beamTopo, colSpanTopo = build_greedy_contBeam(
+        contBeam, beamTopo, geoData["spanDistMin"], geoData["spanDistMax"],
+        xls["beamDist"]["min"], xls["beamDist"]["max"])
+
+    # 2. Noktasal kolonlar: oturma alanı köşeleri ve seçilen hatların uç kolonları
+    colTopo = repairMask["mask_col_always"].astype(int)
+    for idx in np.where(contBeamTopo == 1)[0]:
+        colTopo[contBeam[idx]["end col"]] = 1
+    colTopo[repairMask["mask_col_never"]] = 0
+
+    colTopo = build_greedy_colTopo(
+        colTopo, colSpanTopo, beamTopo, geoData["axNod"], geoData["axSpan"],
+        geoData["nodeDist"], geoData["spans"], repairMask["mask_col_never"],
+        xls["beamLenLim"], xls["colDist"])
+
+    # 3. Kesit, yön ve kaçıklıklar varsayılan (kompakt) çözümden alınır
+    cand = funcOpti.gen_default_sol(geoData, xls, len(contBeam))
+    for seg, topo in zip((0, 5, 8, 11), (colTopo, colSpanTopo, beamTopo, contBeamTopo)):
+        cand[seg] = topo.astype(cand[seg].dtype)
+
+    # 4. Statik ve dinamik (on demand) onarımlar
+    cand = buildRepMask.apply_repair(cand, repairMask)
+    od_mask = buildODRepair.build_data_od_repair(cand, geoData, contBeam)
+    return buildODRepair.apply_od_repair(cand, od_mask)
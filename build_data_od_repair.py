@@ -15,6 +15,19 @@ Required by:
     apply_od_repair
 """
 
+import func_kernels as funcKernels
+"""
+Required by:
+    build_od_mask_alone_beam
+    build_data_od_repair_problem
+"""
+
+import build_data_contBeam as buildContBeam
+"""
+Required by:
+    build_data_od_repair_problem
+"""
+
 
 
 
@@ -230,7 +243,7 @@ def build_od_mask_alone_beam(colTopo, colSpanTopo, beamTopo, spans):
     Serbest = True, Tutulu = False
     Eğer aşağıdaki koşullardan biri sağlanıyorsa False:
         - Kirişin en az bir ucunda kolon varsa
-        - Kirişin en az bir ucunda başka bir kiriş varsa
+        - Kirişin en az bir ucunda başka bir kiriş varsa (düğüm derecesi >= 2)
     
     Args:
         colTopo (np.ndarray)     : Noktasal kolon varlık bilgisi (1=var, 0=yok)
@@ -243,38 +256,17 @@ def build_od_mask_alone_beam(colTopo, colSpanTopo, beamTopo, spans):
     
     Requires:
         numpy as np
+        func_kernels as funcKernels
     """
-    # 1. Tüm elemanları False olan maske oluştur
-    mask = np.zeros(len(beamTopo), dtype=bool)
+    # 1. Üzerinde kolon bulunan düğümler ve düğümlere bağlı aktif kiriş sayıları
+    col_constrained = funcKernels.build_kernel_col_constrained(colTopo, colSpanTopo, spans)
+    degree          = funcKernels.build_kernel_degree(beamTopo, spans, len(colTopo))
 
-    # 2. Üzerinde kolon bulunan düğümler
-    col_constrained = set(np.where(colTopo == 1)[0]) | set(spans[colSpanTopo == 1].ravel())
+    # 2. Kolonu olmayan ve kirişin kendisinden başka kiriş bağlanmayan düğümler serbesttir
+    free = ~col_constrained & (degree < 2)
 
-    # 3. Aktif kirişlerin uç düğümleri
-    beam_nodes = spans[beamTopo == 1].ravel().tolist()
-
-    for i in np.where(beamTopo == 1)[0]:
-
-        n1, n2 = spans[i]
-        
-        # 4. Eğer kirişin en az bir ucunda kolon varsa devam et;
-        #    diğer kontrollere gerek yok, False kalacak.
-        if (n1 in col_constrained) or (n2 in col_constrained): continue
-
-        # 5. Kirişin kendi uç düğümleri hariç diğer kirişlerin bağlı olduğu düğümler
-        other_beam_nodes = beam_nodes.copy()
-        # n1'i ve n2'yi yalnızca BİRER KEZ çıkar
-        other_beam_nodes.remove(n1)
-        other_beam_nodes.remove(n2)
-
-        # 6. Diğer kirişler tarafından tutulan düğümleri bul
-        other_beam_constrained = set(other_beam_nodes)
-
-        # 7. Her iki uç da serbestse True
-        if (n1 not in other_beam_constrained) and (n2 not in other_beam_constrained):
-            mask[i] = True
-
-    return mask
+    # 3. Her iki ucu da serbest olan aktif kirişler
+    return (beamTopo == 1) & free[spans[:, 0]] & free[spans[:, 1]]
 
 
 
@@ -326,6 +318,57 @@ def build_data_od_repair(cand, geoData, contBeam):
 
 
 
+def build_data_od_repair_problem(cand, problem):
+    """
+    build_data_od_repair ile aynı on demand onarım maskelerini build_data_problem ile
+    oluşturulan problem paketini kullanarak oluşturur. Sürekli hat maskeleri seyrek sürekli
+    hat - aks parçası üyelik matrisleri ile bulunur. Numba kuruluysa yalnız kalan kolon ve
+    kiriş maskeleri derlenmiş çekirdeklerle (func_kernels) oluşturulur.
+
+    Args:
+        cand (list)    : Çözümün tasarım vektörü (manual_design_vector.md dosyasına bakınız)
+        problem (dict) : build_data_problem ile oluşturulan problem paketi
+
+    Returns:
+        On demand onarım maskelerini içeren sözlük
+
+    Requires:
+        func_kernels as funcKernels
+        build_data_contBeam as buildContBeam
+    """
+    colTopo      = cand[0]
+    colSpanTopo  = cand[5]
+    beamTopo     = cand[8]
+    contBeamTopo = cand[11]
+
+    spans   = problem["spans"]
+    nodSpan = problem["nodSpan"]
+
+    if funcKernels.USE_KERNELS:
+        col_constrained    = funcKernels.build_kernel_col_constrained(colTopo, colSpanTopo, spans)
+        degree             = funcKernels.build_kernel_degree(beamTopo, spans, len(colTopo))
+        od_mask_alone_col  = funcKernels.kernel_alone_col(colTopo, beamTopo, problem["nod_ptr"], problem["nod_span"])
+        od_mask_alone_beam = funcKernels.kernel_alone_beam(col_constrained, degree, beamTopo, spans)
+    else:
+        od_mask_alone_col  = build_od_mask_remove_alone_col(colTopo, beamTopo, nodSpan)
+        od_mask_alone_beam = build_od_mask_alone_beam(colTopo, colSpanTopo, beamTopo, spans)
+
+    return {
+        "od_mask_contBeam_beams"    : buildContBeam.build_contBeam_coverage(
+            contBeamTopo, problem["cb_beam_row"], problem["cb_beam_span"], len(beamTopo)),
+        "od_mask_contBeam_colSpans" : buildContBeam.build_contBeam_coverage(
+            contBeamTopo, problem["cb_colSpan_row"], problem["cb_colSpan_span"], len(colSpanTopo)),
+        "od_mask_colspan_beams"     : build_od_mask_remove_colSpan_beams(colSpanTopo, beamTopo),
+        "od_mask_colspan_cols"      : build_od_mask_remove_colSpan_cols(colTopo, colSpanTopo, spans),
+        "od_mask_alone_col"         : od_mask_alone_col,
+        "od_mask_alone_colspan"     : build_od_mask_remove_alone_colSpan(colSpanTopo, beamTopo, spans, nodSpan),
+        "od_mask_alone_beam"        : od_mask_alone_beam
+    }
+
+
+
+
+
 def apply_od_repair(cand, od_repair_mask):
     """
     cand listesine (çözüm adayı) build_data_od_repair fonksiyonu ile elde edilen onarım maskelerini
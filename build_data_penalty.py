@@ -1,12 +1,130 @@
 import numpy as np
 """
 Required by:
-    build_penalty_beam_lengths
+    build_beam_length_violation
+    build_penalty_beam_lengths_per_axis
+    build_penalty_beam_lengths_flat
     build_penalty_beam_dist
     build_penalty_col_dist
     build_penalty_beam_with_free_end
+    build_penalty_pair_list
+    build_penalty_beam_lengths_batch
+    build_penalty_beam_with_free_end_batch
+    build_data_penalty_problem
+    build_data_penalty_batch
 """
 
+import func_kernels as funcKernels
+"""
+Required by:
+    build_penalty_beam_with_free_end
+    build_penalty_beam_with_free_end_batch
+    build_data_penalty_problem
+    build_data_penalty_batch
+"""
+
+import build_data_rigidity as buildRigidity
+"""
+Required by:
+    build_data_penalty
+    build_data_penalty_problem
+    build_data_penalty_batch
+"""
+
+# build_data_penalty* fonksiyonlarının döndürdüğü ceza bileşenleri (sırasıyla)
+PENALTY_KEYS = ["beam_length_viol", "beam_dist_viol", "col_dist_viol", "beam_free_end_len", "rigidity_viol"]
+
+
+
+
+
+def build_axis_beam_lengths(colTopo, colSpanTopo, beamTopo, nodes, nodeDist, spans):
+    """
+    Tek bir aks üzerindeki kirişlerin uzunluklarını hesaplar. Kiriş; çizgisel kolon
+    bulunan, kiriş bulunmayan aks parçalarında veya noktasal kolon bulunan düğümlerde
+    sona erer.
+
+    Args:
+        colTopo (np.ndarray)      : Sistemde bulunan noktasal kolonların topolojisi
+        colSpanTopo (np.ndarray)  : Sistemde bulunan çizgisel kolonların topolojisi
+        beamTopo (np.ndarray)     : Sistemde bulunan kirişların topolojisi
+        nodes (np.ndarray)        : Aks üzerinde bulunan düğümlerin indeksleri
+        nodeDist (np.ndarray)     : Her bir düğüm çiftinin arasındaki mesafeyi içeren 2B dizi
+        spans (np.ndarray)        : Aks üzerinde bulunan aks parçalarının indeksleri
+
+    Returns:
+        list: Aks üzerindeki kirişlerin uzunlukları
+
+    Requires:
+        none
+    """
+    beam_lengths     = []
+    current_beam_len = 0 # kiriş uzunluğu başlangıç değeri
+
+    for j, span in enumerate(spans):
+
+        has_colspan = colSpanTopo[span] == 1 # aks parçasında çizgisel kolon var mı?
+        has_beam    = beamTopo[span] == 1 # aks parçasında kiriş var mı?
+
+        # eğer aks parçasında çizgisel kolon varsa kiriş sonuna geldik demektir.
+        if has_colspan:
+
+            if current_beam_len > 0:
+                beam_lengths.append(current_beam_len)
+                current_beam_len = 0
+        
+        # eğer aks parçasında kiriş varsa kiriş uzunluğunu güncelle
+        elif has_beam:
+            n1, n2 = nodes[j], nodes[j+1]
+            current_beam_len += nodeDist[n1, n2]
+            # kirişin bitiş düğümünde kolon varsa kiriş sonuna geldik demektir.
+            if colTopo[n2] == 1:
+                beam_lengths.append(current_beam_len)
+                current_beam_len = 0
+
+        # eğer aks parçasında ne çizgisel kolon ne de kiriş varsa kiriş sonuna geldik
+        # demektir.
+        else:
+
+            if current_beam_len > 0:
+                beam_lengths.append(current_beam_len)
+                current_beam_len = 0
+
+    # aks sonunda kiriş kalmışsa bu kirişin de uzunluğunu listeye ekle
+    if current_beam_len > 0:
+        beam_lengths.append(current_beam_len)
+
+    return beam_lengths
+
+
+
+
+
+def build_beam_length_violation(beam_lengths, beamLenLimMin, beamLenLimMax):
+    """
+    Kiriş uzunluklarının sınırları ihlal oranlarının toplamını hesaplar.
+
+    Args:
+        beam_lengths (list)   : Kiriş uzunlukları
+        beamLenLimMin (float) : Kiriş uzunluğu alt sınırı
+        beamLenLimMax (float) : Kiriş uzunluğu üst sınırı
+
+    Returns:
+        Uzunluk sınırlarını ihlal eden kirişlerin ihlal oranları toplamı
+
+    Requires:
+        numpy
+    """
+    beam_lengths = np.array(beam_lengths)
+    
+    mask_low  = beam_lengths < beamLenLimMin
+    mask_high = beam_lengths > beamLenLimMax
+
+    penalty  = np.sum((beamLenLimMin / beam_lengths[mask_low]) - 1)
+    penalty += np.sum((beam_lengths[mask_high] / beamLenLimMax) - 1)
+
+    return penalty
+
 
 
 
@@ -33,58 +151,97 @@ def build_penalty_beam_lengths(
         Sistemde bulunan ve uzunluk sınırlarını ihlal eden kirişlerin ihlal oranları toplamı
 
     Requires:
-        numpy
+        none
     """
     beam_lengths = []
 
     for i in range(len(axSpan)):
-        nodes, spans     = axNod[i], axSpan[i] # aks üzerindeki düğüm ve span indeksleri
-        current_beam_len = 0 # kiriş uzunluğu başlangıç değeri
-
-        for j, span in enumerate(spans):
-
-            has_colspan = colSpanTopo[span] == 1 # aks parçasında çizgisel kolon var mı?
-            has_beam    = beamTopo[span] == 1 # aks parçasında kiriş var mı?
-
-            # eğer aks parçasında çizgisel kolon varsa kiriş sonuna geldik demektir.
-            if has_colspan:
-
-                if current_beam_len > 0:
-                    beam_lengths.append(current_beam_len)
-                    current_beam_len = 0
-            
-            # eğer aks parçasında kiriş varsa kiriş uzunluğunu güncelle
-            elif has_beam:
-                n1, n2 = nodes[j], nodes[j+1]
-                current_beam_len += nodeDist[n1, n2]
-                # kirişin bitiş düğümünde kolon varsa kiriş sonuna geldik demektir.
-                if colTopo[n2] == 1:
-                    beam_lengths.append(current_beam_len)
-                    current_beam_len = 0
-
-            # eğer aks parçasında ne çizgisel kolon ne de kiriş varsa kiriş sonuna geldik
-            # demektir.
-            else:
-
-                if current_beam_len > 0:
-                    beam_lengths.append(current_beam_len)
-                    current_beam_len = 0
-
-        # aks sonunda kiriş kalmışsa bu kirişin de uzunluğunu listeye ekle
-        if current_beam_len > 0:
-            beam_lengths.append(current_beam_len)
-
-    # Toplam cezanın hesaplanması
-    beam_lengths = np.array(beam_lengths)
-    
-    mask_low  = beam_lengths < beamLenLimMin
-    mask_high = beam_lengths > beamLenLimMax
-
-    penalty  = np.sum((beamLenLimMin / beam_lengths[mask_low]) - 1)
-    penalty += np.sum((beam_lengths[mask_high] / beamLenLimMax) - 1)
+        beam_lengths.extend(build_axis_beam_lengths(
+            colTopo, colSpanTopo, beamTopo, axNod[i], nodeDist, axSpan[i]))
 
     # Toplam cezayı döndür
-    return penalty
+    return build_beam_length_violation(beam_lengths, beamLenLimMin, beamLenLimMax)
+
+
+
+
+
+def build_penalty_beam_lengths_per_axis(
+    colTopo, colSpanTopo, beamTopo, axNod, nodeDist, axSpan, beamLenLimMin, beamLenLimMax):
+    """
+    Kiriş uzunluğu ceza değerini aks bazında hesaplar. Değerlerin toplamı
+    build_penalty_beam_lengths ile aynıdır. Bir aks üzerindeki kiriş değişiklikleri
+    sadece o aksın, bir düğümdeki kolon değişiklikleri sadece o düğümden geçen aksların
+    ceza değerlerini değiştirir (artımlı değerlendirme).
+
+    Args:
+        colTopo (np.ndarray)      : Sistemde bulunan noktasal kolonların topolojisi
+        colSpanTopo (np.ndarray)  : Sistemde bulunan çizgisel kolonların topolojisi
+        beamTopo (np.ndarray)     : Sistemde bulunan kirişların topolojisi
+        axNod (list)              : Her bir aksın üzerinde bulunan düğümlerin indekslerini
+                                    içeren liste
+        nodeDist (np.ndarray)     : Her bir düğüm çiftinin arasındaki mesafeyi içeren 2B dizi
+        axSpan (list)             : Her bir aksın üzerinde bulunan aks parçalarının indekslerini
+                                    içeren liste
+        beamLenLimMin (float)     : Kiriş uzunluğu alt sınırı
+        beamLenLimMax (float)     : Kiriş uzunluğu üst sınırı
+
+    Returns:
+        np.ndarray: Her bir aksın kiriş uzunluğu ceza değeri
+
+    Requires:
+        numpy
+    """
+    return np.array([
+        build_beam_length_violation(
+            build_axis_beam_lengths(colTopo, colSpanTopo, beamTopo, axNod[i], nodeDist, axSpan[i]),
+            beamLenLimMin, beamLenLimMax)
+        for i in range(len(axSpan))], dtype=float)
+
+
+
+
+
+def build_penalty_beam_lengths_flat(colTopo, colSpanTopo, beamTopo, ax_ptr, ax_span, ax_end_nod, ax_seg_len,
+                                    beamLenLimMin, beamLenLimMax):
+    """
+    build_penalty_beam_lengths'in düz aks tablosu üzerinde çalışan vektörel hali. Tüm
+    aksların aks parçaları tek bir dizide ele alınır; kirişler kesme (break) maskesi ve
+    kümülatif toplam ile tek geçişte bulunur (run-length). Kiriş; çizgisel kolon bulunan,
+    kiriş bulunmayan aks parçalarında, noktasal kolon bulunan düğümlerde veya aks sonunda
+    sona erer.
+
+    Args:
+        colTopo (np.ndarray)     : Sistemde bulunan noktasal kolonların topolojisi
+        colSpanTopo (np.ndarray) : Sistemde bulunan çizgisel kolonların topolojisi
+        beamTopo (np.ndarray)    : Sistemde bulunan kirişların topolojisi
+        ax_ptr, ax_span, ax_end_nod, ax_seg_len (np.ndarray) : build_problem_axis_table
+        beamLenLimMin (float)    : Kiriş uzunluğu alt sınırı
+        beamLenLimMax (float)    : Kiriş uzunluğu üst sınırı
+
+    Returns:
+        Sistemde bulunan ve uzunluk sınırlarını ihlal eden kirişlerin ihlal oranları toplamı
+
+    Requires:
+        numpy as np
+    """
+    # Kirişin devam ettiği aks parçaları
+    in_beam = (colSpanTopo[ax_span] != 1) & (beamTopo[ax_span] == 1)
+
+    # Aks parçasının bitiş düğümünde kiriş kesilir mi? (noktasal kolon veya aks sonu)
+    cut = colTopo[ax_end_nod] == 1
+    cut[ax_ptr[1:][ax_ptr[1:] > ax_ptr[:-1]] - 1] = True
+
+    # Kiriş başlangıçları ve bitişleri (her kirişin tam bir başlangıcı ve bir bitişi vardır)
+    prev_cut = np.concatenate([[True], cut[:-1] | ~in_beam[:-1]])
+    next_cut = cut | ~np.concatenate([in_beam[1:], [False]])
+    starts   = np.flatnonzero(in_beam & prev_cut)
+    ends     = np.flatnonzero(in_beam & next_cut)
+
+    csum         = np.concatenate([[0.0], np.cumsum(np.where(in_beam, ax_seg_len, 0.0))])
+    beam_lengths = csum[ends + 1] - csum[starts]
+
+    return build_beam_length_violation(beam_lengths[beam_lengths > 0], beamLenLimMin, beamLenLimMax)
 
 
 
@@ -196,7 +353,7 @@ def build_penalty_beam_with_free_end(colTopo, colSpanTopo, beamTopo, spans, span
     Tutulu uç:
         - Noktasal kolon varsa
         - Çizgisel kolon bağlıysa
-        - Başka bir kirişin ucu varsa
+        - Başka bir kirişin ucu varsa (düğüme bağlı aktif kiriş sayısı >= 2)
 
     Args:
         colTopo (np.ndarray)     : Noktasal kolon varlık bilgisi (1=var, 0=yok)
@@ -210,61 +367,140 @@ def build_penalty_beam_with_free_end(colTopo, colSpanTopo, beamTopo, spans, span
 
     Requires:
         numpy as np
+        func_kernels as funcKernels
     """
-    total_len = 0 # toplam uzunluk başlangıç değeri
+    active = beamTopo == 1
 
-    # 1. Üzerinde kolon bulunan düğümler
-    col_constrained = set(np.where(colTopo == 1)[0]) | set(spans[colSpanTopo == 1].ravel())
+    # 1. Üzerinde kolon bulunan veya en az iki aktif kirişin bağlandığı düğümler tutuludur
+    col_constrained = funcKernels.build_kernel_col_constrained(colTopo, colSpanTopo, spans)
+    degree          = funcKernels.build_kernel_degree(beamTopo, spans, len(colTopo))
+    held            = col_constrained | (degree >= 2)
 
-    # 2. Aktif kirişlerin uç düğümleri
-    beam_nodes = spans[beamTopo == 1].ravel().tolist()
+    # 2. En az bir ucu serbest olan aktif kirişlerin toplam uzunluğu
+    free_end = active & ~(held[spans[:, 0]] & held[spans[:, 1]])
+    return spanLen[free_end].sum()
 
-    for i in np.where(beamTopo == 1)[0]:
-        n1, n2 = spans[i]
 
-        # n1 ve n2 kolonlar tarafından tutulu mu?
-        n1_constrained, n2_constrained = n1 in col_constrained, n2 in col_constrained
-        
-        # 4. Eğer kirişin her iki ucunda da kolon varsa devam et;
-        #    diğer kontrollere gerek yok, False kalacak.
-        if n1_constrained and n2_constrained: continue
 
-        # 5. Kirişin kendi uç düğümleri hariç diğer kirişlerin bağlı olduğu düğümler
-        other_beam_nodes = beam_nodes.copy()
-        # n1'i ve n2'yi yalnızca BİRER KEZ çıkar
-        other_beam_nodes.remove(n1)
-        other_beam_nodes.remove(n2)
 
-        # 6. Diğer kirişler de hesaba katıldığında n1 ve n2 tutulu mu? 
-        n1_constrained = n1_constrained or (n1 in other_beam_nodes)
-        n2_constrained = n2_constrained or (n2 in other_beam_nodes)
 
-        # 7. Eğer her iki uç da tutulmuşsa toplam dışı bırak
-        if n1_constrained and n2_constrained: continue
+def build_penalty_pair_list(active, pair_i, pair_j, pair_pen):
+    """
+    Sistemde bulunan elemanlar arasındaki mesafe sınırı ihlal oranlarının toplamını,
+    önceden hesaplanmış çift listesinden (COO) okur. Sadece her iki elemanı da sistemde
+    bulunan çiftlerin cezaları toplanır. Tek bir aday veya (P, n) boyutlu popülasyon
+    matrisi için çalışır.
+
+    Args:
+        active (np.ndarray)   : Elemanların sistemde bulunup bulunmadığı (True/False)
+        pair_i, pair_j, pair_pen (np.ndarray) : build_data_problem.build_problem_pair_list
+
+    Returns:
+        Sistemde bulunan elemanların ihlal oranları toplamı (popülasyon için (P,) dizi)
+
+    Requires:
+        numpy as np
+    """
+    return (active[..., pair_i] & active[..., pair_j]) @ pair_pen
+
+
+
+
+
+def build_penalty_beam_lengths_batch(colTopo, colSpanTopo, beamTopo, ax_ptr, ax_span, ax_end_nod, ax_seg_len,
+                                     beamLenLimMin, beamLenLimMax):
+    """
+    build_penalty_beam_lengths_flat'in popülasyon (toplu) hali. Adayların düz aks
+    tabloları arka arkaya eklenmiş gibi ele alınır; her satırın son aks parçası bir aks
+    sonu olduğundan kirişler satırlar arasında devam etmez. İhlal oranları satır bazında
+    toplanır.
+
+    Args:
+        colTopo (np.ndarray)     : (P, n_nodes) noktasal kolon topolojileri
+        colSpanTopo (np.ndarray) : (P, n_spans) çizgisel kolon topolojileri
+        beamTopo (np.ndarray)    : (P, n_spans) kiriş topolojileri
+        ax_ptr, ax_span, ax_end_nod, ax_seg_len (np.ndarray) : build_problem_axis_table
+        beamLenLimMin (float)    : Kiriş uzunluğu alt sınırı
+        beamLenLimMax (float)    : Kiriş uzunluğu üst sınırı
+
+    Returns:
+        np.ndarray: (P,) kiriş uzunluğu ceza değerleri
+
+    Requires:
+        numpy as np
+    """
+    n_pop, n_seg = len(beamTopo), len(ax_span)
+    if n_seg == 0: return np.zeros(n_pop)
+
+    in_beam = (colSpanTopo[:, ax_span] != 1) & (beamTopo[:, ax_span] == 1)
+
+    cut = colTopo[:, ax_end_nod] == 1
+    cut[:, ax_ptr[1:][ax_ptr[1:] > ax_ptr[:-1]] - 1] = True
+
+    # Satırlar düzleştirilir (her satırın son elemanında cut=True)
+    in_beam, cut = in_beam.ravel(), cut.ravel()
+    prev_cut = np.concatenate([[True], cut[:-1] | ~in_beam[:-1]])
+    next_cut = cut | ~np.concatenate([in_beam[1:], [False]])
+    starts   = np.flatnonzero(in_beam & prev_cut)
+    ends     = np.flatnonzero(in_beam & next_cut)
+
+    seg_len      = np.where(in_beam, np.tile(ax_seg_len, n_pop), 0.0)
+    csum         = np.concatenate([[0.0], np.cumsum(seg_len)])
+    beam_lengths = csum[ends + 1] - csum[starts]
+
+    keep         = beam_lengths > 0
+    beam_lengths = beam_lengths[keep]
+    violation    = np.where(beam_lengths < beamLenLimMin, beamLenLimMin / beam_lengths - 1, 0) + \
+                   np.where(beam_lengths > beamLenLimMax, beam_lengths / beamLenLimMax - 1, 0)
+
+    return np.bincount(starts[keep] // n_seg, weights=violation, minlength=n_pop)
+
+
+
+
 
-        # 8. En az bir ucu serbest → toplam uzunluğa ekle
-        total_len += spanLen[i]
+def build_penalty_beam_with_free_end_batch(col_constrained, beamTopo, spans, spanLen):
+    """
+    build_penalty_beam_with_free_end'in popülasyon (toplu) hali.
+
+    Args:
+        col_constrained (np.ndarray) : (P, n_nodes) funcKernels.build_kernel_col_constrained_batch
+        beamTopo (np.ndarray)        : (P, n_spans) kiriş topolojileri
+        spans (np.ndarray)           : Aks parçalarının başlangıç ve bitiş düğüm indeksleri
+        spanLen (np.ndarray)         : Her bir aks parçasının uzunluğu
 
-    return total_len
+    Returns:
+        np.ndarray: (P,) en az bir ucu serbest olan kirişlerin toplam uzunlukları
 
+    Requires:
+        numpy as np
+        func_kernels as funcKernels
+    """
+    degree   = funcKernels.build_kernel_degree_batch(beamTopo, spans, col_constrained.shape[1])
+    held     = col_constrained | (degree >= 2)
+    free_end = (beamTopo == 1) & ~(held[:, spans[:, 0]] & held[:, spans[:, 1]])
+    return free_end @ spanLen
 
 
 
 
-def build_data_penalty(cand, geoData, xls):
+
+def build_data_penalty(cand, geoData, xls, rigidity_tables):
     """
     Çözüm adayının penalty (ceza) değerlerini hesaplar.
 
     Args:
-        cand (list)    : Çözümün tasarım vektörü (manual_design_vector.md dosyasına bakınız)
-        geoData (dict) : Yapının geometrik verileri (build_data_geometry'den gelir)
-        xls (dict)     : read_XLS.read_XLS ile okunan ayarlar (xls) dosyası
+        cand (list)            : Çözümün tasarım vektörü (manual_design_vector.md dosyasına bakınız)
+        geoData (dict)         : Yapının geometrik verileri (build_data_geometry'den gelir)
+        xls (dict)             : read_XLS.read_XLS ile okunan ayarlar (xls) dosyası
+        rigidity_tables (dict) : buildRigidity.build_rigidity_tables ile bir kez oluşturulan
+                                 tablolar (problem["rigidity"])
 
     Returns:
-        Çözüm adayının penalty (ceza) değerleri
+        Çözüm adayının penalty (ceza) değerleri (bkz. PENALTY_KEYS)
 
     Requires:
-        none
+        build_data_rigidity as buildRigidity
     """
     colTopo     = cand[0]
     colSpanTopo = cand[5]
@@ -289,5 +525,109 @@ def build_data_penalty(cand, geoData, xls):
     beam_dist = build_penalty_beam_dist(beamTopo, spanDistMin, spanDistMax, beamDistMin, beamDistMax)
     col_dist = build_penalty_col_dist(colTopo, colSpanTopo, nodeDist, spans, colDistMin, colDistMax)
     beam_with_free_end = build_penalty_beam_with_free_end(colTopo, colSpanTopo, beamTopo, spans, spanLen)
+    rigidity = buildRigidity.build_data_rigidity(cand, rigidity_tables)
     
-    return beam_lengths, beam_dist, col_dist, beam_with_free_end
\ No newline at end of file
+    return beam_lengths, beam_dist, col_dist, beam_with_free_end, rigidity
+
+
+
+
+
+def build_data_penalty_problem(cand, problem):
+    """
+    Çözüm adayının penalty (ceza) değerlerini build_data_problem ile oluşturulan problem
+    paketini kullanarak hesaplar. build_data_penalty ile aynı değerleri döndürür; mesafe
+    cezaları önceden hesaplanmış çift listelerinden okunur, kiriş uzunluğu cezası düz aks
+    tablosu üzerinde vektörel olarak hesaplanır. Numba kuruluysa kiriş uzunluğu ve serbest
+    uçlu kiriş cezaları derlenmiş çekirdeklerle (func_kernels) hesaplanır.
+
+    Args:
+        cand (list)    : Çözümün tasarım vektörü (manual_design_vector.md dosyasına bakınız)
+        problem (dict) : build_data_problem ile oluşturulan problem paketi
+
+    Returns:
+        Çözüm adayının penalty (ceza) değerleri (bkz. PENALTY_KEYS)
+
+    Requires:
+        numpy as np
+        func_kernels as funcKernels
+        build_data_rigidity as buildRigidity
+    """
+    colTopo     = cand[0]
+    colSpanTopo = cand[5]
+    beamTopo    = cand[8]
+
+    spans = problem["spans"]
+
+    # Üzerinde noktasal kolon veya çizgisel kolon ucu bulunan düğümler
+    col_constrained = funcKernels.build_kernel_col_constrained(colTopo, colSpanTopo, spans)
+
+    beam_dist = build_penalty_pair_list(
+        beamTopo == 1, problem["span_pair_i"], problem["span_pair_j"], problem["span_pair_pen"])
+    col_dist  = build_penalty_pair_list(
+        col_constrained, problem["node_pair_i"], problem["node_pair_j"], problem["node_pair_pen"])
+
+    if funcKernels.USE_KERNELS:
+        degree = funcKernels.build_kernel_degree(beamTopo, spans, len(colTopo))
+
+        beam_lengths = funcKernels.kernel_beam_length_penalty(
+            colTopo, colSpanTopo, beamTopo, problem["ax_ptr"], problem["ax_span"], problem["ax_end_nod"],
+            problem["ax_seg_len"], problem["beamLenLimMin"], problem["beamLenLimMax"])
+        beam_with_free_end = funcKernels.kernel_beam_with_free_end(
+            col_constrained, degree, beamTopo, spans, problem["spanLen"])
+    else:
+        beam_lengths = build_penalty_beam_lengths_flat(
+            colTopo, colSpanTopo, beamTopo, problem["ax_ptr"], problem["ax_span"], problem["ax_end_nod"],
+            problem["ax_seg_len"], problem["beamLenLimMin"], problem["beamLenLimMax"])
+        beam_with_free_end = build_penalty_beam_with_free_end(
+            colTopo, colSpanTopo, beamTopo, spans, problem["spanLen"])
+
+    rigidity = buildRigidity.build_data_rigidity(cand, problem["rigidity"])
+
+    return beam_lengths, beam_dist, col_dist, beam_with_free_end, rigidity
+
+
+
+
+
+def build_data_penalty_batch(cands, problem):
+    """
+    Bir popülasyonun penalty (ceza) değerlerini tek seferde hesaplar. Adayların bileşenleri
+    satır başına bir aday olacak şekilde matrislere dizilir; tüm cezalar matris işlemleri ve
+    satır bazında toplamlarla bulunur. build_data_penalty_problem ile aynı değerleri
+    döndürür.
+
+    Args:
+        cands (list)   : Tasarım vektörleri (manual_design_vector.md dosyasına bakınız)
+        problem (dict) : build_data_problem ile oluşturulan problem paketi
+
+    Returns:
+        np.ndarray: (P, len(PENALTY_KEYS)) ceza değerleri
+
+    Requires:
+        numpy as np
+        func_kernels as funcKernels
+        build_data_rigidity as buildRigidity
+    """
+    colTopo, colSize, colDirec = (np.stack([cand[seg] for cand in cands]) for seg in (0, 1, 2))
+    colSpanTopo, colSpanSize   = (np.stack([cand[seg] for cand in cands]) for seg in (5, 6))
+    beamTopo                   = np.stack([cand[8] for cand in cands])
+
+    spans           = problem["spans"]
+    col_constrained = funcKernels.build_kernel_col_constrained_batch(colTopo, colSpanTopo, spans)
+
+    beam_lengths = build_penalty_beam_lengths_batch(
+        colTopo, colSpanTopo, beamTopo, problem["ax_ptr"], problem["ax_span"], problem["ax_end_nod"],
+        problem["ax_seg_len"], problem["beamLenLimMin"], problem["beamLenLimMax"])
+    beam_dist = build_penalty_pair_list(
+        beamTopo == 1, problem["span_pair_i"], problem["span_pair_j"], problem["span_pair_pen"])
+    col_dist  = build_penalty_pair_list(
+        col_constrained, problem["node_pair_i"], problem["node_pair_j"], problem["node_pair_pen"])
+    beam_with_free_end = build_penalty_beam_with_free_end_batch(
+        col_constrained, beamTopo, spans, problem["spanLen"])
+
+    metrics  = buildRigidity.build_rigidity_metrics(
+        colTopo, colSize, colDirec, colSpanTopo, colSpanSize, problem["rigidity"])
+    rigidity = buildRigidity.build_rigidity_violation(*metrics, problem["rigidity"])
+
+    return np.column_stack([beam_lengths, beam_dist, col_dist, beam_with_free_end, rigidity])
\ No newline at end of file
@@ -0,0 +1,308 @@
+import numpy as np
+"""
+Required by:
+    build_problem_limits
+    build_problem_pair_list
+    build_problem_axis_table
+    build_problem_nod_ax_incidence
+    build_data_problem
+"""
+
+import func_misc as misc
+"""
+Required by:
+    build_problem_nodSpan_csr
+    build_problem_nod_ax_incidence
+"""
+
+import func_optimization as funcOpti
+"""
+Required by:
+    build_problem_limits
+    build_data_problem
+"""
+
+import func_bits as funcBits
+"""
+Required by:
+    build_data_problem
+"""
+
+import build_data_rigidity as buildRigidity
+"""
+Required by:
+    build_data_problem
+"""
+
+import build_data_contBeam as buildContBeam
+"""
+Required by:
+    build_data_problem
+"""
+
+
+
+
+
+def build_problem_limits(geoData, xls):
+    """
+    Ham çözümlerin yorumlanmasında (interpret_solution) kullanılan sınırları oluşturur.
+
+    Args:
+        geoData (dict) : Yapının geometrik verileri (build_data_geo'dan gelir)
+        xls (dict)     : read_XLS.read_XLS ile okunan ayarlar (xls) dosyası
+
+    Returns:
+        dict: Kesit indekslerinin üst sınırları, yön seçenek sayıları ve kaçıklık seçenekleri
+
+    Requires:
+        numpy as np
+        func_optimization as funcOpti
+    """
+    return {
+        "col_size_max"         : len(xls["colSec"]["dL"]) - 1,
+        "nod_ax_lens"          : np.array([len(ax) for ax in geoData["nodAx"]]),
+        "col_ecc_choices"      : funcOpti.build_ecc_choices(xls["eccIntervals"]["col"]),
+        "col_span_size_max"    : len(xls["colSpanSec"]["width"]) - 1,
+        "col_span_ecc_choices" : funcOpti.build_ecc_choices(xls["eccIntervals"]["colSpan"]),
+        "beam_size_max"        : len(xls["beamSec"]["h"]) - 1,
+        "beam_ecc_choices"     : funcOpti.build_ecc_choices(xls["eccIntervals"]["beam"]),
+        "slab_size_max"        : len(xls["slabSec"]["h"]) - 1
+    }
+
+
+
+
+
+def build_problem_pair_list(distMin, distMax, limMin, limMax):
+    """
+    Aralarında bir mesafeden söz edilebilen (mesafesi > 0) ve mesafe sınırını ihlal eden
+    eleman çiftlerini ve ihlal oranlarını koordinat (COO) listesi olarak bir kez hesaplar.
+    Her iki eleman da sistemde olduğunda çiftin cezası toplama eklenir; ceza hesabı
+    eleman sayısının karesi yerine ihlal eden çift sayısı ile orantılıdır.
+
+    Args:
+        distMin (np.ndarray) : Çiftler arasındaki minimum mesafeyi içeren 2B dizi
+        distMax (np.ndarray) : Çiftler arasındaki maksimum mesafeyi içeren 2B dizi
+        limMin (float)       : Minimum mesafe sınırı
+        limMax (float)       : Maksimum mesafe sınırı
+
+    Returns:
+        tuple: (pair_i, pair_j, pair_pen) i<j olan çiftlerin indeksleri ve ihlal oranları
+
+    Requires:
+        numpy as np
+    """
+    distMin = np.asarray(distMin, dtype=float)
+    distMax = np.asarray(distMax, dtype=float)
+
+    pair_i, pair_j = np.nonzero(np.triu((distMin > 0) | (distMax > 0), k=1))
+    dmin, dmax     = distMin[pair_i, pair_j], distMax[pair_i, pair_j]
+
+    mask_low  = (dmin > 0) & (dmin < limMin)
+    mask_high = (dmax > 0) & (dmax > limMax)
+
+    pair_pen  = np.divide(limMin, dmin, out=np.ones_like(dmin), where=mask_low) - 1
+    pair_pen += np.where(mask_high, dmax / limMax - 1, 0)
+
+    keep = pair_pen != 0
+    return pair_i[keep], pair_j[keep], pair_pen[keep]
+
+
+
+
+
+def build_problem_axis_table(axNod, axSpan, nodeDist):
+    """
+    Aks listelerini (axNod, axSpan) düz (flat) bir tabloya dönüştürür. a. aksın aks
+    parçaları ax_span[ax_ptr[a]:ax_ptr[a+1]] aralığındadır; her aks parçasının aks
+    yönündeki bitiş düğümü ax_end_nod, uzunluğu ax_seg_len dizisindedir.
+
+    Args:
+        axNod (list)          : Her bir aksın üzerinde bulunan düğümlerin indeksleri
+        axSpan (list)         : Her bir aksın üzerinde bulunan aks parçalarının indeksleri
+        nodeDist (np.ndarray) : Her bir düğüm çiftinin arasındaki mesafeyi içeren 2B dizi
+
+    Returns:
+        tuple: (ax_ptr, ax_span, ax_end_nod, ax_seg_len)
+
+    Requires:
+        numpy as np
+    """
+    ax_ptr = np.zeros(len(axSpan) + 1, dtype=np.int64)
+    ax_ptr[1:] = np.cumsum([len(spans) for spans in axSpan])
+
+    ax_span, ax_end_nod, ax_seg_len = [], [], []
+    for nodes, spans in zip(axNod, axSpan):
+        nodes = np.asarray(nodes, dtype=np.int64)
+        ax_span.append(np.asarray(spans, dtype=np.int64))
+        ax_end_nod.append(nodes[1:len(spans) + 1])
+        ax_seg_len.append(nodeDist[nodes[:len(spans)], nodes[1:len(spans) + 1]])
+
+    if not ax_span:
+        return ax_ptr, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+    return ax_ptr, np.concatenate(ax_span), np.concatenate(ax_end_nod), \
+           np.concatenate(ax_seg_len).astype(float)
+
+
+
+
+
+def build_problem_nodSpan_csr(nodSpan):
+    """
+    Düğümlere bağlı aks parçaları listesini (nodSpan) sıkıştırılmış satır (CSR) biçimine
+    dönüştürür. n. düğüme bağlı aks parçaları nod_span[nod_ptr[n]:nod_ptr[n+1]] aralığındadır.
+
+    Args:
+        nodSpan (list) : Her bir düğüme bağlı aks parçalarının indeksleri
+
+    Returns:
+        tuple: (nod_ptr, nod_span)
+
+    Requires:
+        func_misc as misc
+    """
+    return misc.csr_from_lists(nodSpan)
+
+
+
+
+
+def build_problem_nod_ax_incidence(nod_ptr, nod_span, spanAx):
+    """
+    Düğüm - aks bağlantısını (node x axis incidence) oluşturur. CSR düğüm - aks parçası
+    bağlantısındaki her eleman, düğümün ve aks parçasının aksının oluşturduğu (düğüm, aks)
+    çiftine eşlenir. Bir düğümde kiriş bulunan farklı aks sayısı, çiftler üzerinden iki
+    segment toplamıyla bulunur (bkz. build_fitness_crossing_beams_csr).
+
+    Args:
+        nod_ptr (np.ndarray)  : build_problem_nodSpan_csr ile bulunan satır işaretçileri
+        nod_span (np.ndarray) : build_problem_nodSpan_csr ile bulunan aks parçası indeksleri
+        spanAx (np.ndarray)   : Her bir aks parçasının üzerinde bulunduğu aksı içeren dizi
+
+    Returns:
+        tuple: (nod_row, nod_pair, pair_nod)
+            - nod_row  : (nnz,) her elemanın düğümü
+            - nod_pair : (nnz,) her elemanın (düğüm, aks) çifti
+            - pair_nod : (n_pairs,) her çiftin düğümü
+
+    Requires:
+        numpy as np
+        func_misc as misc
+    """
+    nod_row = misc.csr_row_ids(nod_ptr)
+    n_axes  = int(np.max(spanAx)) + 1 if len(spanAx) else 1
+
+    pairs, nod_pair = np.unique(nod_row * n_axes + np.asarray(spanAx)[nod_span], return_inverse=True)
+    return nod_row, nod_pair.astype(np.int64), pairs // n_axes
+
+
+
+
+
+def build_data_problem(geoData, xls, contBeam, fit_span, fit_node):
+    """
+    Optimizasyon boyunca değişmeyen, değerlendirmelerde tekrar tekrar türetilen sabitleri
+    ve indeks dizilerini bir kez hesaplar. Oluşturulan "problem" paketi tüm koşumlar ve
+    işçiler (worker) tarafından salt okunur olarak paylaşılır.
+
+    Args:
+        geoData (dict)        : Yapının geometrik verileri (build_data_geo'dan gelir)
+        xls (dict)            : read_XLS.read_XLS ile okunan ayarlar (xls) dosyası
+        contBeam (list)       : Sürekli hat bilgisi (build_contBeam'den gelir)
+        fit_span (np.ndarray) : build_fitness_span_in_area ile hesaplanan dizi
+        fit_node (np.ndarray) : build_fitness_node_in_area ile hesaplanan dizi
+
+    Returns:
+        dict: Problem paketi
+            - limits, worst_fitness, default_sol : Optimizer başlangıç sabitleri
+            - spans, spanLen, spanAx, nodSpan, nodeDist, axNod, axSpan : Geometri
+            - beamLenLimMin, beamLenLimMax : Kiriş uzunluğu sınırları
+            - span_pair_i, span_pair_j, span_pair_pen : Mesafe sınırını ihlal eden kiriş
+              çiftleri ve cezaları (COO listesi)
+            - node_pair_i, node_pair_j, node_pair_pen : Mesafe sınırını ihlal eden kolon
+              düğümü çiftleri ve cezaları (COO listesi, sadece aynı aks üzerindeki çiftler)
+            - ax_ptr, ax_span, ax_end_nod, ax_seg_len : Düz aks tablosu (func_kernels)
+            - nod_ptr, nod_span : CSR düğüm - aks parçası bağlantısı (func_kernels)
+            - nod_row, nod_pair, pair_nod : Düğüm - aks bağlantısı (build_problem_nod_ax_incidence)
+            - fit_span_bits, fit_node_bits : Büyük planlarda alan ihlali toplamları için
+              paketli ağırlık kovaları (func_bits), küçük planlarda None
+            - rigidity : Plan rijitlik arama tabloları ve sınırları (build_data_rigidity)
+            - contBeam, fit_span, fit_node : Fitness ve OD onarımı verileri
+            - cb_beam_row, cb_beam_span, cb_colSpan_row, cb_colSpan_span : Seyrek (COO)
+              sürekli hat - kiriş ve sürekli hat - çizgisel kolon üyelik matrisleri
+
+    Requires:
+        numpy as np
+        func_optimization as funcOpti
+        func_bits as funcBits
+        build_data_rigidity as buildRigidity
+        build_data_contBeam as buildContBeam
+    """
+    span_pair_i, span_pair_j, span_pair_pen = build_problem_pair_list(
+        geoData["spanDistMin"], geoData["spanDistMax"], xls["beamDist"]["min"], xls["beamDist"]["max"])
+    # Düğümler arası mesafe sadece aynı aks üzerindeki düğümler için tanımlıdır (> 0)
+    node_pair_i, node_pair_j, node_pair_pen = build_problem_pair_list(
+        geoData["nodeDist"], geoData["nodeDist"], xls["colDist"]["min"], xls["colDist"]["max"])
+
+    ax_ptr, ax_span, ax_end_nod, ax_seg_len = build_problem_axis_table(
+        geoData["axNod"], geoData["axSpan"], geoData["nodeDist"])
+    nod_ptr, nod_span = build_problem_nodSpan_csr(geoData["nodSpan"])
+    nod_row, nod_pair, pair_nod = build_problem_nod_ax_incidence(nod_ptr, nod_span, geoData["spanAx"])
+
+    cb_beam_row, cb_beam_span       = buildContBeam.build_contBeam_membership(contBeam, "beam")
+    cb_colSpan_row, cb_colSpan_span = buildContBeam.build_contBeam_membership(contBeam, "colSpan")
+
+    default_sol = funcOpti.gen_default_sol(geoData, xls, len(contBeam))
+
+    # Binlerce elemanlı planlarda alan ihlali toplamları paketli topoloji üzerinden alınır
+    use_bits      = len(geoData["spans"]) >= funcBits.BITS_MIN_ITEMS
+    fit_span_bits = funcBits.build_bit_buckets(fit_span) if use_bits else None
+    fit_node_bits = funcBits.build_bit_buckets(fit_node) if use_bits else None
+
+    # Paylaşılan diziler salt okunur yapılır
+    flat = [span_pair_i, span_pair_j, span_pair_pen, node_pair_i, node_pair_j, node_pair_pen,
+            ax_ptr, ax_span, ax_end_nod, ax_seg_len, nod_ptr, nod_span, nod_row, nod_pair, pair_nod,
+            cb_beam_row, cb_beam_span, cb_colSpan_row, cb_colSpan_span]
+    for arr in flat + default_sol:
+        arr.setflags(write=False)
+
+    return {
+        "limits"          : build_problem_limits(geoData, xls),
+        "worst_fitness"   : funcOpti.find_worst_fitness(geoData, contBeam, fit_span, fit_node),
+        "default_sol"     : default_sol,
+        "spans"           : geoData["spans"],
+        "spanLen"         : geoData["spanLen"],
+        "spanAx"          : geoData["spanAx"],
+        "nodSpan"         : geoData["nodSpan"],
+        "nodeDist"        : geoData["nodeDist"],
+        "axNod"           : geoData["axNod"],
+        "axSpan"          : geoData["axSpan"],
+        "beamLenLimMin"   : xls["beamLenLim"]["min"],
+        "beamLenLimMax"   : xls["beamLenLim"]["max"],
+        "span_pair_i"     : span_pair_i,
+        "span_pair_j"     : span_pair_j,
+        "span_pair_pen"   : span_pair_pen,
+        "node_pair_i"     : node_pair_i,
+        "node_pair_j"     : node_pair_j,
+        "node_pair_pen"   : node_pair_pen,
+        "ax_ptr"          : ax_ptr,
+        "ax_span"         : ax_span,
+        "ax_end_nod"      : ax_end_nod,
+        "ax_seg_len"      : ax_seg_len,
+        "nod_ptr"         : nod_ptr,
+        "nod_span"        : nod_span,
+        "nod_row"         : nod_row,
+        "nod_pair"        : nod_pair,
+        "pair_nod"        : pair_nod,
+        "contBeam"        : contBeam,
+        "cb_beam_row"     : cb_beam_row,
+        "cb_beam_span"    : cb_beam_span,
+        "cb_colSpan_row"  : cb_colSpan_row,
+        "cb_colSpan_span" : cb_colSpan_span,
+        "fit_span"        : fit_span,
+        "fit_node"        : fit_node,
+        "fit_span_bits"   : fit_span_bits,
+        "fit_node_bits"   : fit_node_bits,
+        "rigidity"        : buildRigidity.build_rigidity_tables(geoData, xls)
+    }
@@ -0,0 +1,286 @@
+import numpy as np
+"""
+Required by:
+    build_rigidity_col_tables
+    build_rigidity_colSpan_tables
+    build_rigidity_tables
+    build_rigidity_metrics
+    build_rigidity_bounds
+    build_rigidity_violation
+"""
+
+import build_data_struct as buildStruct
+"""
+Required by:
+    build_rigidity_tables
+"""
+
+
+
+
+
+def build_rigidity_col_tables(nodAx, axesAngle, colSecProp):
+    """
+    Noktasal kolonların her düğüm, yön ve kesit seçeneği için alan ve döndürülmüş atalet
+    momenti tablolarını oluşturur. colDirec ve colSize indeksleri ile doğrudan okunur;
+    böylece calc_colRotated'daki düğüm döngüsüne gerek kalmaz.
+
+    Args:
+        nodAx (list)          : Her bir düğümden geçen aksları içeren liste
+        axesAngle (np.ndarray): Aks açılarını [açı, sin, cos] şeklinde tutan dizi
+        colSecProp (dict)     : build_data_struct.calc_colSecProp ile hesaplanan kesit özellikleri
+
+    Returns:
+        tuple: (col_A, col_Ix, col_Iy)
+            - col_A  : (n_sizes,) kesit alanları (dm2)
+            - col_Ix : (n_nodes, n_direc, n_sizes) x ekseni etrafındaki atalet momentleri (dm4)
+            - col_Iy : (n_nodes, n_direc, n_sizes) y ekseni etrafındaki atalet momentleri (dm4)
+
+    Requires:
+        numpy as np
+    """
+    n_direc = max((len(ax) for ax in nodAx), default=1)
+
+    # Geçersiz yön seçenekleri sıfır olarak kalır
+    sin2 = np.zeros((len(nodAx), n_direc))
+    cos2 = np.zeros((len(nodAx), n_direc))
+    for i, ax in enumerate(nodAx):
+        sin2[i, :len(ax)] = axesAngle[ax, 1]**2
+        cos2[i, :len(ax)] = axesAngle[ax, 2]**2
+
+    # cm -> dm
+    I_L = colSecProp["I_L"] / 1e4
+    I_S = colSecProp["I_S"] / 1e4
+
+    col_Ix = cos2[..., None] * I_L + sin2[..., None] * I_S
+    col_Iy = sin2[..., None] * I_L + cos2[..., None] * I_S
+
+    return colSecProp["A"] / 1e2, col_Ix, col_Iy
+
+
+
+
+
+def build_rigidity_colSpan_tables(spanLen, spanAx, axesAngle, colSpanSec):
+    """
+    Çizgisel kolonların her aks parçası ve kesit (genişlik) seçeneği için alan ve
+    döndürülmüş atalet momenti tablolarını oluşturur (bkz. calc_colSpanProp ve
+    calc_colSpanRotated).
+
+    Args:
+        spanLen (np.ndarray)  : Aks parçalarının uzunluklarını tutan dizi
+        spanAx (np.ndarray)   : Hangi aks parçasının hangi aks üzerinde olduğu bilgisini tutan dizi
+        axesAngle (np.ndarray): Aks açılarını [açı, sin, cos] şeklinde tutan dizi
+        colSpanSec (dict)     : Ayarlar (xls) dosyasından okunan colSpanSec sözlüğü
+
+    Returns:
+        tuple: (span_A, span_Ix, span_Iy) (n_spans, n_sizes) boyutlu diziler (dm2, dm4)
+
+    Requires:
+        numpy as np
+    """
+    # cm -> dm
+    L = np.asarray(spanLen, dtype=float)[:, None] / 10
+    w = np.asarray(colSpanSec["width"], dtype=float)[None, :] / 10
+
+    I_L = L * w**3 / 12
+    I_S = w * L**3 / 12
+
+    sin2 = axesAngle[spanAx, 1][:, None]**2
+    cos2 = axesAngle[spanAx, 2][:, None]**2
+
+    return L * w, cos2 * I_L + sin2 * I_S, sin2 * I_L + cos2 * I_S
+
+
+
+
+
+def build_rigidity_tables(geoData, xls):
+    """
+    Plan rijitlik değerlendirmesinde kullanılan arama tablolarını, eleman konumlarını,
+    kütle merkezini, plan boyutlarını ve planSettings sınırlarını bir kez hesaplar.
+
+    Args:
+        geoData (dict) : Yapının geometrik verileri (build_data_geo'dan gelir)
+        xls (dict)     : read_XLS.read_XLS ile okunan ayarlar (xls) dosyası
+
+    Returns:
+        dict: Rijitlik tabloları
+            - col_A, col_Ix, col_Iy    : build_rigidity_col_tables
+            - span_A, span_Ix, span_Iy : build_rigidity_colSpan_tables
+            - xy         : Önce düğümlerin, sonra aks parçası orta noktalarının koordinatları (dm)
+            - massCentre : Kat alanının ağırlık merkezi (dm)
+            - planDim    : Kat alanının x ve y yönlerindeki boyutları (dm)
+            - lim        : planSettings sınırları (NaN olan sınırlar uygulanmaz)
+
+    Requires:
+        numpy as np
+        build_data_struct as buildStruct
+    """
+    axesAngle = np.asarray(geoData["axesAngle"], dtype=float)
+
+    col_A, col_Ix, col_Iy = build_rigidity_col_tables(
+        geoData["nodAx"], axesAngle, buildStruct.calc_colSecProp(xls["colSec"]))
+    span_A, span_Ix, span_Iy = build_rigidity_colSpan_tables(
+        geoData["spanLen"], geoData["spanAx"], axesAngle, xls["colSpanSec"])
+
+    floor_nodes = geoData["nodes"][geoData["floorPol"]]
+    settings    = xls["planSettings"]
+
+    tables = {
+        "col_A"      : col_A,
+        "col_Ix"     : col_Ix,
+        "col_Iy"     : col_Iy,
+        "span_A"     : span_A,
+        "span_Ix"    : span_Ix,
+        "span_Iy"    : span_Iy,
+        "xy"         : np.vstack([geoData["nodes"], geoData["spansG"]]) / 10,
+        "massCentre" : np.asarray(geoData["floorPolG"], dtype=float) / 10,
+        "planDim"    : np.ptp(floor_nodes, axis=0) / 10
+    }
+    for arr in tables.values():
+        arr.setflags(write=False)
+
+    tables["lim"] = {key: float(settings[key])
+                     for key in ["max dRG", "min A", "max A", "min I", "max I", "max rI", "min It", "max It"]}
+    return tables
+
+
+
+
+
+def build_rigidity_metrics(colTopo, colSize, colDirec, colSpanTopo, colSpanSize, tables):
+    """
+    Noktasal ve çizgisel kolonların toplam alanını, x ve y yönlerindeki toplam atalet
+    momentlerini, rijitlik merkezine göre burulma atalet momentini ve rijitlik merkezini
+    arama tabloları üzerinden vektörel olarak hesaplar. Kolonlar düğümlerde, çizgisel
+    kolonlar aks parçası orta noktalarında kabul edilir (kaçıklıklar ihmal edilir).
+    Diziler tek bir aday için 1B veya popülasyon için (P, n) boyutlu olabilir.
+
+    Args:
+        colTopo (np.ndarray)     : Noktasal kolon topolojisi
+        colSize (np.ndarray)     : Noktasal kolon kesit indeksleri
+        colDirec (np.ndarray)    : Noktasal kolon yön indeksleri
+        colSpanTopo (np.ndarray) : Çizgisel kolon topolojisi
+        colSpanSize (np.ndarray) : Çizgisel kolon kesit indeksleri
+        tables (dict)            : build_rigidity_tables ile oluşturulan tablolar
+
+    Returns:
+        tuple: (A, Ix, Iy, It, xR, yR) (dm2, dm4, dm)
+            - It : Σ(Ix + Iy) + Σ A·r², r elemanın rijitlik merkezine uzaklığıdır
+            - xR, yR : Rijitlik merkezi; sistemde eleman yoksa kütle merkezi
+
+    Requires:
+        numpy as np
+    """
+    on_col   = colTopo == 1
+    on_span  = colSpanTopo == 1
+    node_idx = np.arange(colTopo.shape[-1])
+    span_idx = np.arange(colSpanTopo.shape[-1])
+
+    A  = np.concatenate([np.where(on_col, tables["col_A"][colSize], 0),
+                         np.where(on_span, tables["span_A"][span_idx, colSpanSize], 0)], axis=-1)
+    Ix = np.concatenate([np.where(on_col, tables["col_Ix"][node_idx, colDirec, colSize], 0),
+                         np.where(on_span, tables["span_Ix"][span_idx, colSpanSize], 0)], axis=-1)
+    Iy = np.concatenate([np.where(on_col, tables["col_Iy"][node_idx, colDirec, colSize], 0),
+                         np.where(on_span, tables["span_Iy"][span_idx, colSpanSize], 0)], axis=-1)
+
+    x, y   = tables["xy"][:, 0], tables["xy"][:, 1]
+    xG, yG = tables["massCentre"]
+
+    A_sum, Ix_sum, Iy_sum = A.sum(axis=-1), Ix.sum(axis=-1), Iy.sum(axis=-1)
+
+    # y yönündeki yatay rijitlik Ix ile, x yönündeki yatay rijitlik Iy ile orantılıdır
+    xR = np.where(Ix_sum > 0, (Ix * x).sum(axis=-1) / np.where(Ix_sum > 0, Ix_sum, 1), xG)
+    yR = np.where(Iy_sum > 0, (Iy * y).sum(axis=-1) / np.where(Iy_sum > 0, Iy_sum, 1), yG)
+
+    r2 = (x - np.expand_dims(xR, -1))**2 + (y - np.expand_dims(yR, -1))**2
+    It = Ix_sum + Iy_sum + (A * r2).sum(axis=-1)
+
+    return A_sum, Ix_sum, Iy_sum, It, xR, yR
+
+
+
+
+
+def build_rigidity_bounds(values, limMin, limMax):
+    """
+    Değerlerin sınırları ihlal oranlarını hesaplar. Alt sınır ihlali (1 - değer / alt sınır)
+    olarak alınır; böylece sistemde hiç eleman bulunmaması durumunda ceza sınırlı kalır.
+    NaN olan sınırlar uygulanmaz.
+
+    Args:
+        values (np.ndarray) : Değerler
+        limMin (float)      : Alt sınır
+        limMax (float)      : Üst sınır
+
+    Returns:
+        np.ndarray: İhlal oranları
+
+    Requires:
+        numpy as np
+    """
+    penalty = np.zeros(np.shape(values))
+    if not np.isnan(limMin): penalty += np.maximum(1 - values / limMin, 0)
+    if not np.isnan(limMax): penalty += np.maximum(values / limMax - 1, 0)
+    return penalty
+
+
+
+
+
+def build_rigidity_violation(A, Ix, Iy, It, xR, yR, tables):
+    """
+    Plan rijitlik kısıtlarının (36 - 40) ihlal oranlarının toplamını hesaplar.
+
+    Args:
+        A, Ix, Iy, It, xR, yR (np.ndarray) : build_rigidity_metrics ile hesaplanan değerler
+        tables (dict)                      : build_rigidity_tables ile oluşturulan tablolar
+
+    Returns:
+        np.ndarray: Rijitlik ceza değerleri
+
+    Requires:
+        numpy as np
+    """
+    lim    = tables["lim"]
+    xG, yG = tables["massCentre"]
+    Lx, Ly = tables["planDim"]
+
+    # 36. Kütle merkezi - rijitlik merkezi mesafesinin plan boyutuna oranı
+    penalty  = build_rigidity_bounds(np.abs(xR - xG) / Lx, np.nan, lim["max dRG"])
+    penalty += build_rigidity_bounds(np.abs(yR - yG) / Ly, np.nan, lim["max dRG"])
+    # 37. Toplam kolon alanı
+    penalty += build_rigidity_bounds(A, lim["min A"], lim["max A"])
+    # 38. x ve y yönlerindeki toplam atalet momentleri
+    penalty += build_rigidity_bounds(Ix, lim["min I"], lim["max I"])
+    penalty += build_rigidity_bounds(Iy, lim["min I"], lim["max I"])
+    # 39. Kuvvetli / zayıf yön atalet momenti oranı
+    I_weak = np.minimum(Ix, Iy)
+    rI     = np.where(I_weak > 0, np.maximum(Ix, Iy) / np.where(I_weak > 0, I_weak, 1), 1)
+    penalty += build_rigidity_bounds(rI, np.nan, lim["max rI"])
+    # 40. Burulma atalet momenti
+    penalty += build_rigidity_bounds(It, lim["min It"], lim["max It"])
+
+    return penalty
+
+
+
+
+
+def build_data_rigidity(cand, tables):
+    """
+    Çözüm adayının plan rijitlik ceza değerini hesaplar.
+
+    Args:
+        cand (list)   : Çözümün tasarım vektörü (manual_design_vector.md dosyasına bakınız)
+        tables (dict) : build_rigidity_tables ile oluşturulan tablolar
+
+    Returns:
+        float: Rijitlik kısıtlarının ihlal oranları toplamı
+
+    Requires:
+        none
+    """
+    metrics = build_rigidity_metrics(cand[0], cand[1], cand[2], cand[5], cand[6], tables)
+    return float(build_rigidity_violation(*metrics, tables))
@@ -0,0 +1,102 @@
+import numpy as np
+"""
+Required by:
+    build_sizing_beam_pairs
+    build_sizing_changes
+    build_data_sizing
+"""
+
+
+
+
+
+def build_sizing_beam_pairs(colTopo, colSpanTopo, beamTopo, spans, axNod, axSpan):
+    """
+    Aynı aks üzerinde bulunan ve aralarındaki düğümde kolon bulunmayan ardışık kiriş
+    çiftlerini bulur. Bu çiftlerin kesitlerinin ve kaçıklıklarının aynı olması beklenir.
+
+    Args:
+        colTopo (np.ndarray)     : Noktasal kolon topolojisi
+        colSpanTopo (np.ndarray) : Çizgisel kolon topolojisi
+        beamTopo (np.ndarray)    : Kiriş topolojisi
+        spans (np.ndarray)       : Aks parçalarının uç düğümlerini içeren dizi
+        axNod (list)             : Her bir aksın üzerinde bulunan düğümlerin indeksleri
+        axSpan (list)            : Her bir aksın üzerinde bulunan aks parçalarının indeksleri
+
+    Returns:
+        tuple: (left, right) ardışık kiriş çiftlerinin aks parçası indeksleri
+
+    Requires:
+        numpy as np
+    """
+    # Üzerinde noktasal kolon veya çizgisel kolon ucu bulunan düğümler
+    col_constrained = colTopo == 1
+    col_constrained[spans[colSpanTopo == 1].ravel()] = True
+
+    left, right = [], []
+    for nodes, ax_spans in zip(axNod, axSpan):
+        if len(ax_spans) < 2: continue
+        # j. ve j+1. aks parçaları arasındaki düğüm nodes[j+1]'dir
+        has_pair = (beamTopo[ax_spans[:-1]] == 1) & (beamTopo[ax_spans[1:]] == 1) & \
+                   ~col_constrained[nodes[1:-1]]
+        left.append(ax_spans[:-1][has_pair])
+        right.append(ax_spans[1:][has_pair])
+
+    if not left: return np.array([], dtype=int), np.array([], dtype=int)
+    return np.concatenate(left), np.concatenate(right)
+
+
+
+
+
+def build_sizing_changes(values, left, right):
+    """
+    Ardışık kiriş çiftlerinden değerleri (kesit veya kaçıklık) farklı olanların
+    sayısını döndürür.
+
+    Args:
+        values (np.ndarray) : Aks parçası başına kesit veya kaçıklık değerleri
+        left (np.ndarray)   : Çiftlerin ilk aks parçası indeksleri
+        right (np.ndarray)  : Çiftlerin ikinci aks parçası indeksleri
+
+    Returns:
+        int: Değeri değişen çift sayısı
+
+    Requires:
+        numpy as np
+    """
+    return int(np.count_nonzero(values[left] != values[right]))
+
+
+
+
+
+def build_data_sizing(cand, geoData):
+    """
+    Topolojisi sabitlenmiş bir çözüm adayının kesit ve kaçıklık (sizing) ceza değerlerini
+    hesaplar. Aralarında kolon bulunmayan komşu kirişlerin kesitlerinin (32) ve
+    kaçıklıklarının (31) farklı olması cezalandırılır.
+
+    Args:
+        cand (list)    : Çözümün tasarım vektörü (manual_design_vector.md dosyasına bakınız)
+        geoData (dict) : Yapının geometrik verileri (build_data_geometry'den gelir)
+
+    Returns:
+        Çözüm adayının kesit ve kaçıklık ceza değerleri
+
+    Requires:
+        none
+    """
+    colTopo     = cand[0]
+    colSpanTopo = cand[5]
+    beamTopo    = cand[8]
+    beamSize    = cand[9]
+    beamEcc     = cand[10]
+
+    left, right = build_sizing_beam_pairs(
+        colTopo, colSpanTopo, beamTopo, geoData["spans"], geoData["axNod"], geoData["axSpan"])
+
+    beam_size_changes = build_sizing_changes(beamSize, left, right)
+    beam_ecc_changes  = build_sizing_changes(beamEcc, left, right)
+
+    return beam_size_changes, beam_ecc_changes
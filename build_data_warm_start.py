@@ -0,0 +1,255 @@
+import numpy as np
+import json
+"""
+Required by:
+    build_warm_match
+    build_warm_span_match
+    build_warm_contBeam_match
+    build_warm_transfer
+    build_data_warm_start
+    load_warm_solution
+"""
+
+import func_optimization as funcOpti
+"""
+Required by:
+    build_data_warm_start
+"""
+
+import func_execution as execManager
+"""
+Required by:
+    load_warm_solution
+"""
+
+import build_data_problem as buildProblem
+"""
+Required by:
+    build_data_warm_start
+"""
+
+import build_data_repair as buildRepMask
+"""
+Required by:
+    build_data_warm_start
+"""
+
+import build_data_od_repair as buildODRepair
+"""
+Required by:
+    build_data_warm_start
+"""
+
+
+
+
+
+def build_warm_match(old_pts, new_pts, tol):
+    """
+    Yeni noktaları, tolerans içinde kalan en yakın eski noktalarla eşleştirir. Bir eski
+    nokta en fazla bir yeni noktayla eşleşir (en yakın olan).
+
+    Args:
+        old_pts (np.ndarray) : Eski planın nokta koordinatları (n_old, 2)
+        new_pts (np.ndarray) : Yeni planın nokta koordinatları (n_new, 2)
+        tol (float)          : Eşleşme için izin verilen en büyük mesafe
+
+    Returns:
+        np.ndarray: Her yeni nokta için eşleşen eski nokta indeksi (eşleşme yoksa -1)
+
+    Requires:
+        numpy as np
+    """
+    match = np.full(len(new_pts), -1, dtype=int)
+    if len(old_pts) == 0 or len(new_pts) == 0: return match
+
+    dist    = np.linalg.norm(new_pts[:, None, :] - old_pts[None, :, :], axis=2)
+    nearest = np.argmin(dist, axis=1)
+    ok      = dist[np.arange(len(new_pts)), nearest] <= tol
+
+    # eski nokta birden fazla yeni noktaya en yakınsa sadece en yakın olan eşleşir
+    for new_idx in np.argsort(dist[np.arange(len(new_pts)), nearest]):
+        if ok[new_idx] and nearest[new_idx] not in match:
+            match[new_idx] = nearest[new_idx]
+
+    return match
+
+
+
+
+
+def build_warm_span_match(old_spans, new_spans, node_match):
+    """
+    Yeni aks parçalarını, uç düğümleri eşleşen eski aks parçalarıyla eşleştirir.
+
+    Args:
+        old_spans (np.ndarray)  : Eski planın aks parçası uç düğümleri (n_old, 2)
+        new_spans (np.ndarray)  : Yeni planın aks parçası uç düğümleri (n_new, 2)
+        node_match (np.ndarray) : Yeni -> eski düğüm eşleşmesi (build_warm_match)
+
+    Returns:
+        np.ndarray: Her yeni aks parçası için eşleşen eski aks parçası indeksi (yoksa -1)
+
+    Requires:
+        numpy as np
+    """
+    old_lookup = {frozenset(pair): idx for idx, pair in enumerate(old_spans.tolist())}
+
+    match = np.full(len(new_spans), -1, dtype=int)
+    for idx, (n1, n2) in enumerate(new_spans):
+        o1, o2 = node_match[n1], node_match[n2]
+        if o1 == -1 or o2 == -1: continue
+        match[idx] = old_lookup.get(frozenset((o1, o2)), -1)
+
+    return match
+
+
+
+
+
+def build_warm_contBeam_match(old_contBeam, new_contBeam, span_match):
+    """
+    Yeni sürekli kiriş hatlarını, kiriş aks parçaları birebir eşleşen eski hatlarla
+    eşleştirir.
+
+    Args:
+        old_contBeam (list)     : Eski planın sürekli hat bilgisi
+        new_contBeam (list)     : Yeni planın sürekli hat bilgisi
+        span_match (np.ndarray) : Yeni -> eski aks parçası eşleşmesi
+
+    Returns:
+        np.ndarray: Her yeni hat için eşleşen eski hat indeksi (yoksa -1)
+
+    Requires:
+        numpy as np
+    """
+    old_lookup = {frozenset(cont["beam"].tolist()): idx for idx, cont in enumerate(old_contBeam)}
+
+    match = np.full(len(new_contBeam), -1, dtype=int)
+    for idx, cont in enumerate(new_contBeam):
+        mapped = span_match[cont["beam"]]
+        if len(mapped) == 0 or np.any(mapped == -1): continue
+        match[idx] = old_lookup.get(frozenset(mapped.tolist()), -1)
+
+    return match
+
+
+
+
+
+def build_warm_transfer(new_vec, old_vec, match):
+    """
+    Eşleşen elemanların eski değerlerini yeni vektöre aktarır.
+
+    Args:
+        new_vec (np.ndarray) : Yeni planın (varsayılan) değerleri
+        old_vec (np.ndarray) : Eski planın değerleri
+        match (np.ndarray)   : Yeni -> eski eleman eşleşmesi (-1: eşleşme yok)
+
+    Returns:
+        np.ndarray: Eşleşen elemanlarda eski değerleri içeren vektör
+
+    Requires:
+        numpy as np
+    """
+    vec = new_vec.copy()
+    ok  = match != -1
+    vec[ok] = np.asarray(old_vec)[match[ok]].astype(vec.dtype)
+    return vec
+
+
+
+
+
+def build_data_warm_start(old_geoData, old_contBeam, old_sol, geoData, xls, contBeam, repairMask, tol=30.0):
+    """
+    Mimar planda küçük değişiklikler yaptığında önceki en iyi çözümü yeni geometriye
+    aktarır. Düğümler ve alanlar (ağırlık merkezleri) koordinatlarına göre tolerans içinde,
+    aks parçaları uç düğümlerine, sürekli hatlar kiriş aks parçalarına göre eşleştirilir.
+    Eşleşmeyen elemanlar varsayılan çözümden (gen_default_sol) alınır; kesit ve yönler
+    yeni sınırlara kırpılır, kaçıklıklar en yakın seçeneğe yuvarlanır. Sonuç onarılarak
+    başlangıç popülasyonuna eklenebilir. Aktarım ayrık biçimde yapılır, sonuç kompakt
+    biçimdedir (funcOpti.encode_solution).
+
+    Args:
+        old_geoData (dict)  : Eski planın geometrik verileri
+        old_contBeam (list) : Eski planın sürekli hat bilgisi
+        old_sol (list)      : Eski planın en iyi tasarım vektörü
+        geoData (dict)      : Yeni planın geometrik verileri
+        xls (dict)          : read_XLS.read_XLS ile okunan ayarlar (xls) dosyası
+        contBeam (list)     : Yeni planın sürekli hat bilgisi
+        repairMask (dict)   : Yeni planın onarım maskeleri
+        tol (float)         : Koordinat eşleşme toleransı (plan birimi, örn: cm)
+
+    Returns:
+        tuple: (cand, matched)
+            - cand    : Onarılmış, yeni plana aktarılmış kompakt tasarım vektörü
+            - matched : Eşleşme oranları {"nodes", "spans", "areas", "contBeam"}
+
+    Requires:
+        numpy as np
+        func_optimization as funcOpti
+        build_data_problem as buildProblem
+        build_data_repair as buildRepMask
+        build_data_od_repair as buildODRepair
+    """
+    # 1. Eşleşmeler
+    node_match = build_warm_match(old_geoData["nodes"], geoData["nodes"], tol)
+    span_match = build_warm_span_match(old_geoData["spans"], geoData["spans"], node_match)
+    area_match = build_warm_match(old_geoData["areasG"], geoData["areasG"], tol)
+    cont_match = build_warm_contBeam_match(old_contBeam, contBeam, span_match)
+
+    # 2. Aktarım (0-4: düğüm, 5-10: aks parçası, 11: sürekli hat, 12: alan)
+    limits  = buildProblem.build_problem_limits(geoData, xls)
+    cand    = funcOpti.decode_solution(funcOpti.gen_default_sol(geoData, xls, len(contBeam)), limits)
+    matches = [node_match] * 5 + [span_match] * 6 + [cont_match, area_match]
+    cand    = [build_warm_transfer(new, old, m) for new, old, m in zip(cand, old_sol, matches)]
+
+    # 3. Yeni sınırlara uyarlama
+    nod_ax_lens = np.array([len(ax) for ax in geoData["nodAx"]])
+    cand[1]  = np.clip(cand[1], 0, len(xls["colSec"]["dL"]) - 1)
+    cand[2]  = np.minimum(cand[2], nod_ax_lens - 1)
+    cand[6]  = np.clip(cand[6], 0, len(xls["colSpanSec"]["width"]) - 1)
+    cand[9]  = np.clip(cand[9], 0, len(xls["beamSec"]["h"]) - 1)
+    cand[12] = np.clip(cand[12], 0, len(xls["slabSec"]["h"]) - 1)
+
+    # Kaçıklıklar en yakın seçeneğe yuvarlanır
+    cand = funcOpti.encode_solution(cand, limits)
+
+    # 4. Statik ve dinamik (on demand) onarımlar
+    cand    = buildRepMask.apply_repair(cand, repairMask)
+    od_mask = buildODRepair.build_data_od_repair(cand, geoData, contBeam)
+    cand    = buildODRepair.apply_od_repair(cand, od_mask)
+
+    matched = {
+        "nodes"    : float(np.mean(node_match != -1)),
+        "spans"    : float(np.mean(span_match != -1)),
+        "areas"    : float(np.mean(area_match != -1)),
+        "contBeam" : float(np.mean(cont_match != -1)) if len(cont_match) else 1.0
+    }
+    return cand, matched
+
+
+
+
+
+def load_warm_solution(path):
+    """
+    Önceki kampanyanın en iyi çözümünü okur: history_*.json raporunun
+    "best_solution_data" alanı veya temp_best_sol.json gibi tek bir çözüm.
+
+    Args:
+        path (str): JSON dosya yolu
+
+    Returns:
+        list: Tasarım vektörü (13 elemanlı np.ndarray listesi)
+
+    Requires:
+        json
+        func_execution as execManager
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    sol = data.get("best_solution_data", data)
+    return [np.asarray(sol[key]) for key in execManager.DESIGN_VECTOR_KEYS]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+import numpy as np
+
+"""
+Required by:
+    check_kernels
+"""
+
+import func_kernels as funcKernels
+"""
+Required by:
+    check_kernels
+"""
+
+import func_optimization as funcOpti
+"""
+Required by:
+    check_kernels
+"""
+
+import func_optimization_loop as optLoop
+"""
+Required by:
+    check_kernels
+"""
+
+def check_kernels(context, n_cands=50, seed=0):
+    """
+    Çekirdeklerin (kernel) referans build_data_* fonksiyonlarıyla aynı sonuçları verdiğini
+    rastgele üretilip onarılmış adaylar üzerinde denetler (funcKernels.check_kernel_parity).
+    Numba kurulu ise derlenmiş çekirdekler, değilse saf Python çekirdekler denetlenir.
+
+    Args:
+        context (dict): plastro.initialize_system ile üretilen statik veri paketi.
+        n_cands (int): Denetlenecek rastgele aday sayısı.
+        seed (int): Aday üretimi için tohum. Global RNG durumu denetim sonrası geri yüklenir.
+
+    Returns:
+        tuple: (backend, mismatch)
+            - backend (str): "numba" veya "python"
+            - mismatch (dict): Her çekirdek için uyuşmayan aday sayısı
+    """
+    optimizer = optLoop.StructuralOptimizer(
+        context["geoData"], context["xls"], context["contBeam"], context["slabProp"],
+        context["fit_span"], context["fit_node"], context["repairMask"], context.get("problem"))
+
+    rng_state = np.random.get_state()
+    np.random.seed(seed)
+    cands = []
+    for _ in range(n_cands):
+        raw = funcOpti.gen_rand_sol(optimizer.geoData, optimizer.xls, len(optimizer.contBeam))
+        cands.append(optimizer._process_candidate_pipeline(raw)[1])
+    np.random.set_state(rng_state)
+
+    backend = "numba" if funcKernels.HAVE_NUMBA else "python"
+    return backend, funcKernels.check_kernel_parity(optimizer.problem, cands)
+
+if __name__ == "__main__":
+    import plastro
+
+    script_path = os.path.dirname(os.path.abspath(__file__))
+    fileNameDXF = os.path.join(script_path, '_test.dxf')
+    fileNameXLS = os.path.join(script_path, '_test.xlsx')
+
+    backend, mismatch = check_kernels(plastro.initialize_system(fileNameDXF, fileNameXLS))
+
+    print(f"Çekirdek arka ucu: {backend}")
+    for key, count in mismatch.items(): print(f"{key:<20}: {count} uyuşmazlık")
+    if any(mismatch.values()):
+        print("\n❌ Çekirdekler referans fonksiyonlarla uyuşmuyor.")
+        sys.exit(1)
+    print("\n✅ Tüm çekirdekler referans fonksiyonlarla uyumlu.")
@@ -0,0 +1,148 @@
+import numpy as np
+"""
+Required by:
+    pack_topology
+    pack_candidate_topology
+    build_bit_buckets
+    bits_weighted_sum
+"""
+
+# np.bitwise_count NumPy 2.0 ile gelmiştir; eski sürümlerde 8 bitlik tablo kullanılır
+HAVE_BITWISE_COUNT = hasattr(np, "bitwise_count")
+POPCOUNT_TABLE     = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+"""
+Required by:
+    bits_weighted_sum
+"""
+
+# Paketli (bit) gösterim sadece bu sayıdan fazla eleman bulunan planlarda kullanılır;
+# küçük planlarda paketleme maliyeti kazançtan fazladır.
+BITS_MIN_ITEMS = 1024
+
+# -1/0/1 değerleri alabilen topoloji bileşenleri (contBeamTopo) iki bit düzlemiyle tutulur
+TERNARY_SEGMENTS = (11,)
+"""
+Required by:
+    pack_candidate_topology
+"""
+
+# Bit düzlemi (bit-plane) ile gösterilecek tamsayı ağırlıkların üst sınırı (bit sayısı)
+MAX_WEIGHT_BITS = 32
+"""
+Required by:
+    build_bit_buckets
+"""
+
+
+
+
+
+def pack_topology(topo):
+    """
+    Topoloji dizisini (1=var) 8 elemanı bir byte'a sığacak şekilde paketler.
+
+    Args:
+        topo (np.ndarray) : Topoloji dizisi (colTopo, colSpanTopo, beamTopo ...)
+
+    Returns:
+        np.ndarray: Paketli uint8 dizisi (uzunluk: ceil(len(topo) / 8))
+
+    Requires:
+        numpy as np
+    """
+    return np.packbits(np.asarray(topo) == 1)
+
+
+
+
+
+def pack_candidate_topology(cand, segments):
+    """
+    Tasarım vektörünün topoloji bileşenlerini tek bir byte dizisine paketler. -1/0/1
+    değerli bileşenler (TERNARY_SEGMENTS) için "1" ve "-1" düzlemleri ayrı paketlenir.
+    Anahtar üretimi ve işlemler arası aktarım için kullanılır.
+
+    Args:
+        cand (list)     : Tasarım vektörü
+        segments (list) : Paketlenecek bileşenler (örn: funcOpti.TOPO_SEGMENTS)
+
+    Returns:
+        bytes: Paketli topoloji
+
+    Requires:
+        numpy as np
+    """
+    parts = []
+    for seg in segments:
+        vec = np.asarray(cand[seg])
+        parts.append(np.packbits(vec == 1))
+        if seg in TERNARY_SEGMENTS: parts.append(np.packbits(vec == -1))
+    return np.concatenate(parts).tobytes() if parts else b""
+
+
+
+
+
+def build_bit_buckets(weights):
+    """
+    Eleman ağırlıklarını paketli maskelere (kova) ayırır; böylece Σ topo*weights
+    toplamı Σ coeff[k] * popcount(topo_bits & masks[k]) olarak hesaplanabilir.
+    Farklı değer sayısı azsa her değer bir kovadır; ağırlıklar tamsayı ise ağırlığın
+    her biti (bit düzlemi) bir kovadır. Hangisi daha az kova gerektiriyorsa o seçilir.
+
+    Args:
+        weights (np.ndarray) : Eleman başına ağırlıklar (örn: fit_span, fit_node)
+
+    Returns:
+        tuple | None: (coeff, masks); kesin sonuç veren bir ayrıştırma yoksa None
+            - coeff : Kova katsayıları (float)
+            - masks : Kova başına paketli maske (2B uint8 dizisi)
+
+    Requires:
+        numpy as np
+    """
+    weights = np.asarray(weights, dtype=float)
+    values  = np.unique(weights[weights != 0])
+
+    n_planes = None
+    if np.all(weights >= 0) and np.all(weights == np.round(weights)):
+        n_planes = int(weights.max()).bit_length() if len(values) else 0
+        if n_planes > MAX_WEIGHT_BITS: n_planes = None
+
+    if n_planes is not None and n_planes < len(values):
+        ints  = weights.astype(np.int64)
+        coeff = 2.0 ** np.arange(n_planes)
+        masks = [np.packbits(((ints >> b) & 1) == 1) for b in range(n_planes)]
+    elif len(values) <= (n_planes if n_planes is not None else MAX_WEIGHT_BITS):
+        coeff = values
+        masks = [np.packbits(weights == v) for v in values]
+    else:
+        return None
+
+    masks = np.array(masks, dtype=np.uint8).reshape(len(coeff), (len(weights) + 7) // 8)
+    return coeff, masks
+
+
+
+
+
+def bits_weighted_sum(words, buckets):
+    """
+    build_bit_buckets ile oluşturulan kovaları kullanarak paketli topolojinin ağırlıklı
+    toplamını hesaplar.
+
+    Args:
+        words (np.ndarray) : pack_topology ile paketlenmiş topoloji
+        buckets (tuple)    : build_bit_buckets çıktısı (coeff, masks)
+
+    Returns:
+        float: Σ topo * weights
+
+    Requires:
+        numpy as np
+    """
+    coeff, masks = buckets
+    if not len(coeff): return 0.0
+    if HAVE_BITWISE_COUNT: counts = np.bitwise_count(masks & words).sum(axis=1)
+    else: counts = POPCOUNT_TABLE[masks & words].sum(axis=1)
+    return float(coeff @ counts)
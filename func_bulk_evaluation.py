@@ -0,0 +1,179 @@
+import numpy as np
+import json
+import os
+import multiprocessing
+
+"""
+Required by:
+    load_design_vectors
+    bulk_evaluate
+    save_columnar
+"""
+
+import func_optimization as funcOpti
+"""
+Required by:
+    bulk_evaluate
+"""
+
+import func_optimization_loop as optLoop
+"""
+Required by:
+    _init_worker
+    bulk_evaluate
+"""
+
+import func_execution as execManager
+"""
+Required by:
+    load_design_vectors
+    save_columnar
+"""
+
+import build_data_penalty as buildPenalty
+"""
+Required by:
+    bulk_evaluate
+"""
+
+# Sonuç dosyasındaki fitness ve ceza sütunları
+FITNESS_KEYS = ["span_area_cost", "node_area_cost", "standalone_beam_cost", "crossing_beam_cost"]
+PENALTY_KEYS = buildPenalty.PENALTY_KEYS
+
+# İşçi (worker) sürecine ait optimizer (bkz. _init_worker)
+_OPTIMIZER = None
+
+def load_design_vectors(path):
+    """
+    Bir dosyadaki tasarım vektörlerini yükler.
+
+    Desteklenen biçimler:
+        - JSON rapor (history_*.json): individual_runs[*].final_solution
+        - JSON çözüm (temp_best_sol.json) veya bu çözümlerin listesi
+        - NPZ: DESIGN_VECTOR_KEYS anahtarlarında (N, n) boyutlu diziler
+          (save_columnar çıktısı dahil)
+
+    Args:
+        path (str): JSON veya NPZ dosya yolu.
+
+    Returns:
+        tuple: (labels, designs)
+            - labels (list): Her tasarımın etiketi (run_id veya sıra numarası).
+            - designs (list): Tasarım vektörleri (13 elemanlı np.ndarray listeleri).
+    """
+    keys = execManager.DESIGN_VECTOR_KEYS
+
+    if path.lower().endswith(".npz"):
+        data    = np.load(path)
+        n       = len(data[keys[0]])
+        labels  = list(data["label"]) if "label" in data else list(range(n))
+        designs = [[data[key][i] for key in keys] for i in range(n)]
+        return labels, designs
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and "individual_runs" in data:
+        entries = [(run["run_id"], run.get("final_solution")) for run in data["individual_runs"]]
+    elif isinstance(data, dict):
+        entries = [(0, data)]
+    else:
+        entries = list(enumerate(data))
+
+    labels, designs = [], []
+    for label, sol in entries:
+        if not isinstance(sol, dict): continue # başarısız koşum
+        labels.append(label)
+        designs.append([np.asarray(sol[key]) for key in keys])
+
+    return labels, designs
+
+def _init_worker(geoData, xls, contBeam, slabProp, fit_span, fit_node, repairMask, problem=None):
+    """
+    Süreç havuzu başlatıcısı: statik veriler her işçiye bir kez aktarılır ve işçi başına
+    bir StructuralOptimizer oluşturulur.
+    """
+    global _OPTIMIZER
+    _OPTIMIZER = optLoop.StructuralOptimizer(
+        geoData, xls, contBeam, slabProp, fit_span, fit_node, repairMask, problem)
+
+def _evaluate_design(cand):
+    """
+    İşçi sürecinde tek bir tasarımı onarır ve değerlendirir.
+
+    Returns:
+        tuple: (cand_final, fit_tuple, pen_tuple)
+    """
+    return _OPTIMIZER.evaluate_design(cand)
+
+def bulk_evaluate(input_path, output_path, context, parallel=True, processes=None, chunk_size=16):
+    """
+    Bir dosyadaki tasarım vektörlerini (örn: XLS sınırları değiştirildikten sonra) yeniden
+    puanlar: onarım + ceza + fitness + Lemonge. Lemonge amaç değerleri yüklenen tüm
+    tasarımlar bir popülasyon kabul edilerek hesaplanır.
+
+    Args:
+        input_path (str): Tasarım vektörlerini içeren JSON veya NPZ dosyası.
+        output_path (str): Sütunlu sonuç dosyası (.npz veya .csv).
+        context (dict): plastro.initialize_system ile üretilen statik veri paketi.
+        parallel (bool): True ise değerlendirme süreç havuzunda yapılır.
+        processes (int, optional): İşçi sayısı. Varsayılan: CPU sayısının %70'i.
+        chunk_size (int): Havuzda bir işçiye tek seferde gönderilen tasarım sayısı.
+
+    Returns:
+        dict: Sütunlar (label, FITNESS_KEYS, PENALTY_KEYS, objective ve onarılmış
+              tasarımlar için DESIGN_VECTOR_KEYS).
+    """
+    labels, designs = load_design_vectors(input_path)
+    if not designs: raise ValueError(f"Tasarım vektörü bulunamadı: {input_path}")
+
+    static = (context["geoData"], context["xls"], context["contBeam"], context["slabProp"],
+              context["fit_span"], context["fit_node"], context["repairMask"], context.get("problem"))
+
+    optimizer = optLoop.StructuralOptimizer(*static)
+
+    if parallel and len(designs) > 1:
+        processes = processes or max(1, int(multiprocessing.cpu_count() * 0.7))
+        with multiprocessing.Pool(processes=processes, initializer=_init_worker, initargs=static) as pool:
+            results = pool.map(_evaluate_design, designs, chunksize=chunk_size)
+    else:
+        results = [optimizer.evaluate_design(cand) for cand in designs]
+
+    # Lemonge amaç değerleri (tüm tasarımlar tek popülasyon)
+    records    = [funcOpti.Candidate(None, cand, fit, pen) for cand, fit, pen in results]
+    objectives = optimizer._calculate_lemonge_objectives(records)
+
+    fits = np.array([r.fit for r in records], dtype=float)
+    pens = np.array([r.pen for r in records], dtype=float)
+
+    columns = {"label": np.array(labels)}
+    columns.update({key: fits[:, i] for i, key in enumerate(FITNESS_KEYS)})
+    columns.update({key: pens[:, i] for i, key in enumerate(PENALTY_KEYS)})
+    columns["objective"] = np.asarray(objectives, dtype=float)
+    for i, key in enumerate(execManager.DESIGN_VECTOR_KEYS):
+        columns[key] = np.stack([r.processed[i] for r in records])
+
+    save_columnar(columns, output_path)
+    return columns
+
+def save_columnar(columns, output_path):
+    """
+    Sütunlu sonuçları kaydeder. NPZ dosyasına tüm sütunlar (tasarım vektörleri dahil),
+    CSV dosyasına sadece skaler sütunlar yazılır.
+
+    Args:
+        columns (dict): Sütun adı -> np.ndarray (ilk boyut tasarım sayısı).
+        output_path (str): .npz veya .csv dosya yolu.
+    """
+    out_dir = os.path.dirname(output_path)
+    if out_dir and not os.path.exists(out_dir): os.makedirs(out_dir, exist_ok=True)
+
+    if output_path.lower().endswith(".npz"):
+        np.savez_compressed(output_path, **columns)
+        return
+
+    scalar = [key for key, col in columns.items() if np.ndim(col) == 1]
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(",".join(scalar) + "\n")
+        for row in zip(*(columns[key] for key in scalar)):
+            f.write(",".join(str(v) for v in row) + "\n")
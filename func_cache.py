@@ -0,0 +1,277 @@
+import numpy as np
+import hashlib
+import sqlite3
+import time
+
+"""
+Required by:
+    project_hash
+    topology_key
+    evaluation_key
+    VisitedSet
+    EvaluationCache
+"""
+
+import func_optimization as funcOpti
+"""
+Required by:
+    topology_key
+    evaluation_key
+"""
+
+import func_bits as funcBits
+"""
+Required by:
+    topology_key
+    evaluation_key
+"""
+
+def project_hash(*paths):
+    """
+    Proje giriş dosyalarının (DXF, XLSX) içeriğinden sabit uzunluklu (8 byte) bir özet
+    üretir. Girdiler değişmediği sürece farklı koşum ve kampanyalarda aynı özet elde edilir.
+
+    Args:
+        *paths (str): Özete dahil edilecek dosyaların yolları (sıra önemlidir).
+
+    Returns:
+        bytes: Projenin içerik özeti.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.digest()
+
+def topology_key(cand, segments=None):
+    """
+    Onarılmış bir çözümün topoloji bileşenlerinden sabit uzunluklu (8 byte) bir anahtar
+    üretir. Aynı topolojiye sahip çözümler aynı anahtarı alır. Özet, bileşenlerin
+    paketli (bit) gösterimi üzerinden hesaplanır.
+
+    Args:
+        cand (list): Onarılmış tasarım vektörü.
+        segments (list, optional): Anahtara dahil edilecek bileşenler.
+                                   Varsayılan: funcOpti.TOPO_SEGMENTS.
+
+    Returns:
+        bytes: Çözümün topoloji anahtarı.
+    """
+    segments = funcOpti.TOPO_SEGMENTS if segments is None else segments
+
+    return hashlib.blake2b(funcBits.pack_candidate_topology(cand, segments), digest_size=8).digest()
+
+def evaluation_key(cand):
+    """
+    Onarılmış bir çözümün ceza ve fitness değerlerini belirleyen bileşenlerinden sabit
+    uzunluklu (8 byte) bir anahtar üretir: topoloji bileşenlerine ek olarak plan rijitlik
+    cezasını etkileyen kolon kesit ve yön bileşenleri (funcOpti.RIGIDITY_SEGMENTS).
+
+    Args:
+        cand (list): Onarılmış tasarım vektörü.
+
+    Returns:
+        bytes: Çözümün değerlendirme anahtarı.
+    """
+    h = hashlib.blake2b(funcBits.pack_candidate_topology(cand, funcOpti.TOPO_SEGMENTS), digest_size=8)
+    for seg in funcOpti.RIGIDITY_SEGMENTS:
+        h.update(np.ascontiguousarray(cand[seg]).tobytes())
+    return h.digest()
+
+class VisitedSet:
+    """
+    Bir koşum boyunca değerlendirilmiş (ziyaret edilmiş) çözümlerin anahtarlarını tutar.
+
+    Anahtarlar evaluation_key ile üretilen 8 byte'lık özetlerdir; bu sayede çözümün kendisi
+    saklanmadan tekrar eden tasarımlar değerlendirme öncesinde tespit edilebilir.
+    Tekrar (duplicate) sayaçları iterasyon bazında tutulur.
+    """
+
+    def __init__(self):
+        self.keys = set()
+        self.history = []   # Her iterasyon için [proposed, duplicates, skipped]
+        self._counts = [0, 0, 0]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def add(self, key):
+        """
+        Anahtarı kümeye ekler.
+
+        Args:
+            key (bytes): evaluation_key ile üretilmiş anahtar.
+
+        Returns:
+            bool: Anahtar daha önce ziyaret edilmemişse True.
+        """
+        if key in self.keys: return False
+        self.keys.add(key)
+        return True
+
+    def count(self, proposed=0, duplicates=0, skipped=0):
+        """
+        Mevcut iterasyonun sayaçlarını artırır.
+
+        Args:
+            proposed (int): Önerilen aday sayısı.
+            duplicates (int): Ziyaret edilmiş bir tasarıma onarılan aday sayısı.
+            skipped (int): Yeniden üretme hakkı bittiği için değerlendirilmeyen aday sayısı.
+        """
+        self._counts[0] += proposed
+        self._counts[1] += duplicates
+        self._counts[2] += skipped
+
+    def end_iteration(self):
+        """
+        Mevcut iterasyonun sayaçlarını tarihçeye ekler ve sıfırlar.
+
+        Returns:
+            float: İterasyondaki tekrar oranı (duplicates / proposed).
+        """
+        self.history.append(self._counts)
+        proposed, duplicates, _ = self._counts
+        self._counts = [0, 0, 0]
+        return duplicates / proposed if proposed else 0.0
+
+    def duplicate_rates(self):
+        """
+        Returns:
+            list: Her iterasyon için tekrar oranı.
+        """
+        return [d / p if p else 0.0 for p, d, _ in self.history]
+
+class EvaluationCache:
+    """
+    Koşumlar ve süreçler arasında paylaşılan, diskte (SQLite) tutulan değerlendirme önbelleği.
+
+    Anahtar, proje özeti (project_hash) ile onarılmış çözümün değerlendirme anahtarının
+    (evaluation_key) birleşimidir; değer ise fitness ve ceza dizileridir. Veritabanı WAL
+    kipinde açılır, böylece havuz (pool) işçileri aynı dosyayı eşzamanlı okuyup yazabilir.
+    Yazmalar flush_every kayıtta bir toplu olarak yapılır; kayıt sayısı max_entries'i
+    aşarsa en uzun süredir kullanılmayan kayıtlar silinir.
+
+    Bağlantı ilk kullanımda açılır; nesne pickle edilirken bağlantı ve bekleyen yazmalar
+    aktarılmaz (her süreç kendi bağlantısını açar).
+    """
+
+    def __init__(self, path, project, max_entries=1_000_000, flush_every=256, timeout=30.0):
+        """
+        Args:
+            path (str): SQLite veritabanı dosyasının yolu.
+            project (bytes): project_hash ile üretilmiş proje özeti.
+            max_entries (int): Saklanacak en fazla kayıt sayısı.
+            flush_every (int): Kaç yeni kayıtta bir diske yazılacağı.
+            timeout (float): Kilitli veritabanı için bekleme süresi (saniye).
+        """
+        self.path = path
+        self.project = project
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._pending = {}  # key -> (fit_bytes, pen_bytes)
+        self._used = set()  # Bu flush döneminde okunan anahtarlar (LRU için)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"], state["_pending"], state["_used"] = None, {}, set()
+        return state
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=self.timeout)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evals ("
+                "key BLOB PRIMARY KEY, fit BLOB NOT NULL, pen BLOB NOT NULL, last_used REAL NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS evals_last_used ON evals (last_used)")
+            self._conn.commit()
+        return self._conn
+
+    def key(self, cand):
+        """
+        Args:
+            cand (list): Onarılmış tasarım vektörü.
+
+        Returns:
+            bytes: Önbellek anahtarı (proje özeti + değerlendirme anahtarı).
+        """
+        return self.project + evaluation_key(cand)
+
+    def get(self, key):
+        """
+        Args:
+            key (bytes): key() ile üretilmiş anahtar.
+
+        Returns:
+            tuple | None: Kayıt varsa (fit_tuple, pen_tuple), yoksa None.
+        """
+        row = self._pending.get(key)
+        if row is None:
+            row = self._connect().execute("SELECT fit, pen FROM evals WHERE key = ?", (key,)).fetchone()
+            if row is not None: self._used.add(key)
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return np.frombuffer(row[0], dtype=float).copy(), np.frombuffer(row[1], dtype=float).copy()
+
+    def put(self, key, fit_tuple, pen_tuple):
+        """
+        Değerlendirme sonucunu yazma kuyruğuna ekler; kuyruk dolduysa diske yazar.
+
+        Args:
+            key (bytes): key() ile üretilmiş anahtar.
+            fit_tuple (np.ndarray): Fitness bileşenleri.
+            pen_tuple (np.ndarray): Ceza bileşenleri.
+        """
+        self._pending[key] = (np.asarray(fit_tuple, dtype=float).tobytes(),
+                              np.asarray(pen_tuple, dtype=float).tobytes())
+        if len(self._pending) >= self.flush_every: self.flush()
+
+    def flush(self):
+        """
+        Bekleyen kayıtları ve kullanım zamanlarını tek bir işlemde diske yazar, gerekirse
+        en eski kayıtları siler.
+        """
+        if not self._pending and not self._used: return
+        now  = time.time()
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO evals (key, fit, pen, last_used) VALUES (?, ?, ?, ?)",
+                [(k, fit, pen, now) for k, (fit, pen) in self._pending.items()])
+            conn.executemany("UPDATE evals SET last_used = ? WHERE key = ?", [(now, k) for k in self._used])
+
+            n_entries = conn.execute("SELECT COUNT(*) FROM evals").fetchone()[0]
+            if n_entries > self.max_entries:
+                conn.execute(
+                    "DELETE FROM evals WHERE key IN (SELECT key FROM evals ORDER BY last_used LIMIT ?)",
+                    (n_entries - self.max_entries,))
+        self._pending, self._used = {}, set()
+
+    def close(self):
+        """
+        Bekleyen kayıtları yazar ve bağlantıyı kapatır.
+        """
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def hit_rate(self):
+        """
+        Returns:
+            float: Önbellekten karşılanan sorguların oranı.
+        """
+        n = self.hits + self.misses
+        return self.hits / n if n else 0.0
@@ -97,16 +97,20 @@ def _worker_wrapper(func, static_kwargs, dynamic_args):
     Args:
         func (callable): Çalıştırılacak optimizasyon fonksiyonu (örn: optimization_task).
         static_kwargs (dict): Tüm koşumlar için sabit olan parametreler (config vb.).
-        dynamic_args (tuple): (seed, run_id) ikilisi.
+        dynamic_args (tuple): (seed, run_id) ikilisi veya (seed, run_id, task_kwargs) üçlüsü.
+                              task_kwargs, static_kwargs'ı bu koşum için günceller
+                              (racing: max_iter, state, return_state).
 
     Returns:
         dict: İşlem sonucunu içeren yapı:
             {
                 "payload": { ...meta veriler, skorlar, hatalar... },
-                "best_solution": ...ham en iyi çözüm...
+                "best_solution": ...ham en iyi çözüm...,
+                "state": ...optimizasyon durumu (return_state ise)...
             }
     """
-    seed, run_id = dynamic_args
+    seed, run_id = dynamic_args[:2]
+    task_kwargs  = {**static_kwargs, **(dynamic_args[2] if len(dynamic_args) > 2 else {})}
     np.random.seed(seed)
     
     start_time = time.time()
@@ -129,7 +133,7 @@ def _worker_wrapper(func, static_kwargs, dynamic_args):
 
     try:
         # func -> StructuralOptimizer.run çağrısı
-        output = func(seed=seed, run_id=run_id, **static_kwargs)
+        output = func(seed=seed, run_id=run_id, **task_kwargs)
         
         # Dönüş değerlerini ayıkla
         best_sol = output["best_sol"]
@@ -156,14 +160,15 @@ def _worker_wrapper(func, static_kwargs, dynamic_args):
         # Worker dönüş değeri
         worker_return = {
             "payload": result_payload,
-            "best_solution": best_sol
+            "best_solution": best_sol,
+            "state": output.get("state")
         }
         
     except Exception as e:
         result_payload["status"] = "failed"
         result_payload["error"] = str(e)
         logging.error(f"Run {run_id} failed: {e}")
-        worker_return = {"payload": result_payload, "best_solution": None}
+        worker_return = {"payload": result_payload, "best_solution": None, "state": None}
 
     end_time = time.time()
     end_mem = get_memory_usage()
@@ -173,7 +178,146 @@ def _worker_wrapper(func, static_kwargs, dynamic_args):
     
     return worker_return
 
-def run_optimization(optimization_func, num_runs=10, parallel=False, batch_size=50, output_dir="results", **params):
+def _execute_tasks(worker, tasks, parallel, batch_size, pbar, on_result=None):
+    """
+    Görevleri (tasks) seri veya paralel olarak, batch_size'lık gruplar halinde çalıştırır.
+
+    Args:
+        worker (callable): _worker_wrapper'ın partial ile sabitlenmiş hali.
+        tasks (list): Her biri worker'a iletilecek dynamic_args olan görev listesi.
+        parallel (bool): İşlemlerin paralel (multiprocessing) yapılıp yapılmayacağı.
+        batch_size (int): Bir seferde çalıştırılacak görev sayısı.
+        pbar (tqdm): İlerleme çubuğu.
+        on_result (callable, optional): Her sonuç için (batch tamamlandıkça) çağrılır.
+                                        Verilirse sonuçlar saklanmaz; bellek batch_size
+                                        ile sınırlı kalır.
+
+    Returns:
+        list: Görev sırasıyla worker dönüş değerleri (on_result verilmişse boş liste).
+    """
+    results = []
+
+    for i in range(0, len(tasks), batch_size):
+        batch_tasks = tasks[i : i + batch_size]
+
+        if parallel and len(tasks) > 1:
+            cpu_use = max(1, int(multiprocessing.cpu_count() * 0.7))
+            with multiprocessing.Pool(processes=cpu_use) as pool:
+                batch_results = list(pool.map(worker, batch_tasks))
+        else:
+            batch_results = [worker(args) for args in batch_tasks]
+
+        for res_wrap in batch_results:
+            pbar.update(1)
+            if on_result is not None: on_result(res_wrap)
+        if on_result is None: results.extend(batch_results)
+
+        del batch_results
+
+    return results
+
+def build_racing_rungs(num_runs, max_iter, eta):
+    """
+    Ardışık yarılama (successive halving) basamaklarını hesaplar. Her basamakta koşumların
+    en iyi 1/eta kadarı bir sonraki basamağa kalır; son basamakta kalan koşumlar toplam
+    max_iter iterasyona ulaşır. Bütçeler basamaktan basamağa kesin artandır; bu nedenle
+    basamak sayısı max_iter ile sınırlandırılır.
+
+    Args:
+        num_runs (int): Başlangıçtaki koşum sayısı.
+        max_iter (int): Son basamakta ulaşılacak toplam iterasyon sayısı.
+        eta (int): Eleme oranı (>= 2).
+
+    Returns:
+        list: Her basamak için (koşum sayısı, toplam iterasyon sayısı) ikilileri.
+
+    Raises:
+        ValueError: eta 2'den küçükse.
+    """
+    if eta < 2: raise ValueError(f"Racing eleme oranı (eta) en az 2 olmalıdır: {eta}")
+
+    n_rungs = 1
+    while num_runs // eta ** n_rungs >= 1: n_rungs += 1
+    n_rungs = max(1, min(n_rungs, max_iter))
+
+    rungs, prev_budget = [], 0
+    for k in range(n_rungs):
+        n_runs      = max(1, num_runs // eta ** k)
+        budget      = max(prev_budget + 1, int(round(max_iter / eta ** (n_rungs - 1 - k))))
+        prev_budget = budget
+        rungs.append((n_runs, budget))
+    return rungs
+
+def _run_racing(worker, tasks, parallel, batch_size, max_iter, eta):
+    """
+    Koşumları ardışık yarılama (racing) ile çalıştırır. Tüm koşumlar küçük bir iterasyon
+    bütçesi ile başlar; her basamak sonunda best_score'a göre en iyi koşumlar kalır ve
+    kaydedilmiş durumlarından (state) daha büyük bir bütçe ile devam ettirilir.
+
+    Args:
+        worker (callable): _worker_wrapper'ın partial ile sabitlenmiş hali.
+        tasks (list): (seed, run_id) görev listesi.
+        parallel (bool): İşlemlerin paralel yapılıp yapılmayacağı.
+        batch_size (int): Bir seferde çalıştırılacak görev sayısı.
+        max_iter (int): Son basamakta ulaşılacak toplam iterasyon sayısı.
+        eta (int): Eleme oranı.
+
+    Returns:
+        tuple: (results, racing_report)
+            - results (list): Her koşumun son worker dönüş değeri (görev sırasıyla).
+            - racing_report (dict): Basamaklar ve her basamakta elenen koşumlar.
+    """
+    rungs    = build_racing_rungs(len(tasks), max_iter, eta)
+    latest   = {}
+    elapsed  = {}
+    alive    = list(tasks)
+    prev     = 0
+    report   = {"eta": eta, "rungs": []}
+
+    pbar = tqdm(total=sum(n for n, _ in rungs), desc="🏁 Racing", unit="run")
+
+    for k, (n_runs, budget) in enumerate(rungs):
+        is_last = k == len(rungs) - 1
+        rung_tasks = [
+            (seed, run_id, {
+                "max_iter": budget - prev,
+                "state": latest[run_id]["state"] if run_id in latest else None,
+                "return_state": not is_last})
+            for seed, run_id in alive]
+
+        for (seed, run_id), res in zip(alive, _execute_tasks(worker, rung_tasks, parallel, batch_size, pbar)):
+            elapsed[run_id] = elapsed.get(run_id, 0) + res["payload"]["duration"]
+            res["payload"]["duration"] = elapsed[run_id]
+            res["payload"]["iterations"] = budget
+            latest[run_id] = res
+
+        score  = lambda task: latest[task[1]]["payload"]["best_score"]
+        ranked = sorted(alive, key=lambda task: np.inf if score(task) is None else score(task))
+        n_keep = len(ranked) if is_last else rungs[k + 1][0]
+
+        pruned = [{"run_id": run_id, "seed": int(seed), "best_score": score((seed, run_id))}
+                  for seed, run_id in ranked[n_keep:]]
+        for p in pruned: latest[p["run_id"]]["payload"]["pruned_at_rung"] = k
+
+        report["rungs"].append({
+            "rung": k,
+            "iterations": budget,
+            "runs": [run_id for _, run_id in alive],
+            "pruned": pruned})
+
+        alive, prev = ranked[:n_keep], budget
+        pbar.set_postfix({"Enİyi": f"{score(alive[0]):.4f}" if score(alive[0]) is not None else "-"})
+
+    pbar.close()
+
+    for res in latest.values():
+        res["payload"].setdefault("pruned_at_rung", None)
+        res["state"] = None
+
+    return [latest[run_id] for _, run_id in tasks], report
+
+def run_optimization(optimization_func, num_runs=10, parallel=False, batch_size=50, output_dir="results",
+                     racing=False, eta=3, **params):
     """
     Optimizasyon sürecini yöneten ana orkestratör fonksiyon.
 
@@ -187,12 +331,21 @@ def run_optimization(optimization_func, num_runs=10, parallel=False, batch_size=
         parallel (bool): İşlemlerin paralel (multiprocessing) yapılıp yapılmayacağı. Varsayılan: False.
         batch_size (int): Bellek şişmesini önlemek için işlemlerin kaçarlı gruplar halinde yapılacağı. Varsayılan: 50.
         output_dir (str): Sonuçların ve görsellerin kaydedileceği klasör yolu. Varsayılan: "results".
+        racing (bool): True ise koşumlar ardışık yarılama (successive halving) ile çalıştırılır;
+                       max_iter son basamakta kalan koşumların toplam iterasyon sayısıdır.
+                       optimization_func state/return_state parametrelerini desteklemelidir.
+                       Varsayılan: False.
+        eta (int): Racing modunda her basamakta kalan koşum oranı (1/eta). Varsayılan: 3.
         **params: Optimizasyon fonksiyonuna (worker'a) iletilecek ek parametreler (geoData vb.).
 
     Returns:
         dict: Tüm süreci özetleyen final raporu (istatistikler, en iyi çözüm, tüm run geçmişi).
+
+    Raises:
+        ValueError: Racing modunda eta 2'den küçükse.
     """
-    
+    if racing and eta < 2: raise ValueError(f"Racing eleme oranı (eta) en az 2 olmalıdır: {eta}")
+
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         
@@ -215,48 +368,42 @@ def run_optimization(optimization_func, num_runs=10, parallel=False, batch_size=
     all_meta_data = []
     success_count = 0
     
-    pbar = tqdm(total=num_runs, desc="🚀 İlerleme", unit="run")
-    
     tasks = list(zip(seeds, range(1, num_runs + 1)))
-    
-    for i in range(0, num_runs, batch_size):
-        batch_tasks = tasks[i : i + batch_size]
-        batch_results = []
+    worker = partial(_worker_wrapper, optimization_func, params)
+    racing_report = None
+
+    def collect(res_wrap, pbar=None):
+        nonlocal global_best_score, global_best_sol, success_count
+
+        res_payload = res_wrap["payload"]
+        best_sol = res_wrap["best_solution"]
         
-        worker = partial(_worker_wrapper, optimization_func, params)
+        all_meta_data.append(res_payload)
         
-        if parallel and num_runs > 1:
-            cpu_use = max(1, int(multiprocessing.cpu_count() * 0.7))
-            with multiprocessing.Pool(processes=cpu_use) as pool:
-                batch_results = list(pool.map(worker, batch_tasks))
-        else:
-            for args in batch_tasks:
-                batch_results.append(worker(args))
-                
-        for res_wrap in batch_results:
-            pbar.update(1)
-            
-            res_payload = res_wrap["payload"]
-            best_sol = res_wrap["best_solution"]
-            
-            all_meta_data.append(res_payload)
+        if res_payload["status"] == "success":
+            success_count += 1
+            score = res_payload["best_score"]
             
-            if res_payload["status"] == "success":
-                success_count += 1
-                score = res_payload["best_score"]
+            if score < global_best_score:
+                global_best_score = score
+                global_best_sol = best_sol
                 
-                if score < global_best_score:
-                    global_best_score = score
-                    global_best_sol = best_sol
-                    
-                    formatted_temp = format_solution_data(global_best_sol)
-                    save_to_json(formatted_temp, os.path.join(output_dir, "temp_best_sol.json"))
-                    
-                    pbar.set_postfix({"Enİyi": f"{global_best_score:.4f}"})
+                formatted_temp = format_solution_data(global_best_sol)
+                save_to_json(formatted_temp, os.path.join(output_dir, "temp_best_sol.json"))
+                
+                if pbar is not None: pbar.set_postfix({"Enİyi": f"{global_best_score:.4f}"})
 
-        del batch_results
-        
-    pbar.close()
+    if racing:
+        # Racing: koşumlar ancak son basamaktan sonra toplanır (elenenler dahil)
+        all_results, racing_report = _run_racing(
+            worker, tasks, parallel, batch_size, params["max_iter"], eta)
+        for res_wrap in all_results: collect(res_wrap)
+        del all_results
+    else:
+        # Sonuçlar batch tamamlandıkça toplanır; worker dönüş değerleri saklanmaz
+        pbar = tqdm(total=num_runs, desc="🚀 İlerleme", unit="run")
+        _execute_tasks(worker, tasks, parallel, batch_size, pbar, on_result=lambda r: collect(r, pbar))
+        pbar.close()
 
     valid_scores = [m["best_score"] for m in all_meta_data if m["best_score"] is not None]
     durations = [m["duration"] for m in all_meta_data]
@@ -278,6 +425,7 @@ def run_optimization(optimization_func, num_runs=10, parallel=False, batch_size=
         "best_solution_data": formatted_best_sol,
         "individual_runs": all_meta_data
     }
+    if racing_report is not None: final_report["racing"] = racing_report
     
     save_to_json(final_report, history_file)
     print(f"\nRapor: {history_file}")
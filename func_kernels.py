@@ -0,0 +1,369 @@
+import numpy as np
+"""
+Required by:
+    build_kernel_col_constrained
+    build_kernel_degree
+    build_kernel_col_constrained_batch
+    build_kernel_degree_batch
+    kernel_beam_length_penalty
+    kernel_beam_with_free_end
+    kernel_alone_beam
+    kernel_alone_col
+    kernel_crossing_beams
+    check_kernel_parity
+"""
+
+# Numba isteğe bağlıdır: kuruluysa çekirdekler (kernel) derlenir, değilse saf Python
+# fonksiyonları olarak kalır ve referans (build_data_*) fonksiyonları kullanılır.
+try:
+    import numba
+    HAVE_NUMBA = True
+    njit = numba.njit(cache=True, nogil=True)
+except ImportError:
+    HAVE_NUMBA = False
+    def njit(func): return func
+"""
+Required by:
+    kernel_beam_length_penalty
+    kernel_beam_with_free_end
+    kernel_alone_beam
+    kernel_alone_col
+    kernel_crossing_beams
+"""
+
+# *_problem fonksiyonları çekirdekleri sadece derlenmiş olduklarında kullanır
+USE_KERNELS = HAVE_NUMBA
+
+
+
+
+
+def build_kernel_col_constrained(colTopo, colSpanTopo, spans):
+    """
+    Üzerinde noktasal kolon veya çizgisel kolon ucu bulunan düğümler için True,
+    diğerleri için False döndürür.
+
+    Args:
+        colTopo (np.ndarray)     : Noktasal kolon varlık bilgisi (1=var, 0=yok)
+        colSpanTopo (np.ndarray) : Çizgisel kolon varlık bilgisi (1=var, 0=yok)
+        spans (np.ndarray)       : Aks parçalarının başlangıç ve bitiş düğüm indeksleri
+
+    Returns:
+        np.ndarray: Düğüm maskesi
+
+    Requires:
+        numpy as np
+    """
+    col_constrained = np.asarray(colTopo) == 1
+    col_constrained[spans[np.asarray(colSpanTopo) == 1].ravel()] = True
+    return col_constrained
+
+
+
+
+
+def build_kernel_degree(beamTopo, spans, n_nodes):
+    """
+    Her bir düğüme bağlı aktif kiriş sayısını döndürür.
+
+    Args:
+        beamTopo (np.ndarray) : Kiriş varlık bilgisi (1=var, 0=yok)
+        spans (np.ndarray)    : Aks parçalarının başlangıç ve bitiş düğüm indeksleri
+        n_nodes (int)         : Düğüm sayısı
+
+    Returns:
+        np.ndarray: Düğüm başına aktif kiriş sayısı
+
+    Requires:
+        numpy as np
+    """
+    return np.bincount(spans[np.asarray(beamTopo) == 1].ravel(), minlength=n_nodes)
+
+
+
+
+
+def build_kernel_col_constrained_batch(colTopo, colSpanTopo, spans):
+    """
+    build_kernel_col_constrained'in popülasyon (toplu) hali.
+
+    Args:
+        colTopo (np.ndarray)     : (P, n_nodes) noktasal kolon topolojileri
+        colSpanTopo (np.ndarray) : (P, n_spans) çizgisel kolon topolojileri
+        spans (np.ndarray)       : Aks parçalarının başlangıç ve bitiş düğüm indeksleri
+
+    Returns:
+        np.ndarray: (P, n_nodes) düğüm maskesi
+
+    Requires:
+        numpy as np
+    """
+    col_constrained = np.asarray(colTopo) == 1
+    rows, cols = np.nonzero(np.asarray(colSpanTopo) == 1)
+    col_constrained[rows, spans[cols, 0]] = True
+    col_constrained[rows, spans[cols, 1]] = True
+    return col_constrained
+
+
+
+
+
+def build_kernel_degree_batch(beamTopo, spans, n_nodes):
+    """
+    build_kernel_degree'nin popülasyon (toplu) hali.
+
+    Args:
+        beamTopo (np.ndarray) : (P, n_spans) kiriş topolojileri
+        spans (np.ndarray)    : Aks parçalarının başlangıç ve bitiş düğüm indeksleri
+        n_nodes (int)         : Düğüm sayısı
+
+    Returns:
+        np.ndarray: (P, n_nodes) düğüm başına aktif kiriş sayısı
+
+    Requires:
+        numpy as np
+    """
+    n_pop      = len(beamTopo)
+    rows, cols = np.nonzero(np.asarray(beamTopo) == 1)
+    flat_nodes = (rows[:, None] * n_nodes + spans[cols]).ravel()
+    return np.bincount(flat_nodes, minlength=n_pop * n_nodes).reshape(n_pop, n_nodes)
+
+
+
+
+
+@njit
+def kernel_beam_length_penalty(colTopo, colSpanTopo, beamTopo, ax_ptr, ax_span, ax_end_nod, ax_seg_len,
+                               beamLenLimMin, beamLenLimMax):
+    """
+    build_penalty_beam_lengths'in düz aks tablosu üzerinde çalışan döngü (kernel) hali.
+    Kiriş; çizgisel kolon bulunan, kiriş bulunmayan aks parçalarında, noktasal kolon
+    bulunan düğümlerde veya aks sonunda sona erer.
+
+    Args:
+        colTopo, colSpanTopo, beamTopo (np.ndarray) : Topoloji dizileri
+        ax_ptr, ax_span, ax_end_nod, ax_seg_len (np.ndarray) : build_problem_axis_table
+        beamLenLimMin (float) : Kiriş uzunluğu alt sınırı
+        beamLenLimMax (float) : Kiriş uzunluğu üst sınırı
+
+    Returns:
+        float: Uzunluk sınırlarını ihlal eden kirişlerin ihlal oranları toplamı
+
+    Requires:
+        numba (isteğe bağlı)
+    """
+    penalty = 0.0
+    for a in range(len(ax_ptr) - 1):
+        current = 0.0
+        for k in range(ax_ptr[a], ax_ptr[a + 1] + 1):
+            end = False
+            if k == ax_ptr[a + 1]:
+                end = True # aks sonu
+            else:
+                span = ax_span[k]
+                if colSpanTopo[span] == 1 or beamTopo[span] != 1:
+                    end = True
+                else:
+                    current += ax_seg_len[k]
+                    end = colTopo[ax_end_nod[k]] == 1
+
+            if end and current > 0:
+                if current < beamLenLimMin: penalty += beamLenLimMin / current - 1
+                elif current > beamLenLimMax: penalty += current / beamLenLimMax - 1
+                current = 0.0
+    return penalty
+
+
+
+
+
+@njit
+def kernel_beam_with_free_end(col_constrained, degree, beamTopo, spans, spanLen):
+    """
+    build_penalty_beam_with_free_end'in döngü (kernel) hali. Bir uç; kolon varsa veya
+    başka bir kiriş bağlıysa (düğüm derecesi >= 2) tutuludur.
+
+    Args:
+        col_constrained (np.ndarray) : build_kernel_col_constrained
+        degree (np.ndarray)          : build_kernel_degree
+        beamTopo (np.ndarray)        : Kiriş varlık bilgisi (1=var, 0=yok)
+        spans (np.ndarray)           : Aks parçalarının başlangıç ve bitiş düğüm indeksleri
+        spanLen (np.ndarray)         : Her bir aks parçasının uzunluğu
+
+    Returns:
+        float: En az bir ucu serbest olan kirişlerin toplam uzunluğu
+
+    Requires:
+        numba (isteğe bağlı)
+    """
+    total_len = 0.0
+    for i in range(len(beamTopo)):
+        if beamTopo[i] != 1: continue
+        n1, n2 = spans[i, 0], spans[i, 1]
+        n1_constrained = col_constrained[n1] or degree[n1] >= 2
+        n2_constrained = col_constrained[n2] or degree[n2] >= 2
+        if not (n1_constrained and n2_constrained): total_len += spanLen[i]
+    return total_len
+
+
+
+
+
+@njit
+def kernel_alone_beam(col_constrained, degree, beamTopo, spans):
+    """
+    build_od_mask_alone_beam'in döngü (kernel) hali: her iki ucunda da kolon veya başka
+    bir kiriş bulunmayan kirişler için True.
+
+    Args:
+        col_constrained (np.ndarray) : build_kernel_col_constrained
+        degree (np.ndarray)          : build_kernel_degree
+        beamTopo (np.ndarray)        : Kiriş varlık bilgisi (1=var, 0=yok)
+        spans (np.ndarray)           : Aks parçalarının başlangıç ve bitiş düğüm indeksleri
+
+    Returns:
+        np.ndarray: True/False maskesi
+
+    Requires:
+        numba (isteğe bağlı)
+    """
+    mask = np.zeros(len(beamTopo), dtype=np.bool_)
+    for i in range(len(beamTopo)):
+        if beamTopo[i] != 1: continue
+        n1, n2 = spans[i, 0], spans[i, 1]
+        if col_constrained[n1] or col_constrained[n2]: continue
+        if degree[n1] < 2 and degree[n2] < 2: mask[i] = True
+    return mask
+
+
+
+
+
+@njit
+def kernel_alone_col(colTopo, beamTopo, nod_ptr, nod_span):
+    """
+    build_od_mask_remove_alone_col'un döngü (kernel) hali: kendisine hiç kiriş bağlı
+    olmayan noktasal kolonlar için True.
+
+    Args:
+        colTopo (np.ndarray)  : Noktasal kolon varlık bilgisi (1=var, 0=yok)
+        beamTopo (np.ndarray) : Kiriş varlık bilgisi (1=var, 0=yok)
+        nod_ptr, nod_span (np.ndarray) : build_problem_nodSpan_csr
+
+    Returns:
+        np.ndarray: True/False maskesi
+
+    Requires:
+        numba (isteğe bağlı)
+    """
+    mask = np.zeros(len(colTopo), dtype=np.bool_)
+    for n in range(len(colTopo)):
+        if colTopo[n] != 1: continue
+        has_beam = False
+        for k in range(nod_ptr[n], nod_ptr[n + 1]):
+            if beamTopo[nod_span[k]] == 1:
+                has_beam = True
+                break
+        if not has_beam: mask[n] = True
+    return mask
+
+
+
+
+
+@njit
+def kernel_crossing_beams(col_constrained, beamTopo, nod_ptr, nod_span, spanAx, spanLen):
+    """
+    build_fitness_crossing_beams'in döngü (kernel) hali: kolon bulunmayan ve en az iki
+    farklı aks üzerinde kiriş bağlanan düğümlere bağlanan kirişlerin toplam uzunluğu.
+
+    Args:
+        col_constrained (np.ndarray)   : build_kernel_col_constrained
+        beamTopo (np.ndarray)          : Kiriş varlık bilgisi (1=var, 0=yok)
+        nod_ptr, nod_span (np.ndarray) : build_problem_nodSpan_csr
+        spanAx (np.ndarray)            : Her bir aks parçasının üzerinde bulunduğu aks
+        spanLen (np.ndarray)           : Her bir aks parçasının uzunluğu
+
+    Returns:
+        float: Kolon bulunmayan düğümlere saplanan kirişlerin toplam uzunluğu
+
+    Requires:
+        numba (isteğe bağlı)
+    """
+    fitness = 0.0
+    for n in range(len(col_constrained)):
+        if col_constrained[n]: continue
+        first_ax, crossing, length = -1, False, 0.0
+        for k in range(nod_ptr[n], nod_ptr[n + 1]):
+            span = nod_span[k]
+            if beamTopo[span] != 1: continue
+            length += spanLen[span]
+            if first_ax == -1: first_ax = spanAx[span]
+            elif spanAx[span] != first_ax: crossing = True
+        if crossing: fitness += length
+    return fitness
+
+
+
+
+
+def check_kernel_parity(problem, cands, rtol=1e-9):
+    """
+    Çekirdeklerin (kernel) referans build_data_* fonksiyonlarıyla aynı sonuçları verdiğini
+    verilen tasarım vektörleri üzerinde denetler. Numba kurulu değilse çekirdekler saf
+    Python olarak çalıştırılır (mantık denetimi).
+
+    Args:
+        problem (dict) : build_data_problem ile oluşturulan problem paketi
+        cands (list)   : Onarılmış tasarım vektörleri
+        rtol (float)   : Ondalıklı sonuçlar için bağıl tolerans (toplama sırası farkı)
+
+    Returns:
+        dict: Her çekirdek için uyuşmayan aday sayısı
+
+    Requires:
+        numpy as np
+    """
+    import build_data_penalty as buildPenalty
+    import build_data_fitness as buildFit
+    import build_data_od_repair as buildODRepair
+
+    spans, nodSpan = problem["spans"], problem["nodSpan"]
+    axis_table = (problem["ax_ptr"], problem["ax_span"], problem["ax_end_nod"], problem["ax_seg_len"])
+    nod_csr    = (problem["nod_ptr"], problem["nod_span"])
+
+    mismatch = dict.fromkeys(
+        ["beam_length", "beam_with_free_end", "alone_beam", "alone_col", "crossing_beams"], 0)
+
+    for cand in cands:
+        colTopo, colSpanTopo, beamTopo = cand[0], cand[5], cand[8]
+        col_constrained = build_kernel_col_constrained(colTopo, colSpanTopo, spans)
+        degree          = build_kernel_degree(beamTopo, spans, len(colTopo))
+
+        pairs = {
+            "beam_length": (
+                kernel_beam_length_penalty(colTopo, colSpanTopo, beamTopo, *axis_table,
+                    problem["beamLenLimMin"], problem["beamLenLimMax"]),
+                buildPenalty.build_penalty_beam_lengths(colTopo, colSpanTopo, beamTopo, problem["axNod"],
+                    problem["nodeDist"], problem["axSpan"], problem["beamLenLimMin"], problem["beamLenLimMax"])),
+            "beam_with_free_end": (
+                kernel_beam_with_free_end(col_constrained, degree, beamTopo, spans, problem["spanLen"]),
+                buildPenalty.build_penalty_beam_with_free_end(colTopo, colSpanTopo, beamTopo, spans, problem["spanLen"])),
+            "alone_beam": (
+                kernel_alone_beam(col_constrained, degree, beamTopo, spans),
+                buildODRepair.build_od_mask_alone_beam(colTopo, colSpanTopo, beamTopo, spans)),
+            "alone_col": (
+                kernel_alone_col(colTopo, beamTopo, *nod_csr),
+                buildODRepair.build_od_mask_remove_alone_col(colTopo, beamTopo, nodSpan)),
+            "crossing_beams": (
+                kernel_crossing_beams(col_constrained, beamTopo, *nod_csr, problem["spanAx"], problem["spanLen"]),
+                buildFit.build_fitness_crossing_beams(colTopo, colSpanTopo, beamTopo, spans, nodSpan,
+                    problem["spanAx"], problem["spanLen"]))
+        }
+
+        for key, (kernel_out, ref_out) in pairs.items():
+            if np.asarray(ref_out).dtype == bool: same = np.array_equal(kernel_out, ref_out)
+            else: same = np.isclose(kernel_out, ref_out, rtol=rtol, atol=0)
+            mismatch[key] += int(not same)
+
+    return mismatch
@@ -2,6 +2,9 @@ import numpy as np
 """
 Required by:
     round_array
+    csr_from_lists
+    csr_row_ids
+    csr_segment_sum
 """
 
 import time
@@ -107,4 +110,73 @@ def apply_masks(cand, idx_list, mask_list, option_list):
         
         cand_copy[idx] = target
     
-    return cand_copy
\ No newline at end of file
+    return cand_copy
+
+
+
+
+def csr_from_lists(lists):
+    """
+    İndeks listelerinden oluşan bir listeyi (örn: nodSpan) sıkıştırılmış satır (CSR)
+    biçimine dönüştürür. i. satırın elemanları indices[indptr[i]:indptr[i+1]] aralığındadır.
+
+    Args:
+        lists (list[np.ndarray]): Her satır için indeks dizisi.
+
+    Returns:
+        tuple: (indptr, indices) int64 diziler.
+
+    Requires:
+        numpy
+    """
+    indptr = np.zeros(len(lists) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(row) for row in lists])
+    indices = np.concatenate([np.asarray(row, dtype=np.int64) for row in lists]) \
+              if len(lists) else np.zeros(0, dtype=np.int64)
+    return indptr, indices
+
+
+
+
+
+def csr_row_ids(indptr):
+    """
+    CSR biçimindeki her elemanın ait olduğu satırın indeksini döndürür.
+
+    Args:
+        indptr (np.ndarray): CSR satır işaretçileri.
+
+    Returns:
+        np.ndarray: (nnz,) satır indeksleri.
+
+    Requires:
+        numpy
+    """
+    return np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+
+
+
+
+def csr_segment_sum(values, rows, n_rows):
+    """
+    CSR elemanlarına ait değerleri satır bazında toplar (segment reduction). values
+    tek bir dizi (nnz,) veya popülasyon için (P, nnz) boyutlu olabilir.
+
+    Args:
+        values (np.ndarray): Elemanların değerleri.
+        rows (np.ndarray): csr_row_ids ile bulunan satır indeksleri.
+        n_rows (int): Satır sayısı.
+
+    Returns:
+        np.ndarray: (n_rows,) veya (P, n_rows) satır toplamları.
+
+    Requires:
+        numpy
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1: return np.bincount(rows, weights=values, minlength=n_rows)
+
+    offsets = np.arange(len(values))[:, None] * n_rows
+    sums    = np.bincount((offsets + rows).ravel(), weights=values.ravel(), minlength=len(values) * n_rows)
+    return sums.reshape(len(values), n_rows)
\ No newline at end of file
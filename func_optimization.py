@@ -7,15 +7,44 @@ Required by:
     build_ecc_choices
     generate_random_sol
     gen_rand_sol
+    gen_default_sol
+    Candidate
     ejaya
+    ejaya_member
     interpret_solution
     evaluate_solution
     find_worst_fitness
     normalize_fitness_values
     sync_raw_from_repaired
+    encode_solution
+    decode_solution
     _stochastic_round
 """
 
+# Tasarım vektöründe topolojiyi (varlık/yokluk) ve kesit/yön/kaçıklığı tutan bileşenler
+TOPO_SEGMENTS   = [0, 5, 8, 11]
+SIZING_SEGMENTS = [1, 2, 3, 4, 6, 7, 9, 10, 12]
+
+# Topoloji dışında ceza değerlerini (plan rijitliği) etkileyen bileşenler: colSize, colDirec, colSpanSize
+RIGIDITY_SEGMENTS = [1, 2, 6]
+
+# Kesit optimizasyonunda (2. aşama) amaç fonksiyonunun puanladığı bileşenler:
+# plan rijitliği (RIGIDITY_SEGMENTS) ile build_data_sizing'in kullandığı beamSize ve beamEcc
+SIZING_SCORED_SEGMENTS = sorted(RIGIDITY_SEGMENTS + [9, 10])
+
+# Onarılmış (kompakt) tasarım vektörü bileşenlerinin veri tipleri: topoloji uint8,
+# sürekli hat int8 (-1/0/1), kesit int16, yön ve kaçıklık indeksi int8
+SEGMENT_DTYPES = [
+    np.uint8, np.int16, np.int8, np.int8, np.int8,
+    np.uint8, np.int16, np.int8,
+    np.uint8, np.int16, np.int8,
+    np.int8,
+    np.int16
+]
+
+# Kompakt vektörde kaçıklık seçeneği indeksi tutan bileşenler ve seçeneklerin limits anahtarları
+ECC_SEGMENTS = {3: "col_ecc_choices", 4: "col_ecc_choices", 7: "col_span_ecc_choices", 10: "beam_ecc_choices"}
+
 def build_ecc_choices(interval):
     """
     Belirtilen aralık değerine göre olası eksantriklik (kaçıklık) seçeneklerini oluşturur.
@@ -114,6 +143,75 @@ def gen_rand_sol(geoData, xls, contBeamLen):
         slabSec    = xls["slabSec"]["h"]
     )
 
+def gen_default_sol(geoData, xls, contBeamLen):
+    """
+    Tüm elemanların bulunmadığı, kesit ve yönler için ilk seçeneğin, kaçıklıklar için
+    sıfıra en yakın seçeneğin kullanıldığı deterministik bir çözüm vektörü üretir.
+    Vektör kompakt biçimdedir (bkz. SEGMENT_DTYPES, ECC_SEGMENTS).
+
+    Args:
+        geoData (dict): Geometrik veriler.
+        xls (dict): Excel'den okunan kısıt ve kesit verileri.
+        contBeamLen (int): Sürekli kiriş sayısı.
+
+    Returns:
+        list: Varsayılan (kompakt) çözüm vektörü.
+    """
+    n_nodes, n_spans = len(geoData["nodes"]), len(geoData["spans"])
+
+    def center_ecc(interval):
+        return len(build_ecc_choices(interval)) // 2
+
+    sizes = [n_nodes] * 5 + [n_spans] * 6 + [contBeamLen, len(geoData["areas"])]
+    sol   = [np.zeros(size, dtype=dtype) for size, dtype in zip(sizes, SEGMENT_DTYPES)]
+
+    sol[3][:]  = center_ecc(xls["eccIntervals"]["col"])
+    sol[4][:]  = center_ecc(xls["eccIntervals"]["col"])
+    sol[7][:]  = center_ecc(xls["eccIntervals"]["colSpan"])
+    sol[10][:] = center_ecc(xls["eccIntervals"]["beam"])
+    return sol
+
+# -------------------------------------------------
+# ------------------- CANDIDATE -------------------
+# -------------------------------------------------
+
+class Candidate:
+    """
+    Popülasyon bireyi: ham vektör, onarılmış vektör ve değerlendirme sonuçları.
+
+    __slots__ sayesinde birey başına sözlük (__dict__) oluşturulmaz. Yeni üretilen
+    (henüz değerlendirilmemiş) adaylarda sadece raw doludur; diğer alanlar aday
+    değerlendirildiğinde doldurulur.
+
+    Attributes:
+        raw (list): Ham (sürekli) tasarım vektörü; e-JAYA hareketi bunun üzerinde yapılır.
+        processed (list): Yorumlanmış ve onarılmış kompakt tasarım vektörü.
+        fit (np.ndarray): Fitness bileşenleri.
+        pen (np.ndarray): Ceza bileşenleri.
+        obj (float): Lemonge amaç değeri (değerlendirildiği popülasyona göre).
+        key (bytes): Onarılmış vektörün değerlendirme anahtarı (funcCache.evaluation_key).
+    """
+    __slots__ = ("raw", "processed", "fit", "pen", "obj", "key")
+
+    def __init__(self, raw, processed=None, fit=None, pen=None, obj=None, key=None):
+        self.raw       = raw
+        self.processed = processed
+        self.fit       = fit
+        self.pen       = pen
+        self.obj       = obj
+        self.key       = key
+
+    def clone(self):
+        """
+        Bireyin ucuz bir kopyasını döndürür. Bileşen dizileri kopyalanmaz, paylaşılır;
+        diziler yerinde değiştirilmediği (her işlem yeni dizi ürettiği) için güvenlidir.
+
+        Returns:
+            Candidate: Yeni birey.
+        """
+        return Candidate(list(self.raw), None if self.processed is None else list(self.processed),
+                         self.fit, self.pen, self.obj, self.key)
+
 # -------------------------------------------------
 # --------------- GENERAL OPERATORS ---------------
 # -------------------------------------------------
@@ -144,7 +242,7 @@ def bestWorst(pop):
     Returns:
         tuple: (bestSol, worstSol)
     """
-    fitVals  = np.array([sol[-1] for sol in pop])
+    fitVals  = np.array([sol.obj for sol in pop])
     bestSol  = pop[np.argmin(fitVals)]
     worstSol = pop[np.argmax(fitVals)]
     return bestSol, worstSol
@@ -159,10 +257,9 @@ def findMean(pop):
     Returns:
         list: Ortalama değerlerden oluşan çözüm vektörü.
     """
-    meanSol, popVec = [], [sol[0] for sol in pop]
+    meanSol, popVec = [], [sol.raw for sol in pop]
     for i in range(len(popVec[0])):
         meanSol.append(np.mean([vec[i] for vec in popVec], axis=0))
-    meanSol.extend([np.nan, np.nan, np.nan])
     return meanSol
 
 def randVecs(cand):
@@ -170,12 +267,12 @@ def randVecs(cand):
     Verilen aday çözümün boyutlarına uygun rastgele (0-1 arası) vektörler üretir.
 
     Args:
-        cand (list): Referans aday çözüm.
+        cand (Candidate): Referans aday çözüm.
 
     Returns:
         list: Rastgele sayılardan oluşan vektörler listesi.
     """
-    return [np.random.rand(len(vec)) for vec in cand[0]]
+    return [np.random.rand(len(vec)) for vec in cand.raw]
 
 # --------------------------------------------------
 # ----------------- METAHEURISTICS -----------------
@@ -195,34 +292,74 @@ def ejaya(pop, hPop):
     Returns:
         tuple: (candPop, histPop) -> Yeni aday popülasyonu ve güncellenmiş tarihçe.
     """
-    if np.random.rand() > 0.5 : histPop = copy.deepcopy(hPop)
-    else                      : histPop = copy.deepcopy(pop)
+    if np.random.rand() > 0.5 : histPop = [sol.clone() for sol in hPop]
+    else                      : histPop = [sol.clone() for sol in pop]
     random.shuffle(histPop)
 
     bestSol, worstSol = bestWorst(pop) 
     
     r3, r4  = np.random.rand(), np.random.rand()
     meanSol = findMean(pop)
-    Pu      = addVecs ( scaVec(r3, bestSol[0]),  scaVec(1-r3, meanSol[0]) )
-    Pl      = addVecs ( scaVec(r4, worstSol[0]), scaVec(1-r4, meanSol[0]) )
+    Pu      = addVecs ( scaVec(r3, bestSol.raw),  scaVec(1-r3, meanSol[0]) )
+    Pl      = addVecs ( scaVec(r4, worstSol.raw), scaVec(1-r4, meanSol[0]) )
 
     candPop = []
     
     for i,sol in enumerate(pop):
-        if np.random.rand() > 0.5:
-            r5, r6 = randVecs(sol), randVecs(sol)
-            ex1    = mulVecs(r5, subVecs(Pu, sol[0]))
-            ex2    = mulVecs(r6, subVecs(Pl, sol[0]))
-            cand   = subVecs( addVecs(sol[0], ex1), ex2 )
-        else:
-            k    = np.random.randn()
-            ex1  = subVecs(histPop[i][0], sol[0])
-            cand = addVecs(sol[0], scaVec(k, ex1))
-        
-        candPop.append([cand, np.nan, np.nan, np.nan])
+        cand = _ejaya_move(sol, histPop[i], Pu, Pl)
+        candPop.append(Candidate(cand))
     
     return candPop, histPop
 
+def ejaya_member(pop, hPop, i):
+    """
+    e-JAYA hareket operatörünü tek bir birey için yeniden uygular. Üretilen aday daha önce
+    ziyaret edilmiş bir tasarıma onarıldığında adayı yeniden üretmek için kullanılır.
+
+    Args:
+        pop (list): Mevcut popülasyon.
+        hPop (list): Tarihçe (önceki iterasyon) popülasyonu.
+        i (int): Yeni aday üretilecek bireyin indeksi.
+
+    Returns:
+        list: Bireyin yeni ham aday vektörü.
+    """
+    histPop = hPop if np.random.rand() > 0.5 else pop
+    hist    = histPop[np.random.randint(len(histPop))]
+
+    bestSol, worstSol = bestWorst(pop)
+
+    r3, r4  = np.random.rand(), np.random.rand()
+    meanSol = findMean(pop)
+    Pu      = addVecs ( scaVec(r3, bestSol.raw),  scaVec(1-r3, meanSol[0]) )
+    Pl      = addVecs ( scaVec(r4, worstSol.raw), scaVec(1-r4, meanSol[0]) )
+
+    return _ejaya_move(pop[i], hist, Pu, Pl)
+
+def _ejaya_move(sol, hist, Pu, Pl):
+    """
+    Tek bir birey için e-JAYA hareketini uygular: ya üst/alt çekim noktalarına (Pu, Pl)
+    göre ya da tarihçe bireyine göre yeni aday üretir.
+
+    Args:
+        sol (Candidate): Birey.
+        hist (Candidate): Tarihçe popülasyonundan eşleşen birey.
+        Pu (list): Üst çekim noktası.
+        Pl (list): Alt çekim noktası.
+
+    Returns:
+        list: Yeni ham aday vektörü.
+    """
+    if np.random.rand() > 0.5:
+        r5, r6 = randVecs(sol), randVecs(sol)
+        ex1    = mulVecs(r5, subVecs(Pu, sol.raw))
+        ex2    = mulVecs(r6, subVecs(Pl, sol.raw))
+        return subVecs( addVecs(sol.raw, ex1), ex2 )
+
+    k   = np.random.randn()
+    ex1 = subVecs(hist.raw, sol.raw)
+    return addVecs(sol.raw, scaVec(k, ex1))
+
 # --------------------------------------------------
 # -------------- CONSTRAINT HANDLING ---------------
 # --------------------------------------------------
@@ -243,7 +380,7 @@ def lemonge_K(pop, scalObj, funcFact):
         np.array: Her bir ceza türü için hesaplanan ağırlık katsayıları (Kj).
     """
     abs_fmean = np.abs(np.mean(scalObj))
-    penalty_vectors = np.array([sol[-2] for sol in pop], dtype=float)
+    penalty_vectors = np.array([sol.pen for sol in pop], dtype=float)
     
     vAvg = np.mean(penalty_vectors, axis=0)
     vAvgSqr = np.sum(vAvg ** 2)
@@ -281,7 +418,7 @@ def lemonge_F(pop, scalObj, REFscalObj=None):
     fList = []
     
     for i in range(len(pop)):
-        penalty_sum = np.sum(pop[i][-2])
+        penalty_sum = np.sum(pop[i].pen)
         if penalty_sum == 0: fList.append(scalObj[i])
         else: fList.append(fBar[i])
     return np.array(fList)
@@ -314,7 +451,7 @@ def lemonge(pop, scalObj, funcFact, REFpop=None, REFscalObj=None):
     
     fitness = []
     for i in range(len(pop)):
-        penalty_vector = np.array(pop[i][-2], dtype=float)
+        penalty_vector = np.array(pop[i].pen, dtype=float)
         penalty_term = np.sum(kj * penalty_vector)
         fitness.append(fList[i] + penalty_term)
     return np.array(fitness)
@@ -382,14 +519,13 @@ def _interpret_eccentricity(raw_vec, choices):
         choices (np.array): Geçerli eksantriklik seçenekleri.
 
     Returns:
-        np.array: Seçenekler havuzundan seçilmiş değerler.
+        np.array: Seçenekler havuzundan seçilmiş değerlerin indeksleri (kompakt).
     """
-    diffs = np.abs(raw_vec[:, np.newaxis] - choices[np.newaxis, :])
+    diffs = np.abs(np.asarray(raw_vec, dtype=float)[:, np.newaxis] - choices[np.newaxis, :])
     nearest_indices = np.argmin(diffs, axis=1)
-    interpreted = choices[nearest_indices]
-    return interpreted
+    return nearest_indices
 
-def interpret_solution(raw_cand, limits):
+def interpret_solution(raw_cand, limits, segments=None):
     """
     Sürekli (float) uzaydaki optimizasyon değişkenlerini, ayrık (discrete) tasarım değişkenlerine dönüştürür.
     
@@ -399,25 +535,33 @@ def interpret_solution(raw_cand, limits):
     Args:
         raw_cand (list): Ham aday çözüm vektörü.
         limits (dict): Değişkenlerin alabileceği maksimum ve minimum sınırlar.
+        segments (list, optional): Sadece bu bileşenler yorumlanır; diğerleri olduğu gibi
+                                   kopyalanır (örn: TOPO_SEGMENTS). Varsayılan: tümü.
 
     Returns:
-        list: Yorumlanmış (tamsayı ve seçimlere dönüştürülmüş) çözüm vektörü.
-    """
+        list: Yorumlanmış (tamsayı ve seçim indekslerine dönüştürülmüş) kompakt çözüm
+              vektörü (bkz. SEGMENT_DTYPES).
+    """
+    interpreters = {
+        0  : lambda v: _interpret_topology(v, 0, 1),
+        1  : lambda v: _interpret_size(v, limits["col_size_max"]),
+        2  : lambda v: _interpret_direction(v, limits["nod_ax_lens"]),
+        3  : lambda v: _interpret_eccentricity(v, limits["col_ecc_choices"]),
+        4  : lambda v: _interpret_eccentricity(v, limits["col_ecc_choices"]),
+        5  : lambda v: _interpret_topology(v, 0, 1),
+        6  : lambda v: _interpret_size(v, limits["col_span_size_max"]),
+        7  : lambda v: _interpret_eccentricity(v, limits["col_span_ecc_choices"]),
+        8  : lambda v: _interpret_topology(v, 0, 1),
+        9  : lambda v: _interpret_size(v, limits["beam_size_max"]),
+        10 : lambda v: _interpret_eccentricity(v, limits["beam_ecc_choices"]),
+        11 : lambda v: _interpret_topology(v, -1, 1),
+        12 : lambda v: _interpret_size(v, limits["slab_size_max"])
+    }
+
     interpreted_cand = copy.deepcopy(raw_cand)
-    
-    interpreted_cand[0] = _interpret_topology(raw_cand[0], 0, 1)
-    interpreted_cand[1] = _interpret_size(raw_cand[1], limits["col_size_max"])
-    interpreted_cand[2] = _interpret_direction(raw_cand[2], limits["nod_ax_lens"])
-    interpreted_cand[3] = _interpret_eccentricity(raw_cand[3], limits["col_ecc_choices"])
-    interpreted_cand[4] = _interpret_eccentricity(raw_cand[4], limits["col_ecc_choices"])
-    interpreted_cand[5] = _interpret_topology(raw_cand[5], 0, 1)
-    interpreted_cand[6] = _interpret_size(raw_cand[6], limits["col_span_size_max"])
-    interpreted_cand[7] = _interpret_eccentricity(raw_cand[7], limits["col_span_ecc_choices"])
-    interpreted_cand[8] = _interpret_topology(raw_cand[8], 0, 1)
-    interpreted_cand[9] = _interpret_size(raw_cand[9], limits["beam_size_max"])
-    interpreted_cand[10] = _interpret_eccentricity(raw_cand[10], limits["beam_ecc_choices"])
-    interpreted_cand[11] = _interpret_topology(raw_cand[11], -1, 1)
-    interpreted_cand[12] = _interpret_size(raw_cand[12], limits["slab_size_max"])
+
+    for i in (range(len(interpreters)) if segments is None else segments):
+        interpreted_cand[i] = interpreters[i](raw_cand[i]).astype(SEGMENT_DTYPES[i])
 
     return interpreted_cand
 
@@ -437,7 +581,7 @@ def evaluate_solution(raw_cand, limits, fitness_func):
     fitness_val = fitness_func(interpreted_cand)
     return fitness_val
 
-def sync_raw_from_repaired(repaired_cand):
+def sync_raw_from_repaired(repaired_cand, limits):
     """
     Onarılmış (repaired) tasarım değişkenlerini tekrar float formatına senkronize eder.
     
@@ -445,16 +589,56 @@ def sync_raw_from_repaired(repaired_cand):
     genetik koda (ham vektöre) geri yazılmasını sağlar.
 
     Args:
-        repaired_cand (list): Onarılmış ve geçerli hale getirilmiş çözüm.
+        repaired_cand (list): Onarılmış ve geçerli hale getirilmiş (kompakt) çözüm.
+        limits (dict): Kaçıklık seçeneklerini içeren sınırlar (bkz. ECC_SEGMENTS).
 
     Returns:
-        list: Float tipine dönüştürülmüş ham vektör.
+        list: Float tipine dönüştürülmüş ham vektör (kaçıklıklar değer olarak).
     """
     synced_raw = []
-    for vec in repaired_cand:
-        synced_raw.append(vec.astype(float))
+    for i, vec in enumerate(repaired_cand):
+        if i in ECC_SEGMENTS: synced_raw.append(limits[ECC_SEGMENTS[i]][vec])
+        else: synced_raw.append(vec.astype(float))
     return synced_raw
 
+def encode_solution(cand, limits):
+    """
+    Ayrık (okunabilir) bir tasarım vektörünü kompakt biçime dönüştürür: kaçıklık
+    değerleri en yakın seçeneğin indeksine çevrilir, bileşenler SEGMENT_DTYPES
+    tiplerine dönüştürülür. Kaydedilmiş çözümlerin (JSON) yüklenmesinde kullanılır.
+
+    Args:
+        cand (list): Ayrık tasarım vektörü (manual_design_vector.md).
+        limits (dict): Kaçıklık seçeneklerini içeren sınırlar (bkz. ECC_SEGMENTS).
+
+    Returns:
+        list: Kompakt tasarım vektörü.
+    """
+    encoded = []
+    for i, vec in enumerate(cand):
+        if i in ECC_SEGMENTS: vec = _interpret_eccentricity(vec, limits[ECC_SEGMENTS[i]])
+        encoded.append(np.asarray(vec).astype(SEGMENT_DTYPES[i]))
+    return encoded
+
+def decode_solution(cand, limits):
+    """
+    Kompakt bir tasarım vektörünü ayrık (okunabilir) biçime dönüştürür: kaçıklık
+    indeksleri seçenek değerlerine, diğer bileşenler tamsayıya çevrilir. build_data_struct
+    ve JSON kaydı gibi optimizasyon dışı kullanımlardan önce uygulanır.
+
+    Args:
+        cand (list): Kompakt tasarım vektörü.
+        limits (dict): Kaçıklık seçeneklerini içeren sınırlar (bkz. ECC_SEGMENTS).
+
+    Returns:
+        list: Ayrık tasarım vektörü (manual_design_vector.md).
+    """
+    decoded = []
+    for i, vec in enumerate(cand):
+        if i in ECC_SEGMENTS: decoded.append(limits[ECC_SEGMENTS[i]][vec])
+        else: decoded.append(np.asarray(vec).astype(int))
+    return decoded
+
 def find_worst_fitness(geoData, contBeam, fitness_span_in_area, fitness_node_in_area):
     """
     Normalizasyon işlemi için teorik olarak mümkün olan en kötü fitness değerlerini hesaplar.
@@ -1,6 +1,7 @@
 import numpy as np
 import copy
 import time
+import random
 
 # Proje modülleri
 import func_optimization as funcOpti
@@ -8,6 +9,29 @@ import build_data_repair as buildRepMask
 import build_data_od_repair as buildODRepair
 import build_data_penalty as buildPenalty
 import build_data_fitness as buildFit
+import build_data_sizing as buildSizing
+import build_data_problem as buildProblem
+import build_data_rigidity as buildRigidity
+import func_cache as funcCache
+
+# Ceza bileşenlerinin kısa adları (sıra buildPenalty.PENALTY_KEYS ile aynıdır)
+PENALTY_NAMES = ["beam_length", "beam_dist", "col_dist", "beam_free_end", "rigidity"]
+N_PEN = len(PENALTY_NAMES)
+
+# run() telemetri dizisinin (max_iter, len(TELEMETRY_KEYS)) sütunları
+TELEMETRY_KEYS = [
+    "best_obj", "mean_obj", "worst_obj", "feasible_frac",
+    *[f"pen_{name}" for name in PENALTY_NAMES],
+    "diversity", "acceptance_rate", "evals_per_sec"
+]
+
+# Tanılama (diagnostics) dizisinin sütunları: her N iterasyonda yavru adayların ceza istatistikleri
+DIAGNOSTIC_KEYS = [
+    "iteration", "n_offspring", "n_sampled",
+    *[f"pen_mean_{name}" for name in PENALTY_NAMES],
+    *[f"pen_std_{name}" for name in PENALTY_NAMES],
+    "n_unique_pen"
+]
 
 class StructuralOptimizer:
     """
@@ -18,7 +42,8 @@ class StructuralOptimizer:
     üretilmesi, onarılması, cezalandırılması ve seçilmesi süreçlerini koordine eder.
     """
 
-    def __init__(self, geoData, xls, contBeam, slabProp, fitness_span_in_area, fitness_node_in_area, repairMask):
+    def __init__(self, geoData, xls, contBeam, slabProp, fitness_span_in_area, fitness_node_in_area, repairMask,
+                 problem=None):
         """
         Optimizer sınıfını başlatır ve gerekli statik verileri yükler.
 
@@ -30,6 +55,9 @@ class StructuralOptimizer:
             fitness_span_in_area (np.array): Alan içi açıklık maliyet matrisi (Fitness hesabı için).
             fitness_node_in_area (np.array): Alan içi düğüm maliyet vektörü (Fitness hesabı için).
             repairMask (dict): Geçersiz elemanları düzeltmek için kullanılan onarım maskeleri.
+            problem (dict, optional): build_data_problem ile bir kez oluşturulmuş, koşumlar
+                                      arasında paylaşılan problem paketi. Verilmezse burada
+                                      oluşturulur.
         """
         self.geoData = geoData
         self.xls = xls
@@ -38,33 +66,55 @@ class StructuralOptimizer:
         self.fit_span_area = fitness_span_in_area
         self.fit_node_area = fitness_node_in_area
         self.repairMask = repairMask
-        
-        # Sınırların (Limits) Oluşturulması
-        self.limits = {
-            "col_size_max"         : len(xls["colSec"]["dL"]) - 1,
-            "nod_ax_lens"          : np.array([len(ax) for ax in geoData["nodAx"]]),
-            "col_ecc_choices"      : funcOpti.build_ecc_choices(xls["eccIntervals"]["col"]),
-            "col_span_size_max"    : len(xls["colSpanSec"]["width"]) - 1,
-            "col_span_ecc_choices" : funcOpti.build_ecc_choices(xls["eccIntervals"]["colSpan"]),
-            "beam_size_max"        : len(xls["beamSec"]["h"]) - 1,
-            "beam_ecc_choices"     : funcOpti.build_ecc_choices(xls["eccIntervals"]["beam"]),
-            "slab_size_max"        : len(xls["slabSec"]["h"]) - 1
-        }
-
-        # En kötü durum fitness değerleri (Scaling için)
-        self.worst_fitness_vals = funcOpti.find_worst_fitness(
-            geoData, contBeam, fitness_span_in_area, fitness_node_in_area
-        )
+
+        # Problem paketi: sınırlar (limits), en kötü durum fitness değerleri (Scaling için)
+        # ve değerlendirmelerde kullanılan sabitler
+        if problem is None:
+            problem = buildProblem.build_data_problem(
+                geoData, xls, contBeam, fitness_span_in_area, fitness_node_in_area)
+        self.problem = problem
+        self.limits = problem["limits"]
+        self.worst_fitness_vals = problem["worst_fitness"]
 
         # Popülasyon ve Tarihçe
-        self.pop = []      # [raw_cand, processed_cand, fit_tuple, pen_tuple, obj_val]
+        self.pop = []      # funcOpti.Candidate listesi (raw, processed, fit, pen, obj)
         self.hPop = []     # Historical population (JAYA için)
         self.best_solution = None
         self.best_objective = np.inf
         self.best_penalty = None  # DÜZELTME: En iyi çözümün ceza değerlerini tutar
         self.history = []
+        self.history_rescaled = [] # Amaç ölçeğinin değiştiği (refine_axes) history indeksleri
+
+        # Kısmi (segment bazlı) aramalarda sabit tutulan bileşenlerin değerleri
+        self.base_sol = problem["default_sol"]
+        self.elites = []   # İki aşamalı aramada [topology_obj, sizing_obj] çiftleri
+        self.segments = None
+        self.visited = funcCache.VisitedSet() # Koşum boyunca değerlendirilmiş tasarımlar
+        self.eval_cache = None # Koşumlar arası disk önbelleği (funcCache.EvaluationCache)
+        self.seed = None # Koşum tohumu (tanılama örneklemesi koşuma özgü olur)
+        self.initial_best_penalty = None
+        self.telemetry = np.empty((0, len(TELEMETRY_KEYS))) # Her iterasyon için TELEMETRY_KEYS
+        self.diagnostics = np.empty((0, len(DIAGNOSTIC_KEYS))) # Örneklenen iterasyonlar için
+
+    def _expand(self, raw_part, segments, base=None):
+        """
+        Sadece belirli bileşenleri (segments) içeren kısmi vektörü, geri kalan bileşenleri
+        base çözümünden alarak tam tasarım vektörüne genişletir.
+
+        Args:
+            raw_part (list): segments sırasıyla bileşenleri içeren kısmi vektör.
+            segments (list): Kısmi vektörün tasarım vektöründeki indeksleri.
+            base (list, optional): Sabit bileşenlerin alınacağı çözüm. Varsayılan: self.base_sol.
+
+        Returns:
+            list: Tam tasarım vektörü.
+        """
+        full = list(self.base_sol if base is None else base)
+        for vec, seg in zip(raw_part, segments):
+            full[seg] = vec
+        return full
 
-    def _process_candidate_pipeline(self, raw_cand):
+    def _process_candidate_pipeline(self, raw_cand, segments=None):
         """
         Tek bir ham çözüm adayını işleyerek değerlendirilebilir hale getiren işlem hattı.
 
@@ -76,6 +126,8 @@ class StructuralOptimizer:
 
         Args:
             raw_cand (list): 0-1 aralığında değerlerden oluşan ham çözüm vektörü.
+            segments (list, optional): Verilirse raw_cand sadece bu bileşenleri içerir;
+                                       diğerleri self.base_sol'dan alınır ve yorumlanmaz.
 
         Returns:
             tuple: (synced_raw, cand_final, fit_tuple, pen_tuple)
@@ -84,32 +136,129 @@ class StructuralOptimizer:
                 - fit_tuple: Hesaplanmış fitness bileşenleri.
                 - pen_tuple: Hesaplanmış ceza bileşenleri.
         """
+        cand_final = self._repair_candidate(raw_cand, segments)
+        synced_raw, fit_tuple, pen_tuple = self._evaluate_candidate(cand_final, segments)
+
+        return synced_raw, cand_final, fit_tuple, pen_tuple
+
+    def evaluate_design(self, cand):
+        """
+        Ayrık (yorumlanmış) bir tasarım vektörünü onarır ve değerlendirir. Kaydedilmiş
+        çözümlerin (örn: history_*.json) yeniden puanlanması için kullanılır; yorumlama
+        (stochastic rounding) adımı uygulanmaz.
+
+        Args:
+            cand (list): Ayrık tasarım vektörü (manual_design_vector.md).
+
+        Returns:
+            tuple: (cand_final, fit_tuple, pen_tuple); cand_final ayrık biçimdedir.
+        """
+        cand_repaired = buildRepMask.apply_repair(funcOpti.encode_solution(cand, self.limits), self.repairMask)
+        od_mask = buildODRepair.build_data_od_repair_problem(cand_repaired, self.problem)
+        cand_final = buildODRepair.apply_od_repair(cand_repaired, od_mask)
+
+        _, fit_tuple, pen_tuple = self._evaluate_candidate(cand_final)
+        return funcOpti.decode_solution(cand_final, self.limits), fit_tuple, pen_tuple
+
+    def _repair_candidate(self, raw_cand, segments=None):
+        """
+        İşlem hattının ilk aşaması: ham çözümü yorumlar ve onarır (1-3). Onarılmış çözüm,
+        değerlendirme öncesinde tekrar (duplicate) kontrolü için kullanılabilir.
+
+        Args:
+            raw_cand (list): Ham çözüm vektörü.
+            segments (list, optional): Bkz. _process_candidate_pipeline.
+
+        Returns:
+            list: İşlenmiş ve onarılmış nihai çözüm vektörü.
+        """
         # F1. Yorumlama (Interpretation)
-        cand_interp = funcOpti.interpret_solution(raw_cand, self.limits)
+        if segments is not None: raw_cand = self._expand(raw_cand, segments)
+        cand_interp = funcOpti.interpret_solution(raw_cand, self.limits, segments)
 
         # B & F3. Genel Maske Uygulama (Statik)
         cand_repaired = buildRepMask.apply_repair(cand_interp, self.repairMask)
 
         # A & F2. OD Maske Uygulama (Dinamik/On-Demand)
-        od_mask = buildODRepair.build_data_od_repair(cand_repaired, self.geoData, self.contBeam)
-        cand_final = buildODRepair.apply_od_repair(cand_repaired, od_mask)
-        
+        od_mask = buildODRepair.build_data_od_repair_problem(cand_repaired, self.problem)
+        return buildODRepair.apply_od_repair(cand_repaired, od_mask)
+
+    def _evaluate_candidate(self, cand_final, segments=None):
+        """
+        İşlem hattının ikinci aşaması: onarılmış çözümün ham vektörünü senkronize eder ve
+        ceza ile fitness değerlerini hesaplar (4).
+
+        Args:
+            cand_final (list): Onarılmış çözüm vektörü.
+            segments (list, optional): Bkz. _process_candidate_pipeline.
+
+        Returns:
+            tuple: (synced_raw, fit_tuple, pen_tuple)
+        """
         # Sync Raw (Lamarckian Learning) - DÜZELTME: Return değerine eklendi
-        synced_raw = funcOpti.sync_raw_from_repaired(cand_final)
+        synced_raw = funcOpti.sync_raw_from_repaired(cand_final, self.limits)
+        if segments is not None: synced_raw = [synced_raw[seg] for seg in segments]
+
+        # Disk önbelleği: aynı projede daha önce değerlendirilmiş topoloji
+        if self.eval_cache is not None:
+            key = self.eval_cache.key(cand_final)
+            cached = self.eval_cache.get(key)
+            if cached is not None: return synced_raw, cached[0], cached[1]
 
         # C & F4.1 Penalty Hesaplama
-        pen_vals = buildPenalty.build_data_penalty(cand_final, self.geoData, self.xls)
+        pen_vals = buildPenalty.build_data_penalty_problem(cand_final, self.problem)
         pen_tuple = np.array(pen_vals, dtype=float)
 
         # D & F4.2 Fitness Hesaplama
-        fit_vals = buildFit.build_data_fitness(
-            cand_final, self.geoData, self.contBeam, self.fit_span_area, self.fit_node_area
-        )
+        fit_vals = buildFit.build_data_fitness_problem(cand_final, self.problem)
         fit_tuple = np.array(fit_vals, dtype=float)
 
-        return synced_raw, cand_final, fit_tuple, pen_tuple
+        if self.eval_cache is not None: self.eval_cache.put(key, fit_tuple, pen_tuple)
+
+        return synced_raw, fit_tuple, pen_tuple
+
+    def _evaluate_candidates(self, cands, segments=None):
+        """
+        _evaluate_candidate'in toplu hali: önbellekte bulunmayan adayların ceza ve fitness
+        değerleri tek seferde (build_data_penalty_batch, build_data_fitness_batch) hesaplanır.
+
+        Args:
+            cands (list): Onarılmış çözüm vektörleri.
+            segments (list, optional): Bkz. _process_candidate_pipeline.
 
-    def _calculate_lemonge_objectives(self, population_subset):
+        Returns:
+            list: Her aday için (synced_raw, fit_tuple, pen_tuple)
+        """
+        results = []
+        for cand_final in cands:
+            synced_raw = funcOpti.sync_raw_from_repaired(cand_final, self.limits)
+            if segments is not None: synced_raw = [synced_raw[seg] for seg in segments]
+            results.append([synced_raw, None, None])
+
+        # Disk önbelleği
+        keys = [None] * len(cands)
+        if self.eval_cache is not None:
+            for i, cand_final in enumerate(cands):
+                keys[i] = self.eval_cache.key(cand_final)
+                cached  = self.eval_cache.get(keys[i])
+                if cached is not None: results[i][1:] = cached
+
+        todo = [i for i, res in enumerate(results) if res[1] is None]
+        if todo:
+            batch = [cands[i] for i in todo]
+            # C & F4.1 Penalty Hesaplama (toplu)
+            pens = buildPenalty.build_data_penalty_batch(batch, self.problem)
+            # D & F4.2 Fitness Hesaplama (toplu)
+            fits = buildFit.build_data_fitness_batch(batch, self.problem)
+
+            for row, i in enumerate(todo):
+                fit_tuple, pen_tuple = fits[row].copy(), pens[row].copy()
+                if self.eval_cache is not None: self.eval_cache.put(keys[i], fit_tuple, pen_tuple)
+                results[i][1:] = fit_tuple, pen_tuple
+
+        return [tuple(res) for res in results]
+
+    def _calculate_lemonge_objectives(self, population_subset, reference=None):
         """
         Popülasyonun bir alt kümesi için Lemonge yöntemiyle amaç fonksiyonu değerlerini hesaplar.
 
@@ -118,7 +267,10 @@ class StructuralOptimizer:
 
         Args:
             population_subset (list): Değerlendirilecek aday çözümler listesi.
-                                      Her öğe [raw, processed, fit, pen, obj] formatındadır.
+                                      (funcOpti.Candidate; fit ve pen alanları dolu olmalıdır)
+            reference (list, optional): Verilirse ceza ağırlıkları ve ortalama fitness bu
+                                        popülasyondan hesaplanır (örn: tekil adayları mevcut
+                                        popülasyona göre değerlendirmek için).
 
         Returns:
             np.array: Her aday için hesaplanmış tekil amaç (objective) değerleri listesi.
@@ -126,25 +278,25 @@ class StructuralOptimizer:
         if not population_subset: return []
 
         # Fitness tuple'larını matrise çevir
-        all_fits = np.array([p[2] for p in population_subset])
+        all_fits = np.array([p.fit for p in population_subset])
         
         # Scalar Objective (Normalize edilmiş fitness)
         scalar_objs = funcOpti.compute_scalar_objective(all_fits, self.worst_fitness_vals)
 
         # Lemonge Parametreleri
-        funcFact = [[None, None, None, None, [0, 1, 2, 3]], [None, np.ones(4)]]
+        funcFact = [[None, None, None, None, list(range(N_PEN))], [None, np.ones(N_PEN)]]
         
-        # Lemonge hesaplaması için geçici yapı
-        temp_pop_structure = []
-        for p in population_subset:
-            # [raw(dummy), fitness(dummy), penalty_tuple, scalar_fitness(dummy)]
-            temp_pop_structure.append([None, None, p[3], None])
-
-        objectives = funcOpti.lemonge(temp_pop_structure, scalar_objs, funcFact)
+        if reference is None:
+            objectives = funcOpti.lemonge(population_subset, scalar_objs, funcFact)
+        else:
+            ref_fits = np.array([p.fit for p in reference])
+            ref_objs = funcOpti.compute_scalar_objective(ref_fits, self.worst_fitness_vals)
+            objectives = funcOpti.lemonge(population_subset, scalar_objs, funcFact, reference, ref_objs)
         
         return objectives
 
-    def run(self, pop_size=10, max_iter=20):
+    def run(self, pop_size=10, max_iter=20, seed_sols=None, segments=None, dedup=False, max_regen=3,
+            resume=False, diagnostics=0, diag_sample=None):
         """
         JAYA algoritması tabanlı optimizasyon döngüsünü çalıştırır.
 
@@ -155,6 +307,23 @@ class StructuralOptimizer:
         Args:
             pop_size (int): Popülasyon büyüklüğü (Aday çözüm sayısı).
             max_iter (int): Maksimum iterasyon sayısı.
+            seed_sols (list, optional): Başlangıç popülasyonuna rastgele çözümler yerine
+                                        eklenecek tasarım vektörleri (örn: build_data_greedy).
+            segments (list, optional): Sadece bu bileşenler aranır (örn: TOPO_SEGMENTS);
+                                       diğerleri self.base_sol değerlerinde sabit kalır.
+            dedup (bool): True ise daha önce değerlendirilmiş bir tasarıma (topoloji ve
+                          RIGIDITY_SEGMENTS, bkz. funcCache.evaluation_key) onarılan adaylar
+                          değerlendirilmeden önce yeniden üretilir (self.visited).
+            max_regen (int): Bir aday için en fazla yeniden üretme sayısı. Hak bittiğinde
+                             aday hâlâ tekrar ise değerlendirilmez ve ebeveyn korunur.
+            resume (bool): True ise ve mevcut bir popülasyon varsa (örn: set_state ile
+                           yüklenmiş) başlangıç popülasyonu oluşturulmaz; arama kaldığı
+                           yerden max_iter iterasyon daha devam eder.
+            diagnostics (int): 0'dan büyükse her diagnostics iterasyonda bir yavru adayların
+                               ceza istatistikleri self.diagnostics dizisine yazılır
+                               (sütunlar için bkz. DIAGNOSTIC_KEYS). Varsayılan: kapalı.
+            diag_sample (int, optional): Tanılama için rastgele seçilecek en fazla aday sayısı.
+                                         Varsayılan: tüm yavru adaylar.
 
         Returns:
             tuple: (best_solution, best_objective, history, initial_best_penalty, best_penalty)
@@ -163,43 +332,73 @@ class StructuralOptimizer:
                 - history (list): Her iterasyondaki en iyi amaç değerlerinin listesi.
                 - initial_best_penalty (np.array): İlk iterasyondaki en iyi çözümün ceza değerleri.
                 - best_penalty (np.array): Final çözümün ceza değerleri.
+                - telemetry (np.ndarray): (iterasyon, len(TELEMETRY_KEYS)) boyutlu popülasyon
+                                          telemetrisi (devam eden aramada önceki satırlar dahil).
         """
         print(f"\n--- Optimizasyon Başlatılıyor (Pop: {pop_size}, Iter: {max_iter}) ---")
         start_time = time.perf_counter()
 
-        # A0. BAŞLANGIÇ POPÜLASYONU
-        self.pop = []
-        self.best_objective = np.inf
-        self.best_solution = None
-        self.best_penalty = None
-
-        for _ in range(pop_size):
-            raw_cand = funcOpti.gen_rand_sol(self.geoData, self.xls, len(self.contBeam))
-            
-            # İlk değerlendirme (Pipeline) - DÜZELTME: 4 değer dönüyor (synced_raw eklendi)
-            synced_raw, processed_cand, fit_tuple, pen_tuple = self._process_candidate_pipeline(raw_cand)
+        # A0. BAŞLANGIÇ POPÜLASYONU (devam eden aramada mevcut popülasyon kullanılır)
+        if not (resume and self.pop):
+            self.pop = []
+            self.best_objective = np.inf
+            self.best_solution = None
+            self.best_penalty = None
+            self.segments = segments
+            self.visited = funcCache.VisitedSet()
+
+            seed_sols = [] if seed_sols is None else seed_sols[:pop_size]
+
+            processed = []
+            for i in range(pop_size):
+                if i < len(seed_sols):
+                    raw_cand = funcOpti.sync_raw_from_repaired(seed_sols[i], self.limits)
+                else:
+                    raw_cand = funcOpti.gen_rand_sol(self.geoData, self.xls, len(self.contBeam))
+                if segments is not None: raw_cand = [raw_cand[seg] for seg in segments]
+                processed.append(self._repair_candidate(raw_cand, segments))
+
+            # İlk değerlendirme (toplu)
+            for processed_cand, (synced_raw, fit_tuple, pen_tuple) in zip(
+                    processed, self._evaluate_candidates(processed, segments)):
+                member = funcOpti.Candidate(synced_raw, processed_cand, fit_tuple, pen_tuple,
+                                            key=funcCache.evaluation_key(processed_cand))
+                self.pop.append(member)
+                self.visited.add(member.key)
+
+            # İlk Lemonge Hesaplaması
+            objs = self._calculate_lemonge_objectives(self.pop)
+            for i in range(pop_size):
+                self.pop[i].obj = objs[i]
             
-            # [Raw, Processed, Fitness, Penalty, Objective(Placeholder)]
-            self.pop.append([synced_raw, processed_cand, fit_tuple, pen_tuple, None])
+                # En iyiyi kaydet
+                if objs[i] < self.best_objective:
+                    self.best_objective = objs[i]
+                    self.best_solution = copy.deepcopy(self.pop[i].processed)
+                    self.best_penalty = copy.deepcopy(self.pop[i].pen) # DÜZELTME: Penalty kaydı
 
-        # İlk Lemonge Hesaplaması
-        objs = self._calculate_lemonge_objectives(self.pop)
-        for i in range(pop_size):
-            self.pop[i][4] = objs[i]
-            
-            # En iyiyi kaydet
-            if objs[i] < self.best_objective:
-                self.best_objective = objs[i]
-                self.best_solution = copy.deepcopy(self.pop[i][1])
-                self.best_penalty = copy.deepcopy(self.pop[i][3]) # DÜZELTME: Penalty kaydı
-
-        self.hPop = copy.deepcopy(self.pop) # JAYA Tarihçesi
+            self.hPop = [p.clone() for p in self.pop] # JAYA Tarihçesi
         
-        # DÜZELTME: İlk iterasyon penalty'sini sakla
-        initial_best_penalty = copy.deepcopy(self.best_penalty)
+            # DÜZELTME: İlk iterasyon penalty'sini sakla
+            self.initial_best_penalty = copy.deepcopy(self.best_penalty)
+
+        # Telemetri dizisi önceden ayrılır (devam eden aramada mevcut satırlara eklenir)
+        if not resume: self.telemetry = self.telemetry[:0]
+        row0 = len(self.telemetry)
+        self.telemetry = np.vstack([self.telemetry, np.full((max_iter, len(TELEMETRY_KEYS)), np.nan)])
+
+        # Tanılama dizisi de önceden ayrılır; örnekleme ayrı bir üreteçle yapılır (arama akışı değişmez)
+        if not resume: self.diagnostics = self.diagnostics[:0]
+        diag_row  = len(self.diagnostics)
+        diag_rng  = np.random.default_rng(row0 if self.seed is None else [int(self.seed), row0])
+        if diagnostics > 0:
+            n_rows = len(range(diagnostics - 1, max_iter, diagnostics))
+            self.diagnostics = np.vstack([self.diagnostics, np.full((n_rows, len(DIAGNOSTIC_KEYS)), np.nan)])
 
         # DÖNGÜ BAŞLANGICI
         for iteration in range(max_iter):
+            iter_start = time.perf_counter()
+            n_accepted = 0
             
             # F. YENİ ADAY ÜRETME (JAYA)
             new_raw_pop_structure, new_hPop_structure = funcOpti.ejaya(self.pop, self.hPop)
@@ -212,37 +411,424 @@ class StructuralOptimizer:
 
             # Yeni adayları işle
             for i in range(candidate_count):
-                new_raw = new_raw_pop_structure[i][0]
-                synced_new_raw, proc_cand, fit, pen = self._process_candidate_pipeline(new_raw)
-                offspring_pop.append([synced_new_raw, proc_cand, fit, pen, None])
-
-            # F4.3 Yeni adaylar için Objective hesapla
-            offspring_objs = self._calculate_lemonge_objectives(offspring_pop)
+                new_raw = new_raw_pop_structure[i].raw
+                proc_cand = self._repair_candidate(new_raw, segments)
+
+                # F3.1 Tekrar (duplicate) kontrolü: ziyaret edilmiş tasarımlar yeniden üretilir
+                key = funcCache.evaluation_key(proc_cand)
+                self.visited.count(proposed=1, duplicates=int(key in self.visited))
+
+                n_regen = 0
+                while dedup and key in self.visited and n_regen < max_regen:
+                    new_raw = funcOpti.ejaya_member(self.pop, self.hPop, i)
+                    proc_cand = self._repair_candidate(new_raw, segments)
+                    key = funcCache.evaluation_key(proc_cand)
+                    n_regen += 1
+
+                if dedup and key in self.visited:
+                    self.visited.count(skipped=1)
+                    offspring_pop.append(None)
+                    continue
+
+                self.visited.add(key)
+                offspring_pop.append(funcOpti.Candidate(None, proc_cand, key=key))
+
+            # F4.1-F4.2 Yeni adayların toplu değerlendirilmesi (ceza değerleri tek seferde)
+            evaluated = [p for p in offspring_pop if p is not None]
+            for p, (synced_new_raw, fit, pen) in zip(
+                    evaluated, self._evaluate_candidates([p.processed for p in evaluated], segments)):
+                p.raw, p.fit, p.pen = synced_new_raw, fit, pen
+
+            # F4.3 Yeni adaylar için Objective hesapla (değerlendirilmeyen adaylar hariç)
+            evaluated_objs = iter(self._calculate_lemonge_objectives(evaluated))
+            offspring_objs = [None if p is None else next(evaluated_objs) for p in offspring_pop]
+            self.visited.end_iteration()
+
+            # F4.4 Tanılama (her diagnostics iterasyonda bir, örneklenmiş adaylar üzerinden)
+            if diagnostics > 0 and (iteration + 1) % diagnostics == 0:
+                self._record_diagnostics(diag_row, row0 + iteration, evaluated, diag_sample, diag_rng)
+                diag_row += 1
 
             # F5. KARŞILAŞTIRMA VE KABUL (Greedy Selection)
             for i in range(candidate_count):
-                if i >= len(offspring_objs): continue
+                if i >= len(offspring_objs) or offspring_objs[i] is None: continue
 
-                offspring_pop[i][4] = offspring_objs[i]
+                offspring_pop[i].obj = offspring_objs[i]
                 
                 # Eğer yeni aday eskisinden iyiyse veya eşitse
-                if offspring_objs[i] <= self.pop[i][4]:
+                if offspring_objs[i] <= self.pop[i].obj:
                     # HAM halini ve işlenmiş verilerini kabul et
                     self.pop[i] = offspring_pop[i]
+                    n_accepted += 1
                 
                 # Global en iyiyi güncelle
-                if self.pop[i][4] < self.best_objective:
-                    self.best_objective = self.pop[i][4]
-                    self.best_solution = copy.deepcopy(self.pop[i][1])
-                    self.best_penalty = copy.deepcopy(self.pop[i][3]) # DÜZELTME: Penalty güncelleme
+                if self.pop[i].obj < self.best_objective:
+                    self.best_objective = self.pop[i].obj
+                    self.best_solution = copy.deepcopy(self.pop[i].processed)
+                    self.best_penalty = copy.deepcopy(self.pop[i].pen) # DÜZELTME: Penalty güncelleme
             
             # Tarihçeyi güncelle
             self.hPop = new_hPop_structure
             self.history.append(self.best_objective)
+            self._record_telemetry(
+                row0 + iteration, n_accepted / max(candidate_count, 1),
+                len(evaluated) / max(time.perf_counter() - iter_start, 1e-12))
             print(f"Iter {iteration+1:02d} | Best Obj: {self.best_objective:.6f}")
 
         elapsed = time.perf_counter() - start_time
         print(f"--- Optimizasyon Tamamlandı ({elapsed:.2f}s) ---\n")
         
-        # DÜZELTME: 5 değer döndürülüyor
-        return self.best_solution, self.best_objective, self.history, initial_best_penalty, self.best_penalty
\ No newline at end of file
+        return (self.best_solution, self.best_objective, self.history, self.initial_best_penalty,
+                self.best_penalty, self.telemetry)
+
+    def _record_diagnostics(self, row, iteration, offspring, sample, rng):
+        """
+        Yavru adayların ceza istatistiklerini tanılama dizisinin ilgili satırına yazar
+        (sütunlar için bkz. DIAGNOSTIC_KEYS).
+
+        Args:
+            row (int): Tanılama dizisindeki satır indeksi.
+            iteration (int): Kaydedilecek (toplam) iterasyon indeksi.
+            offspring (list): Değerlendirilmiş yavru adaylar.
+            sample (int or None): Rastgele seçilecek en fazla aday sayısı.
+            rng (np.random.Generator): Örnekleme için kullanılan üreteç.
+        """
+        d = self.diagnostics[row]
+        d[0:2] = iteration, len(offspring)
+        if not offspring:
+            d[2] = 0
+            return
+
+        pens = np.array([p.pen for p in offspring], dtype=float)
+        if sample is not None and sample < len(pens):
+            pens = pens[rng.choice(len(pens), size=sample, replace=False)]
+
+        d[2]                     = len(pens)
+        d[3:3 + N_PEN]           = pens.mean(axis=0)
+        d[3 + N_PEN:3 + 2*N_PEN] = pens.std(axis=0)
+        d[-1]                    = len(np.unique(pens, axis=0))
+
+    def _record_telemetry(self, row, acceptance_rate, evals_per_sec):
+        """
+        Mevcut popülasyonun istatistiklerini telemetri dizisinin ilgili satırına yazar
+        (sütunlar için bkz. TELEMETRY_KEYS).
+
+        Args:
+            row (int): Telemetri dizisindeki satır (iterasyon) indeksi.
+            acceptance_rate (float): Açgözlü seçimde kabul edilen aday oranı.
+            evals_per_sec (float): İterasyondaki saniye başına değerlendirme sayısı.
+        """
+        objs = np.array([p.obj for p in self.pop], dtype=float)
+        pens = np.array([p.pen for p in self.pop], dtype=float)
+
+        # Topoloji çeşitliliği: bireyler arası ortalama (normalize) Hamming mesafesi
+        topo = np.array([np.concatenate([p.processed[seg] == 1 for seg in funcOpti.TOPO_SEGMENTS])
+                         for p in self.pop])
+        freq = topo.mean(axis=0)
+        n    = len(topo)
+        diversity = np.mean(2 * freq * (1 - freq)) * n / (n - 1) if n > 1 else 0.0
+
+        t = self.telemetry[row]
+        t[0:3]         = objs.min(), objs.mean(), objs.max()
+        t[3]           = np.mean(pens.sum(axis=1) == 0)
+        t[4:4 + N_PEN] = pens.mean(axis=0)
+        t[-3]          = diversity
+        t[-2]          = acceptance_rate
+        t[-1]          = evals_per_sec
+
+    def get_state(self):
+        """
+        Aramanın devam ettirilebilmesi için gereken durumu döndürür (popülasyon, tarihçe
+        popülasyonu, en iyi çözüm, ziyaret edilen topolojiler ve rastgele sayı üreteçlerinin
+        durumları). Dönen sözlük pickle ile işlemler arasında taşınabilir.
+
+        Returns:
+            dict: Optimizasyon durumu.
+        """
+        return copy.deepcopy({
+            "pop"                  : self.pop,
+            "hPop"                 : self.hPop,
+            "best_solution"        : self.best_solution,
+            "best_objective"       : self.best_objective,
+            "best_penalty"         : self.best_penalty,
+            "initial_best_penalty" : self.initial_best_penalty,
+            "history"              : self.history,
+            "history_rescaled"     : self.history_rescaled,
+            "telemetry"            : self.telemetry,
+            "diagnostics"          : self.diagnostics,
+            "segments"             : self.segments,
+            "visited"              : self.visited,
+            "np_random"            : np.random.get_state(),
+            "py_random"            : random.getstate()
+        })
+
+    def set_state(self, state):
+        """
+        get_state ile alınmış durumu yükler. Ardından run(resume=True) ile arama kaldığı
+        yerden devam ettirilebilir.
+
+        Args:
+            state (dict): get_state ile alınmış optimizasyon durumu.
+        """
+        state = copy.deepcopy(state)
+        self.pop                  = state["pop"]
+        self.hPop                 = state["hPop"]
+        self.best_solution        = state["best_solution"]
+        self.best_objective       = state["best_objective"]
+        self.best_penalty         = state["best_penalty"]
+        self.initial_best_penalty = state["initial_best_penalty"]
+        self.history              = state["history"]
+        self.history_rescaled     = state["history_rescaled"]
+        self.telemetry            = state["telemetry"]
+        self.diagnostics          = state["diagnostics"]
+        self.segments             = state["segments"]
+        self.visited              = state["visited"]
+        np.random.set_state(state["np_random"])
+        random.setstate(state["py_random"])
+
+    def _axis_patterns(self, ax, n_samples):
+        """
+        Bir aks üzerindeki kiriş (aks parçaları) ve noktasal kolon (düğümler) desenlerini
+        üretir. Olası desen sayısı n_samples'dan küçükse tüm desenler sayılır, aksi halde
+        rastgele örneklenir.
+
+        Args:
+            ax (int): Aks indeksi.
+            n_samples (int): Üretilecek en fazla desen sayısı.
+
+        Returns:
+            np.ndarray: (n, len(axSpan[ax]) + len(axNod[ax])) boyutlu 0-1 desen matrisi.
+        """
+        n_bits = len(self.geoData["axSpan"][ax]) + len(self.geoData["axNod"][ax])
+
+        if 2 ** n_bits <= n_samples:
+            codes = np.arange(2 ** n_bits)
+            return (codes[:, None] >> np.arange(n_bits)) & 1
+
+        return np.random.randint(0, 2, size=(n_samples, n_bits))
+
+    def refine_axes(self, n_axes=3, n_samples=64, n_full=4):
+        """
+        Aks bazlı koordinat iniş (coordinate descent) iyileştirmesi.
+
+        En iyi çözümün, kiriş uzunluğu cezası en yüksek n_axes aksı sırayla ele alınır. Her
+        aks için, planın geri kalanı sabit tutularak aks üzerindeki kiriş ve kolon desenleri
+        sayılır veya örneklenir. Desenler önce aks bazlı (artımlı) kiriş uzunluğu cezası ile
+        elenir; en iyi n_full desen tam değerlendirmeden (onarım, ceza, fitness) geçirilir ve
+        mevcut popülasyona göre hesaplanan amaç değeri daha iyiyse kabul edilir. İşlem
+        sonunda popülasyonun amaç değerleri yeniden hesaplanır. Yeni Lemonge ölçeğindeki en
+        iyi amaç değeri history'ye eklenir ve indeksi self.history_rescaled'e yazılır; bu
+        değer önceki history değerleri ile doğrudan karşılaştırılamaz.
+
+        Args:
+            n_axes (int): İyileştirilecek aks sayısı.
+            n_samples (int): Her aks için denenecek en fazla desen sayısı.
+            n_full (int): Her aks için tam değerlendirilecek desen sayısı.
+
+        Returns:
+            tuple: (best_solution, best_objective, best_penalty)
+        """
+        if not self.pop: return self.best_solution, self.best_objective, self.best_penalty
+
+        axNod, axSpan = self.geoData["axNod"], self.geoData["axSpan"]
+        nodAx         = self.geoData["nodAx"]
+        per_axis      = lambda c: buildPenalty.build_penalty_beam_lengths_per_axis(
+            c[0], c[5], c[8], axNod, self.geoData["nodeDist"], axSpan,
+            self.xls["beamLenLim"]["min"], self.xls["beamLenLim"]["max"])
+
+        idx    = int(np.argmin([p.obj for p in self.pop]))
+        member = self.pop[idx]
+        ax_pen = per_axis(member.processed)
+
+        for ax in np.argsort(-ax_pen)[:n_axes]:
+            nodes, spans = axNod[ax], axSpan[ax]
+            base         = member.processed
+            patterns     = self._axis_patterns(ax, n_samples)
+
+            # 1. Artımlı ön eleme: değişen aks ve kolonu değişen düğümlerden geçen akslar
+            screened = []
+            for pat in patterns:
+                trial = [vec.copy() for vec in base]
+                trial[8][spans] = pat[:len(spans)]
+                trial[0][nodes] = pat[len(spans):]
+                trial[8][trial[5] == 1] = 0 # çizgisel kolon bulunan aks parçasında kiriş olmaz
+                if all(np.array_equal(trial[i], base[i]) for i in (0, 8)): continue
+
+                changed  = nodes[trial[0][nodes] != base[0][nodes]]
+                affected = np.unique(np.concatenate([[ax]] + [nodAx[n] for n in changed]))
+                delta    = sum(buildPenalty.build_beam_length_violation(
+                    buildPenalty.build_axis_beam_lengths(
+                        trial[0], trial[5], trial[8], axNod[a], self.geoData["nodeDist"], axSpan[a]),
+                    self.xls["beamLenLim"]["min"], self.xls["beamLenLim"]["max"])
+                    for a in affected) - np.sum(ax_pen[affected])
+                screened.append((delta, trial))
+
+            screened.sort(key=lambda t: t[0])
+
+            # 2. Tam değerlendirme ve kabul (aday ve mevcut çözüm aynı referansla ölçülür)
+            for _, trial in screened[:n_full]:
+                raw = funcOpti.sync_raw_from_repaired(trial, self.limits)
+                if self.segments is not None: raw = [raw[seg] for seg in self.segments]
+                synced, proc, fit, pen = self._process_candidate_pipeline(raw, self.segments)
+                offspring = funcOpti.Candidate(synced, proc, fit, pen)
+                objs = self._calculate_lemonge_objectives([member, offspring], self.pop)
+
+                if objs[1] < objs[0]:
+                    member = offspring
+                    ax_pen = per_axis(proc)
+
+            self.pop[idx] = member
+
+        # 3. Popülasyon amaç değerleri yeniden hesaplanır ve en iyi çözüm güncellenir
+        objs = self._calculate_lemonge_objectives(self.pop)
+        for p, obj in zip(self.pop, objs): p.obj = obj
+
+        best = self.pop[int(np.argmin(objs))]
+        self.best_objective = best.obj
+        self.best_solution  = copy.deepcopy(best.processed)
+        self.best_penalty   = copy.deepcopy(best.pen)
+        # Ölçek değiştiği için önceki değerlerle karşılaştırılamaz; indeks işaretlenir
+        self.history_rescaled.append(len(self.history))
+        self.history.append(self.best_objective)
+
+        return self.best_solution, self.best_objective, self.best_penalty
+
+    def _process_sizing_pipeline(self, raw_sizing, topo_cand):
+        """
+        Topolojisi sabitlenmiş bir çözüm için ham kesit/yön/kaçıklık (sizing) vektörünü
+        yorumlar ve ucuz kesit değerlendirmesini (build_data_sizing ve plan rijitlik cezası)
+        yapar. Topoloji değişmediği için onarım, diğer ceza ve fitness hesapları tekrarlanmaz.
+
+        Args:
+            raw_sizing (list): SIZING_SCORED_SEGMENTS sırasıyla ham bileşenler.
+            topo_cand (list): Onarılmış ve sabitlenmiş tam tasarım vektörü.
+
+        Returns:
+            tuple: (synced_raw, cand_final, sizing_tuple)
+        """
+        segments   = funcOpti.SIZING_SCORED_SEGMENTS
+        raw_cand   = self._expand(raw_sizing, segments, base=topo_cand)
+        cand_final = funcOpti.interpret_solution(raw_cand, self.limits, segments)
+
+        synced_raw   = funcOpti.sync_raw_from_repaired(cand_final, self.limits)
+        synced_raw   = [synced_raw[seg] for seg in segments]
+        sizing_tuple = np.array([*buildSizing.build_data_sizing(cand_final, self.geoData),
+                                 buildRigidity.build_data_rigidity(cand_final, self.problem["rigidity"])],
+                                dtype=float)
+
+        return synced_raw, cand_final, sizing_tuple
+
+    def _run_sizing(self, topo_cand, pop_size, max_iter):
+        """
+        Topolojisi sabitlenmiş bir çözümün kesit, yön ve kaçıklık bileşenlerini e-JAYA ile
+        optimize eder. Amaç değeri kesit ceza değerlerinin toplamıdır. Yalnızca amaç değerini
+        etkileyen bileşenler (SIZING_SCORED_SEGMENTS) aranır; diğerleri topo_cand'deki
+        değerlerinde kalır.
+
+        Args:
+            topo_cand (list): Onarılmış ve sabitlenmiş tam tasarım vektörü.
+            pop_size (int): Popülasyon büyüklüğü.
+            max_iter (int): Maksimum iterasyon sayısı.
+
+        Returns:
+            tuple: (best_cand, best_score, history)
+        """
+        segments = funcOpti.SIZING_SCORED_SEGMENTS
+        pop = []
+
+        for _ in range(pop_size):
+            raw_cand = funcOpti.gen_rand_sol(self.geoData, self.xls, len(self.contBeam))
+            synced, cand, sizing = self._process_sizing_pipeline([raw_cand[seg] for seg in segments], topo_cand)
+            # Fitness yoktur; ceza alanı kesit ceza değerlerini tutar
+            pop.append(funcOpti.Candidate(synced, cand, None, sizing, float(np.sum(sizing))))
+
+        hPop    = [p.clone() for p in pop]
+        best    = min(pop, key=lambda p: p.obj)
+        history = []
+
+        for _ in range(max_iter):
+            new_pop, hPop = funcOpti.ejaya(pop, hPop)
+
+            for i, new in enumerate(new_pop[:pop_size]):
+                synced, cand, sizing = self._process_sizing_pipeline(new.raw, topo_cand)
+                obj = float(np.sum(sizing))
+                if obj <= pop[i].obj: pop[i] = funcOpti.Candidate(synced, cand, None, sizing, obj)
+                if pop[i].obj < best.obj: best = pop[i]
+
+            history.append(best.obj)
+
+        return copy.deepcopy(best.processed), best.obj, history
+
+    def run_two_phase(self, pop_size=10, topo_iter=20, size_iter=20, n_elite=3, seed_sols=None,
+                      axis_refine=0, dedup=False):
+        """
+        İki aşamalı (önce topoloji, sonra kesit) optimizasyon.
+
+        1. Aşama: Sadece topoloji bileşenleri (TOPO_SEGMENTS) aranır; kesit, yön ve
+           kaçıklıklar varsayılan değerlerde sabit tutulur. Ceza ve fitness değerleri
+           yalnızca topolojiye bağlı olduğu için arama uzayı küçülür.
+        2. Aşama: En iyi n_elite farklı topoloji sabitlenir ve her biri için kesit, yön ve
+           kaçıklıklardan amaç değerini etkileyenler (SIZING_SCORED_SEGMENTS) ucuz kesit
+           değerlendirmesi ile optimize edilir. Kesitleri optimize edilen elitler tam
+           değerlendirmeden geçirilir ve 1. aşama popülasyonuna göre Lemonge amaç değeri en
+           küçük olan (eşitlikte kesit ceza toplamı küçük olan) final çözüm seçilir.
+
+        Args:
+            pop_size (int): Popülasyon büyüklüğü.
+            topo_iter (int): 1. aşama iterasyon sayısı.
+            size_iter (int): 2. aşama iterasyon sayısı (her elit topoloji için).
+            n_elite (int): 2. aşamaya aktarılacak farklı topoloji sayısı.
+            seed_sols (list, optional): Başlangıç popülasyonuna eklenecek tasarım vektörleri.
+            axis_refine (int): 0'dan büyükse aşamalar arasında refine_axes ile iyileştirilecek
+                               aks sayısı.
+            dedup (bool): 1. aşamada tekrar eden topolojilerin yeniden üretilmesi (bkz. run).
+
+        Returns:
+            tuple: run() ile aynı yapıda (best_solution, best_objective, history,
+                   initial_best_penalty, best_penalty, telemetry). Telemetri 1. aşamaya
+                   aittir. best_objective ve best_penalty döndürülen final (kesitleri
+                   optimize edilmiş) çözüme aittir. self.elites her elit topoloji için
+                   [topology_obj, sizing_obj, final_obj] değerlerini tutar.
+        """
+        _, best_obj, history, init_pen, best_pen, telemetry = self.run(
+            pop_size=pop_size, max_iter=topo_iter, seed_sols=seed_sols,
+            segments=funcOpti.TOPO_SEGMENTS, dedup=dedup)
+
+        if axis_refine > 0:
+            _, best_obj, best_pen = self.refine_axes(n_axes=axis_refine)
+
+        # Farklı topolojilere sahip en iyi n_elite çözüm
+        elites, seen = [], set()
+        for p in sorted(self.pop, key=lambda p: p.obj):
+            key = funcCache.topology_key(p.processed)
+            if key in seen: continue
+            seen.add(key)
+            elites.append(p)
+            if len(elites) == n_elite: break
+
+        print(f"--- Kesit Optimizasyonu ({len(elites)} topoloji, Iter: {size_iter}) ---")
+        sized_cands, scores = [], []
+
+        for p in elites:
+            sized, score, _ = self._run_sizing(p.processed, pop_size, size_iter)
+            synced, fit, pen = self._evaluate_candidates([sized])[0]
+            sized_cands.append(funcOpti.Candidate(synced, sized, fit, pen))
+            scores.append(score)
+
+        # Final çözüm: 1. aşama popülasyonuna göre tam amaç değeri, eşitlikte kesit cezası
+        self.elites = []
+        if sized_cands:
+            objs = self._calculate_lemonge_objectives(sized_cands, self.pop)
+            self.elites = [[p.obj, score, float(obj)] for p, score, obj in zip(elites, scores, objs)]
+            best = min(range(len(sized_cands)), key=lambda i: (objs[i], scores[i]))
+
+            best_obj            = float(objs[best])
+            best_pen            = sized_cands[best].pen
+            self.best_objective = best_obj
+            self.best_solution  = copy.deepcopy(sized_cands[best].processed)
+            self.best_penalty   = copy.deepcopy(best_pen)
+            # Amaç değeri yeniden ölçeklendi (bkz. refine_axes)
+            self.history_rescaled.append(len(self.history))
+            self.history.append(best_obj)
+
+        return self.best_solution, best_obj, history, init_pen, best_pen, telemetry
\ No newline at end of file
@@ -0,0 +1,140 @@
+import numpy as np
+import random
+import time
+import io
+import contextlib
+
+"""
+Required by:
+    measure_eval_time
+    tune_hyperparameters
+"""
+
+import func_optimization as funcOpti
+"""
+Required by:
+    measure_eval_time
+"""
+
+import func_optimization_loop as optLoop
+"""
+Required by:
+    tune_hyperparameters
+"""
+
+def measure_eval_time(optimizer, n_samples=20):
+    """
+    Plan için bir aday değerlendirmesinin (yorumlama + onarım + ceza + fitness) ortalama
+    süresini ölçer.
+
+    Args:
+        optimizer (StructuralOptimizer): Plan verileri ile oluşturulmuş optimizer.
+        n_samples (int): Ölçümde kullanılacak rastgele aday sayısı.
+
+    Returns:
+        float: Değerlendirme başına süre (saniye).
+    """
+    cands = [funcOpti.gen_rand_sol(optimizer.geoData, optimizer.xls, len(optimizer.contBeam))
+             for _ in range(n_samples)]
+
+    start = time.perf_counter()
+    for raw in cands: optimizer._process_candidate_pipeline(raw)
+    return (time.perf_counter() - start) / n_samples
+
+def tune_hyperparameters(context, budget_seconds=None, budget_evals=None, n_workers=1,
+                         pop_sizes=(10, 20, 40), restarts=(1, 2, 4),
+                         tune_frac=0.2, n_pilot_seeds=1, seed=0):
+    """
+    Verilen zaman veya değerlendirme bütçesi için pop_size, max_iter ve bağımsız koşum
+    (restart) sayısını seçer.
+
+    Bütçe değerlendirme sayısına çevrilir; her (pop_size, restarts) ikilisi için max_iter
+    bütçeden türetilir (restarts * pop_size * (max_iter + 1) = bütçe). Bütçenin tune_frac
+    kadarı pilot koşumlara ayrılır ve ayarlar arasında eşit bölünür: her ayar kendi
+    programının aynı oranı kadar (max_iter * pilot oranı) çalıştırılır. Koşumların amaç
+    değerleri kendi popülasyonlarına göre ölçeklendiği için tüm pilotların en iyi çözümleri
+    tek bir popülasyon kabul edilerek Lemonge ile yeniden puanlanır; ortalama puanı en iyi
+    olan ayar seçilir. Zaman bütçesinde, seçilen ayarın max_iter değeri pilotlarda ölçülen
+    gerçek değerlendirme hızı ve kalan süre ile yeniden hesaplanır.
+
+    Args:
+        context (dict): plastro.initialize_system ile üretilen statik veri paketi.
+        budget_seconds (float, optional): Toplam duvar saati bütçesi (saniye, ayar dahil).
+        budget_evals (int, optional): Toplam değerlendirme bütçesi (budget_seconds yoksa).
+        n_workers (int): Paralel koşum sayısı (zaman bütçesini değerlendirmeye çevirirken).
+        pop_sizes (tuple): Denenecek popülasyon büyüklükleri.
+        restarts (tuple): Denenecek bağımsız koşum sayıları.
+        tune_frac (float): Bütçenin pilot koşumlara ayrılan oranı.
+        n_pilot_seeds (int): Her ayar için pilot koşum (tohum) sayısı.
+        seed (int): Pilot tohumlarının başlangıç değeri.
+
+    Returns:
+        dict: {"pop_size", "max_iter", "num_runs", "sec_per_eval", "budget_evals", "pilots"}
+              pilots her ayar için (pop_size, restarts, max_iter, ortalama puan) içerir.
+    """
+    if budget_seconds is None and budget_evals is None:
+        raise ValueError("budget_seconds veya budget_evals verilmelidir.")
+
+    tune_start = time.perf_counter()
+    static = (context["geoData"], context["xls"], context["contBeam"], context["slabProp"],
+              context["fit_span"], context["fit_node"], context["repairMask"], context.get("problem"))
+    optimizer = optLoop.StructuralOptimizer(*static)
+
+    sec_per_eval = measure_eval_time(optimizer)
+    if budget_evals is None: budget_evals = int(budget_seconds / sec_per_eval * n_workers)
+
+    # 1. Bütçeye sığan ayarlar
+    configs = []
+    for pop_size in pop_sizes:
+        for n_runs in restarts:
+            max_iter = budget_evals // (n_runs * pop_size) - 1
+            if max_iter >= 1: configs.append((pop_size, n_runs, max_iter))
+    if not configs: raise ValueError(f"Bütçe ({budget_evals} değerlendirme) en küçük ayar için yetersiz.")
+
+    # 2. Pilot koşumlar: her ayarın en iyi çözümleri
+    pilot_frac  = tune_frac / (len(configs) * n_pilot_seeds)
+    pilot_bests = []
+    pilot_evals = 0
+    pilot_start = time.perf_counter()
+
+    for pop_size, n_runs, max_iter in configs:
+        pilot_iter = max(1, int(max_iter * pilot_frac))
+        for s in range(n_pilot_seeds):
+            best = None
+            for r in range(n_runs):
+                # Pilot tohumu çağıranın global RNG durumlarını bozmamalı (e-JAYA random
+                # modülünü de kullanır)
+                rng_state, py_state = np.random.get_state(), random.getstate()
+                np.random.seed(seed + 1000 * s + r)
+                random.seed(seed + 1000 * s + r)
+                pilot = optLoop.StructuralOptimizer(*static)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    pilot.run(pop_size=pop_size, max_iter=pilot_iter)
+                np.random.set_state(rng_state)
+                random.setstate(py_state)
+                pilot_evals += pop_size * (pilot_iter + 1)
+                member = min(pilot.pop, key=lambda p: p.obj)
+                if best is None or member.obj < best.obj: best = member
+            pilot_bests.append(best)
+
+    # 3. Tüm pilot çözümleri ortak Lemonge ölçeğinde puanlanır
+    scores = np.asarray(optimizer._calculate_lemonge_objectives(pilot_bests), dtype=float)
+    scores = scores.reshape(len(configs), n_pilot_seeds).mean(axis=1)
+
+    pop_size, n_runs, max_iter = configs[int(np.argmin(scores))]
+
+    # 4. Zaman bütçesi: gerçek hız ve kalan süre ile max_iter yeniden hesaplanır
+    if budget_seconds is not None:
+        sec_per_eval = (time.perf_counter() - pilot_start) / pilot_evals
+        remaining    = budget_seconds - (time.perf_counter() - tune_start)
+        budget_evals = max(0, int(remaining / sec_per_eval * n_workers))
+        max_iter     = max(1, budget_evals // (n_runs * pop_size) - 1)
+
+    return {
+        "pop_size": pop_size,
+        "max_iter": max_iter,
+        "num_runs": n_runs,
+        "sec_per_eval": sec_per_eval,
+        "budget_evals": budget_evals,
+        "pilots": [(p, r, m, float(sc)) for (p, r, m), sc in zip(configs, scores)]
+    }
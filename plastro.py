@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import os
 import sys
+import multiprocessing
+import random
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -17,8 +19,14 @@ import build_data_repair as buildRepMask
 import build_data_cont_lines as buildContLines
 import build_data_contBeam as buildContBeam
 import build_data_penalty as buildPenalty
+import build_data_greedy as buildGreedy
+import build_data_warm_start as buildWarm
+import build_data_problem as buildProblem
+import func_optimization as funcOpti
 import func_optimization_loop as optLoop
 import func_execution as execManager
+import func_tuning as funcTuning
+import func_cache as funcCache
 import draw_basic_geometry as drawGeo
 import draw_struct_members as drawMembers
 
@@ -35,7 +43,8 @@ def initialize_system(dxf_path, xls_path):
 
     Returns:
         dict: Optimizasyon için gerekli tüm statik verileri içeren sözlük.
-              (geoData, xls, contBeam, slabProp, fit_span, fit_node, repairMask, colSecProp, dxf)
+              (geoData, xls, contBeam, slabProp, fit_span, fit_node, repairMask, colSecProp, dxf,
+              problem, project_hash)
     """
     print("\n" + "="*60)
     print(f"{'PLASTRO: YAPISAL OPTİMİZASYON SİSTEMİ':^60}")
@@ -82,6 +91,10 @@ def initialize_system(dxf_path, xls_path):
     contBeam = misc.measure_exec_time("8b. CONT BEAMS", buildContBeam.build_contBeam,
         geoData, contLines, xls, repairMask, fit_span)
 
+    # 6. Problem Paketi (tüm koşumlarda paylaşılan sabitler)
+    problem = misc.measure_exec_time("9.  PROBLEM", buildProblem.build_data_problem,
+        geoData, xls, contBeam, fit_span, fit_node)
+
     # Tüm verileri bir paket halinde döndür
     return {
         "geoData": geoData,
@@ -92,10 +105,15 @@ def initialize_system(dxf_path, xls_path):
         "fit_span": fit_span,
         "fit_node": fit_node,
         "repairMask": repairMask,
-        "colSecProp": colSecProp
+        "colSecProp": colSecProp,
+        "problem": problem,
+        "project_hash": funcCache.project_hash(dxf_path, xls_path)
     }
 
-def optimization_task(seed, run_id, output_dir, pop_size, max_iter, **context):
+def optimization_task(seed, run_id, output_dir, pop_size, max_iter, greedy_seed=False,
+                      two_phase=False, size_iter=20, n_elite=3, axis_refine=0,
+                      dedup=False, state=None, return_state=False, diagnostics=0, warm_sols=None,
+                      eval_cache=None, **context):
     """
     Tek bir optimizasyon koşumunu (run) gerçekleştiren işçi fonksiyonu.
     
@@ -108,6 +126,27 @@ def optimization_task(seed, run_id, output_dir, pop_size, max_iter, **context):
         output_dir (str): Çıktıların kaydedileceği dizin.
         pop_size (int): Popülasyon büyüklüğü.
         max_iter (int): Maksimum iterasyon sayısı.
+        greedy_seed (bool): True ise build_data_greedy ile oluşturulan çözüm başlangıç
+                            popülasyonuna eklenir.
+        two_phase (bool): True ise önce topoloji (max_iter), sonra en iyi n_elite topoloji
+                          için kesit/yön/kaçıklık (size_iter) optimize edilir.
+        size_iter (int): İki aşamalı aramada kesit aşamasının iterasyon sayısı.
+        n_elite (int): İki aşamalı aramada kesit aşamasına aktarılan topoloji sayısı.
+        axis_refine (int): 0'dan büyükse optimizasyon sonunda (iki aşamalı aramada
+                           aşamalar arasında) aks bazlı iyileştirme yapılacak aks sayısı.
+                           return_state ile (ara racing basamakları) uygulanmaz.
+        dedup (bool): True ise daha önce değerlendirilmiş topolojilere onarılan adaylar
+                      değerlendirme öncesinde yeniden üretilir.
+        state (dict, optional): StructuralOptimizer.get_state ile alınmış durum. Verilirse
+                                arama bu durumdan max_iter iterasyon daha devam eder
+                                (racing). İki aşamalı arama ile kullanılamaz.
+        return_state (bool): True ise sonuç paketine optimizasyon durumu ("state") eklenir.
+        diagnostics (int): 0'dan büyükse her diagnostics iterasyonda bir ceza istatistikleri
+                           toplanır ve metrics["diagnostics"] altında döndürülür.
+        warm_sols (list, optional): Başlangıç popülasyonuna eklenecek, önceki plandan
+                                    aktarılmış tasarım vektörleri (build_data_warm_start).
+        eval_cache (str, optional): Verilirse değerlendirmeler bu SQLite dosyasında, proje
+                                    özetine (context["project_hash"]) göre önbelleklenir.
         **context: 'initialize_system' tarafından üretilen statik veri paketi
                    (geoData, xls, contBeam vb. anahtarları içerir).
 
@@ -130,19 +169,47 @@ def optimization_task(seed, run_id, output_dir, pop_size, max_iter, **context):
     # Not: run() metodu artık initial ve final penalty değerlerini de döndürüyor (Turn 2)
     optimizer = optLoop.StructuralOptimizer(
         geoData, xls, contBeam, slabProp, 
-        fit_span, fit_node, repairMask
+        fit_span, fit_node, repairMask, context.get("problem")
     )
+    optimizer.seed = seed
+    if eval_cache is not None:
+        optimizer.eval_cache = funcCache.EvaluationCache(eval_cache, context["project_hash"])
+    if two_phase and (state is not None or return_state):
+        raise ValueError("İki aşamalı arama kaldığı yerden devam ettirilemez (racing).")
+
+    seed_sols = list(warm_sols) if warm_sols else []
+    if greedy_seed and state is None:
+        seed_sols.append(buildGreedy.build_data_greedy(geoData, xls, contBeam, repairMask))
+
+    # e-JAYA Python random modülünü de kullanır; aynı tohum aynı tasarımları üretir (önbellek)
     np.random.seed(seed)
-    best_sol, best_obj, history, init_pen, final_pen = optimizer.run(pop_size=pop_size, max_iter=max_iter)
+    random.seed(int(seed))
+    if state is not None:
+        optimizer.set_state(state)
+
+    if two_phase:
+        best_sol, best_obj, history, init_pen, final_pen, telemetry = optimizer.run_two_phase(
+            pop_size=pop_size, topo_iter=max_iter, size_iter=size_iter,
+            n_elite=n_elite, seed_sols=seed_sols, axis_refine=axis_refine, dedup=dedup)
+    else:
+        best_sol, best_obj, history, init_pen, final_pen, telemetry = optimizer.run(
+            pop_size=pop_size, max_iter=max_iter, seed_sols=seed_sols, dedup=dedup,
+            resume=state is not None, diagnostics=diagnostics)
+        # Ara racing basamaklarında iyileştirme yapılmaz; yalnızca son basamakta uygulanır
+        if axis_refine > 0 and not return_state:
+            best_sol, best_obj, final_pen = optimizer.refine_axes(n_axes=axis_refine)
+
+    # Kompakt tasarım vektörü raporlama ve yapı verisi için ayrık biçime çevrilir
+    best_sol = funcOpti.decode_solution(best_sol, optimizer.limits)
+
+    cache_hit_rate = None
+    if optimizer.eval_cache is not None:
+        optimizer.eval_cache.close()
+        cache_hit_rate = optimizer.eval_cache.hit_rate()
 
     # 2. Detaylı Metrik Hesaplama
     # A. Penalty Detayları (Final ve Initial)
-    penalty_dict_final = {
-        "beam_length_viol": float(final_pen[0]),
-        "beam_dist_viol": float(final_pen[1]),
-        "col_dist_viol": float(final_pen[2]),
-        "beam_free_end_len": float(final_pen[3])
-    }
+    penalty_dict_final = {key: float(val) for key, val in zip(buildPenalty.PENALTY_KEYS, final_pen)}
     
     # B. Fitness Detayları
     fitness_vals = buildFit.build_data_fitness(best_sol, geoData, contBeam, fit_span, fit_node)
@@ -188,18 +255,26 @@ def optimization_task(seed, run_id, output_dir, pop_size, max_iter, **context):
     # 4. Sonuç Döndürme
     # Not: Initial penalty değerleri raporda kullanılmak üzere 'metrics' altına eklenebilir
     # veya ayrı bir anahtar olarak dönebilir, ancak standart yapı 'metrics' kullanır.
-    return {
+    result = {
         "best_sol": best_sol,
         "best_score": best_obj,
         "history": history,
+        "history_rescaled": optimizer.history_rescaled, # refine_axes ile ölçeği değişen history indeksleri
         "first_iter_sol": None, # İsteğe bağlı: optimize edilmiş ilk çözüm buraya eklenebilir
         "first_iter_score": None, # İsteğe bağlı
         "metrics": {
             "fitness": fitness_dict,
-            "penalty": penalty_dict_final
+            "penalty": penalty_dict_final,
+            "duplicate_rate": optimizer.visited.duplicate_rates(),
+            "cache_hit_rate": cache_hit_rate,
+            "telemetry": {"keys": optLoop.TELEMETRY_KEYS, "values": telemetry},
+            "diagnostics": {"keys": optLoop.DIAGNOSTIC_KEYS, "values": optimizer.diagnostics}
         },
         "visual_path": full_path
     }
+    if return_state: result["state"] = optimizer.get_state()
+
+    return result
 
 def visualize_final_result(results, context):
     """
@@ -266,12 +341,53 @@ if __name__ == "__main__":
         "batch_size": 10,
         "output_dir": "plastro_results",
         "pop_size": 30,
-        "max_iter": 1000
+        "max_iter": 1000,
+        "greedy_seed": False,    # Greedy çözümü başlangıç popülasyonuna ekle
+        "two_phase": False,      # Önce topoloji, sonra kesit optimizasyonu
+        "size_iter": 200,        # Kesit aşaması iterasyon sayısı (two_phase)
+        "n_elite": 3,            # Kesit aşamasına aktarılan topoloji sayısı (two_phase)
+        "axis_refine": 0,        # Aks bazlı iyileştirme yapılacak aks sayısı (0: kapalı)
+        "dedup": False,          # Tekrar eden topolojileri değerlendirmeden önce yeniden üret
+        "racing": False,         # Ardışık yarılama: zayıf koşumları erken ele (two_phase ile kullanılamaz)
+        "eta": 3,                # Racing modunda her basamakta kalan koşum oranı (1/eta)
+        "diagnostics": 0,        # N > 0: her N iterasyonda ceza istatistiklerini kaydet
+        "auto_tune": None,       # örn: {"budget_seconds": 3600} -> pop_size, max_iter, num_runs otomatik
+        "eval_cache": None,      # örn: "plastro_results/eval_cache.sqlite" -> koşumlar arası önbellek
+        "warm_start": None,      # örn: {"dxf": eski.dxf, "xls": eski.xlsx, "solution": history_*.json, "tol": 30}
+        "preview": False         # Optimizasyondan önce greedy çözümü göster
     }
 
     # 2. Sistemi Başlat (Statik Verileri Yükle)
     static_context = initialize_system(fileNameDXF, fileNameXLS)
 
+    # Önceki plandan sıcak başlangıç (mimari revizyon)
+    warm_sols = None
+    if CONFIG["warm_start"]:
+        warm = CONFIG["warm_start"]
+        old_context = initialize_system(warm["dxf"], warm["xls"])
+        warm_sol, matched = buildWarm.build_data_warm_start(
+            old_context["geoData"], old_context["contBeam"], buildWarm.load_warm_solution(warm["solution"]),
+            static_context["geoData"], static_context["xls"], static_context["contBeam"],
+            static_context["repairMask"], tol=warm.get("tol", 30.0))
+        warm_sols = [warm_sol]
+        print(f"Warm start eşleşme oranları: {matched}")
+
+    # Bütçeye göre pop_size, max_iter ve koşum sayısı ayarı (pilot koşumlar)
+    if CONFIG["auto_tune"]:
+        n_workers = max(1, int(multiprocessing.cpu_count() * 0.7)) if CONFIG["parallel"] else 1
+        tuned = funcTuning.tune_hyperparameters(static_context, n_workers=n_workers, **CONFIG["auto_tune"])
+        CONFIG.update(pop_size=tuned["pop_size"], max_iter=tuned["max_iter"], num_runs=tuned["num_runs"])
+        print(f"Auto-tune: pop_size={tuned['pop_size']}, max_iter={tuned['max_iter']}, "
+              f"num_runs={tuned['num_runs']} ({tuned['sec_per_eval']*1000:.2f} ms/eval)")
+
+    # Hızlı ön izleme (Greedy çözüm)
+    if CONFIG["preview"]:
+        preview_sol = buildGreedy.build_data_greedy(
+            static_context["geoData"], static_context["xls"],
+            static_context["contBeam"], static_context["repairMask"])
+        preview_sol = funcOpti.decode_solution(preview_sol, static_context["problem"]["limits"])
+        visualize_final_result({"best_solution_data": preview_sol}, static_context)
+
     # 3. Optimizasyonu Çalıştır
     # Not: static_context içindeki her şey kwargs olarak optimization_task'a gider
     final_results = execManager.run_optimization(
@@ -280,8 +396,19 @@ if __name__ == "__main__":
         parallel=CONFIG["parallel"],
         batch_size=CONFIG["batch_size"],
         output_dir=CONFIG["output_dir"],
+        racing=CONFIG["racing"],
+        eta=CONFIG["eta"],
+        diagnostics=CONFIG["diagnostics"],
+        warm_sols=warm_sols,
+        eval_cache=CONFIG["eval_cache"],
         pop_size=CONFIG["pop_size"],
         max_iter=CONFIG["max_iter"],
+        greedy_seed=CONFIG["greedy_seed"],
+        two_phase=CONFIG["two_phase"],
+        size_iter=CONFIG["size_iter"],
+        n_elite=CONFIG["n_elite"],
+        axis_refine=CONFIG["axis_refine"],
+        dedup=CONFIG["dedup"],
         **static_context 
     )
 